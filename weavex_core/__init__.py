@@ -10,12 +10,16 @@ from .storage import get_object_store
 from .state import get_sync_state
 
 # 4. Expose API Proxy Helper
-from .api import make_passthrough_call
+from .api import make_passthrough_call, make_passthrough_calls
 
 from .api_execution_facade import ApiExecutionFacade
 
 # 5. Expose Skill Executors
-from .execute_api import execute_api
+from .execute_api import execute_api, execute_api_async, execute_api_stream
+from .execute_api_many import execute_api_many, ApiRequest, ApiResult
+from .execute_api_paginated import execute_api_paginated, PaginationConfig
+from .execute_api_batched import MicroBatcher, BatchConfig
+from .circuit_breaker import get_circuit_breaker_states
 from .execute_dw import execute_dw_query, execute_dw_write, DWQueryResult, DWWriteResult
 from .llm import complete, complete_one_shot, LLMResponse
 # 5. Expose Structured Error
@@ -38,8 +42,19 @@ __all__ = [
     "get_object_store",
     "get_sync_state",
     "make_passthrough_call",
+    "make_passthrough_calls",
     "ApiExecutionFacade",
     "execute_api",
+    "execute_api_async",
+    "execute_api_stream",
+    "execute_api_many",
+    "ApiRequest",
+    "ApiResult",
+    "execute_api_paginated",
+    "PaginationConfig",
+    "MicroBatcher",
+    "BatchConfig",
+    "get_circuit_breaker_states",
     "execute_dw_query",
     "execute_dw_write",
     "DWQueryResult",
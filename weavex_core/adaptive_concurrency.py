@@ -0,0 +1,209 @@
+# weavex_core/adaptive_concurrency.py
+#
+# Adaptive (AIMD) concurrency limit per integration for execute_api fan-out.
+# Instead of hand-tuning `concurrency` per vendor, the limit is learned:
+#
+#   additive increase        +1 after a limit's worth of healthy calls, while the
+#                            limit is actually being used
+#   multiplicative decrease  × backoff_ratio on 429/503, timeouts and errors, or when
+#                            a window's p95 latency exceeds latency_tolerance × baseline.
+#                            execute_api_many counts every attempt, so a 429 that an
+#                            inner retry absorbed still cuts the limit
+#
+# Baseline is the lowest windowed p95 seen, allowed to creep up slowly so a
+# vendor that is permanently slower does not pin the limit at the floor.
+# After a cut, further cuts wait until the calls that were in flight at the time
+# have completed — one overload burst is one decrease, not forty.
+#
+# Limiters live for the rest of the process, so a second fan-out against the
+# same integration starts from the learned limit.
+#
+# Tuning (env):
+#   WEAVEX_ADAPTIVE_INITIAL_LIMIT  default 4
+#   WEAVEX_ADAPTIVE_MIN_LIMIT      default 1
+#   WEAVEX_ADAPTIVE_MAX_LIMIT      default 64
+#
+# Usage:
+#   for result in execute_api_many(context, integration_id, specs, concurrency="auto"):
+#       ...
+#
+#   limiter = get_adaptive_limiter(integration_id)        # custom fan-out
+#   limiter.acquire()
+#   ...call, measure...
+#   limiter.release(latency_seconds, overloaded=response.status_code in OVERLOAD_STATUSES)
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+
+OVERLOAD_STATUSES = (429, 503)
+
+
+@dataclass
+class AdaptiveLimitState:
+    integration_id: str
+    limit:          int
+    in_flight:      int
+    p95_ms:         Optional[float]      # last completed window
+    baseline_ms:    Optional[float]
+    increases:      int
+    decreases:      int
+
+
+class AdaptiveLimiter:
+    def __init__(
+            self,
+            integration_id:    str,
+            initial_limit:     int   = 4,
+            min_limit:         int   = 1,
+            max_limit:         int   = 64,
+            backoff_ratio:     float = 0.5,
+            latency_tolerance: float = 2.0,
+            window:            int   = 50
+    ):
+        self.integration_id    = integration_id
+        self.min_limit         = min_limit
+        self.max_limit         = max_limit
+        self.backoff_ratio     = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.window            = window
+        self._cond             = threading.Condition()
+        self._limit            = float(max(min_limit, min(max_limit, initial_limit)))
+        self._in_flight        = 0
+        self._samples          = []
+        self._successes        = 0
+        self._cooldown         = 0
+        self._p95              = None
+        self._baseline         = None
+        self._increases        = 0
+        self._decreases        = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            return True
+
+    def cancel(self) -> None:
+        """Returns a slot that was acquired but never used."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        with self._cond:
+            in_use           = self._in_flight
+            self._in_flight -= 1
+            # Checked before counting down, so the last call that was in flight
+            # at a cut is still covered by it.
+            cooling          = self._cooldown > 0
+            self._cooldown   = max(0, self._cooldown - 1)
+
+            if overloaded:
+                self._decrease(cooling)
+            else:
+                self._samples.append(latency)
+                if len(self._samples) >= self.window:
+                    self._close_window(cooling)
+                self._successes += 1
+                # Grow once per limit's worth of healthy calls, and only if the
+                # limit is the bottleneck — an idle limiter proves nothing.
+                if self._successes >= int(self._limit) and in_use >= int(self._limit) // 2:
+                    self._successes = 0
+                    if self._limit < self.max_limit:
+                        self._limit      = min(self.max_limit, self._limit + 1)
+                        self._increases += 1
+            self._cond.notify_all()
+
+    def state(self) -> AdaptiveLimitState:
+        with self._cond:
+            return AdaptiveLimitState(
+                integration_id = self.integration_id,
+                limit          = int(self._limit),
+                in_flight      = self._in_flight,
+                p95_ms         = self._p95 * 1000 if self._p95 is not None else None,
+                baseline_ms    = self._baseline * 1000 if self._baseline is not None else None,
+                increases      = self._increases,
+                decreases      = self._decreases
+            )
+
+    def _close_window(self, cooling: bool) -> None:
+        samples       = sorted(self._samples)
+        self._samples = []
+        self._p95     = samples[int(len(samples) * 0.95) - 1]
+        if self._baseline is None or self._p95 < self._baseline:
+            self._baseline = self._p95
+        elif self._p95 > self._baseline * self.latency_tolerance:
+            self._decrease(cooling)
+        else:
+            self._baseline *= 1.02
+
+    def _decrease(self, cooling: bool) -> None:
+        if cooling:
+            return
+        self._limit     = max(self.min_limit, self._limit * self.backoff_ratio)
+        self._cooldown  = self._in_flight
+        self._successes = 0
+        self._decreases += 1
+
+    def _reset_after_fork(self) -> None:
+        self._cond      = threading.Condition()
+        self._in_flight = 0
+
+
+# ── Registry ──────────────────────────────────────────────────────────────────
+
+class _LimiterRegistry:
+    def __init__(self):
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+        self._lock:     threading.Lock             = threading.Lock()
+
+    def get(self, integration_id: str) -> AdaptiveLimiter:
+        with self._lock:
+            limiter = self._limiters.get(integration_id)
+            if limiter is None:
+                limiter = self._limiters[integration_id] = AdaptiveLimiter(
+                    integration_id,
+                    initial_limit = int(os.environ.get("WEAVEX_ADAPTIVE_INITIAL_LIMIT", 4)),
+                    min_limit     = int(os.environ.get("WEAVEX_ADAPTIVE_MIN_LIMIT", 1)),
+                    max_limit     = int(os.environ.get("WEAVEX_ADAPTIVE_MAX_LIMIT", 64))
+                )
+            return limiter
+
+    def states(self) -> list[AdaptiveLimitState]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return [limiter.state() for limiter in limiters]
+
+    def _reset_after_fork(self) -> None:
+        # Learned limits are worth keeping; in-flight counts belong to the parent.
+        self._lock = threading.Lock()
+        for limiter in self._limiters.values():
+            limiter._reset_after_fork()
+
+
+_registry = _LimiterRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry._reset_after_fork)
+
+
+def get_adaptive_limiter(integration_id: str) -> AdaptiveLimiter:
+    return _registry.get(integration_id)
+
+
+def get_adaptive_concurrency_stats() -> list[AdaptiveLimitState]:
+    return _registry.states()
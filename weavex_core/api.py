@@ -1,16 +1,96 @@
-import json
-import requests
+import os
+import time
+import logging
+import threading
 from dataclasses import dataclass
-from typing import Optional, Any, Dict
-from .execute_api import ApiResponse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Callable, Dict, Iterable, List, Union
+
+import requests
+import urllib3
+
+from .execute_api import ApiResponse, RetryConfig, DEFAULT_RETRY, _RetryPlan
+from .execute_api_many import ApiRequest, _coerce_request
+from .json_codec import dumps, dumps_bytes, loads
+from .http_pool import get_control_plane_session
+
+# Points every passthrough call at another proxy, e.g. the local stand-in in
+# weavex_core/benchmarks/mock_proxy.py: WEAVEX_PASSTHROUGH_URL=http://127.0.0.1:8765/v1.0/weavex.passthrough
+PASSTHROUGH_URL_ENV = "WEAVEX_PASSTHROUGH_URL"
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Requests per batch envelope; larger lists are split across several envelopes.
+PASSTHROUGH_BATCH_SIZE = _env_int("WEAVEX_PASSTHROUGH_BATCH_SIZE", 50)
+
+# Body reads go through urllib3 directly (see _post_proxy), so its errors are caught too
+_TIMEOUT_ERRORS = (requests.Timeout, urllib3.exceptions.TimeoutError)
+_NETWORK_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError)
+
+logger = logging.getLogger(__name__)
+
+_UNDECODED = object()
+
+# Guards the first decode of a lazy VendorResponse body. Module-wide rather than
+# per response so instances stay plain dataclasses (copyable, picklable).
+_decode_lock = threading.Lock()
+
 
 @dataclass
 class VendorResponse:
-    actual_resp: str
+    """
+    A vendor response unwrapped from the proxy envelope.
+
+    body is parsed JSON if possible, else the raw string. A response built by
+    the proxy path holds only the proxy's body string until body is first read;
+    it is then decoded, cached and the string released. actual_resp (the proxy's
+    raw reply) is None unless the call was made with keep_raw=True.
+    """
+    actual_resp: Any
     status_code: int
     body: Any  # Automatically parsed JSON if possible, else raw string
     headers: Dict[str, str]
 
+    @classmethod
+    def _lazy(cls, actual_resp: Any, status_code: int, encoded_body: Any, headers: Dict[str, str]) -> "VendorResponse":
+        response = cls(actual_resp, status_code, _UNDECODED, headers)
+        response._encoded = encoded_body
+        return response
+
+    def _get_body(self) -> Any:
+        if self._body is _UNDECODED:
+            with _decode_lock:
+                # A thread that waited here finds the body already decoded
+                if self._body is _UNDECODED:
+                    # Hands the string over without a second reference, so _decode_body can drop it mid-way
+                    encoded, self._encoded = self._encoded, None
+                    self._body = _decode_body(encoded)
+        return self._body
+
+    def _set_body(self, value: Any) -> None:
+        with _decode_lock:
+            self._body = value
+            self._encoded = None
+
+
+# body stays a regular dataclass field (init, repr, eq, asdict, replace all see
+# it); the property installed over it stores it in _body, next to the undecoded
+# _encoded string, and decodes on first read.
+VendorResponse.body = property(VendorResponse._get_body, VendorResponse._set_body)
+
+
 def make_passthrough_call(
         context: dict,
         integration_id: str,
@@ -19,14 +99,50 @@ def make_passthrough_call(
         body: Optional[dict] = None,
         content_type: str = None,
         headers: Optional[dict] = None,
-        app_base_url: str = None
+        app_base_url: str = None,
+        keep_raw: bool = False,
+        timeout: float = 30,
+        retry: RetryConfig = DEFAULT_RETRY
 ) -> VendorResponse:
     """
     Makes an authenticated call via the Knit API Proxy.
     Handles nested JSON string decoding for backward compatibility.
+    The body is decoded when first read; pass keep_raw=True to also keep the
+    proxy's raw reply bytes on actual_resp.
+
+    timeout and retry work as for execute_api: timeouts, network errors and
+    retry.retry_on statuses are retried with the same backoff, Retry-After,
+    deadline (retry.deadline_seconds / context["deadline"]) and retry budget
+    rules. RuntimeError when every attempt failed without a response.
     """
 
-    # 1. Strict Validation of Context
+    # 1. Strict Validation of Context + 2. Setup Request
+    base_url, final_headers = _proxy_config(context, integration_id)
+
+    payload = {
+        "context": context,
+        **_proxied_request(method, path, body, content_type, headers, app_base_url)
+    }
+
+    # 3. Network Call + 4. Extract Status & Unwrap Body
+    def _reply(status_code: int, resp_content: bytes) -> VendorResponse:
+        try:
+            proxy_data = loads(resp_content)
+            return _unwrap(proxy_data, status_code, resp_content if keep_raw else None)
+        except Exception:
+            # Fallback to raw text if JSON parsing fails entirely
+            return VendorResponse(
+                actual_resp=resp_content if keep_raw else None,
+                status_code=status_code,
+                body=resp_content.decode("utf-8", errors="replace"),
+                headers={}
+            )
+
+    return _call_proxy(context, base_url, dumps_bytes(payload), final_headers, timeout, retry, _reply)
+
+
+def _proxy_config(context: dict, integration_id: str) -> tuple:
+    """Validates the context and returns (proxy URL, proxy headers)."""
     if not isinstance(context, dict):
         raise ValueError("The 'context' parameter must be a dictionary.")
 
@@ -38,86 +154,310 @@ def make_passthrough_call(
     if not api_key or not execution_id:
         raise ValueError("Missing 'knit_api_key' or 'execution_id' in context.")
 
-    if not execution_id:
-        raise ValueError("Missing 'execution_id' in context. Tracing is required.")
-
-    # 2. Setup Request
-    if knit_env == "sandbox":
+    if os.environ.get(PASSTHROUGH_URL_ENV):
+        base_url = os.environ[PASSTHROUGH_URL_ENV].rstrip("/")
+    elif knit_env == "sandbox":
         base_url = "https://api.sandbox.getknit.dev/v1.0/weavex.passthrough"
     elif region == "eu":
         base_url = "https://api.eu.getknit.dev/v1.0/weavex.passthrough"
     else:
         base_url = "https://api.getknit.dev/v1.0/weavex.passthrough"
 
-    final_headers = {
+    proxy_headers = {
         "Authorization": f"Bearer {api_key}",
         "X-Knit-Integration-Id": integration_id,
         "X-Knit-Execution-Id": execution_id, # Propagation for tracing
         "Content-Type": "application/json"
     }
+    return base_url, proxy_headers
 
-    payload = {
-        "context": context,
+
+def _call_proxy(
+        context: Any,
+        url: str,
+        content: bytes,
+        proxy_headers: dict,
+        timeout: float,
+        retry: RetryConfig,
+        reply: Callable[[int, bytes], Any]
+) -> Any:
+    """
+    POSTs one envelope under execute_api's retry rules. reply() turns (status,
+    bytes) into a result with status_code / headers, which decides retries.
+    """
+    plan = _RetryPlan(context, retry)
+    attempt = 0
+    last_error = None
+
+    while attempt <= retry.max_retries:
+        attempt_timeout = plan.attempt_timeout(timeout)
+        if attempt_timeout is None:
+            last_error = f"deadline exceeded ({last_error or 'no attempt made'})"
+            break
+
+        try:
+            result = reply(*_post_proxy(url, content, proxy_headers, attempt_timeout))
+        except _TIMEOUT_ERRORS:
+            last_error = f"Request timed out after {attempt_timeout:g}s"
+            logger.warning("PROXY TIMEOUT attempt=%d url=%s", attempt + 1, url)
+        except _NETWORK_ERRORS as e:
+            last_error = f"Network error: {e}"
+            logger.warning("PROXY NETWORK ERROR attempt=%d url=%s error=%s", attempt + 1, url, e)
+        else:
+            wait = plan.wait_for(result, attempt)
+            if wait is None:
+                return result
+            logger.info("PROXY RETRY %d attempt=%d url=%s wait=%.2fs", result.status_code, attempt + 1, url, wait)
+            time.sleep(wait)
+            attempt += 1
+            continue
+
+        attempt += 1
+        wait = plan.backoff(attempt)
+        if wait is None:
+            break
+        time.sleep(wait)
+
+    raise RuntimeError(f"Proxy Network Connection Error: {last_error}")
+
+
+def _post_proxy(url: str, content: bytes, proxy_headers: dict, timeout: float) -> tuple:
+    """
+    POSTs one envelope and returns (status, reply bytes). The reply is read in a
+    single piece — Response.content joins 10 KB chunks, briefly holding every
+    large reply twice. The connection goes back to the pool once fully read.
+    """
+    session = get_control_plane_session()
+    with session.post(url, data=content, headers=proxy_headers, timeout=timeout, stream=True) as resp:
+        return resp.status_code, resp.raw.read(decode_content=True)
+
+
+def _proxied_request(method, path, body, content_type, headers, app_base_url) -> dict:
+    """The per-request part of the proxy payload — shared by single and batch calls."""
+    request = {
         "method": method.upper(),
         "path": path,
-        "body": json.dumps(body) if body else None,
+        "body": dumps(body) if body else None,
         "contentType": content_type if content_type else "application/json",
         "headers": headers if headers else {"Accept": "application/json"}
     }
-    
     if app_base_url:
-        payload["baseUrl"] = app_base_url
+        request["baseUrl"] = app_base_url
+    return request
 
-    # 3. Network Call
-    try:
-        resp = requests.post(base_url, json=payload, headers=final_headers)
-        resp_content = resp.content
-    except Exception as e:
-        raise RuntimeError(f"Proxy Network Connection Error: {e}")
 
-    # 4. Extract Status & Unwrap Body
-    final_status = resp.status_code
-    final_body = None
-    final_headers = {}
+def _unwrap(proxy_data: dict, status_code: int, actual_resp) -> VendorResponse:
+    """Turns one proxy envelope ({"success", "data": {"response"}, "error"}) into a VendorResponse."""
+    # Check for proxy-level success
+    if not proxy_data.get("success", False):
+        error_info = proxy_data.get("error", {})
+        final_body = error_info.get("msg", "Unknown error from proxy")
+        return VendorResponse(actual_resp=actual_resp, status_code=status_code, body=final_body, headers={})
+
+    # Navigate to the inner response; the body itself is decoded on first access
+    response_wrapper = proxy_data.get("data", {}).get("response", {})
+    final_headers = response_wrapper.get("headers", {})
+    raw_body = response_wrapper.get("body", "{}")
+    return VendorResponse._lazy(actual_resp, status_code, raw_body, final_headers)
+
 
+def _decode_body(raw_body: Any) -> Any:
+    """
+    Decodes the proxy's body string: usually one JSON document, sometimes a JSON
+    string that holds another (double-encoded). The input string is released
+    before the second parse, so at most two stages are alive at once.
+    """
+    # --- RECURSIVE DECODING LOGIC ---
+    # This handles the "Double-Encoding" shown in your logs
+    if not isinstance(raw_body, str):
+        return raw_body
     try:
-        proxy_data = resp.json()
-
-        # Check for proxy-level success
-        if not proxy_data.get("success", False):
-            error_info = proxy_data.get("error", {})
-            final_body = error_info.get("msg", "Unknown error from proxy")
-            return VendorResponse(actual_resp=resp_content, status_code=final_status, body=final_body, headers={})
-
-        # Navigate to the inner response
-        response_wrapper = proxy_data.get("data", {}).get("response", {})
-        final_headers = response_wrapper.get("headers", {})
-        raw_body = response_wrapper.get("body", "{}")
-
-        # --- RECURSIVE DECODING LOGIC ---
-        # This handles the "Double-Encoding" shown in your logs
-        if isinstance(raw_body, str):
-            try:
-                # First pass: Converts escaped string to clean string or dict
-                decoded = json.loads(raw_body)
-                # Second pass: If it's still a string, decode it again into a dict
-                if isinstance(decoded, str):
-                    try:
-                        final_body = json.loads(decoded)
-                    except (json.JSONDecodeError, TypeError):
-                        final_body = decoded
-                else:
-                    final_body = decoded
-            except (json.JSONDecodeError, TypeError):
-                final_body = raw_body
-        else:
-            final_body = raw_body
+        # First pass: Converts escaped string to clean string or dict
+        decoded = loads(raw_body)
+    except (ValueError, TypeError):
+        return raw_body
+    if not isinstance(decoded, str):
+        return decoded
+    # Second pass: If it's still a string, decode it again into a dict
+    raw_body = None
+    try:
+        return loads(decoded)
+    except (ValueError, TypeError):
+        return decoded
+
+
+# ── Batched passthrough ───────────────────────────────────────────────────────
+#
+# Proxies that expose {base}.batch take many requests in one envelope:
+#
+#   POST .../weavex.passthrough.batch
+#   {"context": {...}, "requests": [{"method", "path", "body", "contentType", "headers", "baseUrl"?}, ...]}
+#
+#   → {"success": true, "data": {"responses": [
+#         {"statusCode": 200, "success": true, "data": {"response": {"headers": {...}, "body": "..."}}},
+#         {"statusCode": 502, "success": false, "error": {"msg": "..."}},
+#     ]}}
+#
+# Each entry is the single-call envelope plus its own statusCode.
+#
+# A proxy without a batch endpoint answers 404 / 405 / 501: that is remembered
+# for WEAVEX_PASSTHROUGH_BATCH_UNSUPPORTED_TTL seconds (default 300) and the
+# requests go out as concurrent single calls instead, with no envelope tried
+# first until it expires.
+#
+# Any other envelope failure (an error status once retries are spent, or a
+# rejected envelope) is returned as every request's answer; nothing is re-sent.
+# Only an entry that the proxy answered on its own with a retry.retry_on status
+# is re-sent alone.
+
+_BATCH_UNSUPPORTED_STATUSES = (404, 405, 501)
+
+PASSTHROUGH_BATCH_UNSUPPORTED_TTL = _env_float("WEAVEX_PASSTHROUGH_BATCH_UNSUPPORTED_TTL", 300)
+
+_batch_unsupported: Dict[str, float] = {}   # batch URL → time.monotonic() it expires at
+_batch_lock = threading.Lock()
+
+
+def _batch_known_unsupported(batch_url: str) -> bool:
+    with _batch_lock:
+        expires_at = _batch_unsupported.get(batch_url)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del _batch_unsupported[batch_url]
+            return False
+        return True
+
+
+def make_passthrough_calls(
+        context: dict,
+        integration_id: str,
+        calls: Iterable[Union[ApiRequest, dict]],
+        app_base_url: str = None,
+        concurrency: int = 8,
+        keep_raw: bool = False,
+        timeout: float = 30,
+        retry: RetryConfig = DEFAULT_RETRY
+) -> List[VendorResponse]:
+    """
+    Sends many requests through the Knit proxy, PASSTHROUGH_BATCH_SIZE per envelope.
+    calls are ApiRequest objects or dicts with the same fields. Returns one
+    VendorResponse per call, in input order; a network error raises
+    RuntimeError exactly as make_passthrough_call does. With keep_raw=True each
+    batched response keeps its own envelope entry on actual_resp.
+
+    timeout and retry apply to each envelope as a whole and to every single-call
+    fallback; an ApiRequest's own timeout / retry take precedence for its call.
+    A call whose own batched answer is a retry.retry_on status is re-sent alone;
+    a failed envelope is returned as the answer of every call in it.
+    """
+    base_url, proxy_headers = _proxy_config(context, integration_id)
+    calls = [_coerce_request(c) for c in calls]
+    if not calls:
+        return []
+
+    batch_url = f"{base_url}.batch"
+    chunks = [
+        range(start, min(start + PASSTHROUGH_BATCH_SIZE, len(calls)))
+        for start in range(0, len(calls), PASSTHROUGH_BATCH_SIZE)
+    ]
+    results: List[Optional[VendorResponse]] = [None] * len(calls)
+
+    def _send_chunk(indices: range) -> None:
+        if _batch_known_unsupported(batch_url):
+            return
+        reply = _post_batch(
+            context, batch_url, proxy_headers, [calls[i] for i in indices], app_base_url, keep_raw, timeout, retry
+        )
+        if reply is None:
+            return      # no batch endpoint — every call goes out alone
+        responses, per_call = reply
+        for index, response in zip(indices, responses):
+            call_retry = calls[index].retry or retry
+            if per_call and call_retry.max_retries and response.status_code in call_retry.retry_on:
+                continue    # retried on its own, with backoff, by the single-call path
+            results[index] = response
 
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(calls)))) as pool:
+        # Envelopes first; whatever they could not answer falls back to single calls.
+        list(pool.map(_send_chunk, chunks))
+        missing = [i for i, response in enumerate(results) if response is None]
+        singles = pool.map(lambda i: make_passthrough_call(
+            context        = context,
+            integration_id = integration_id,
+            method         = calls[i].method,
+            path           = calls[i].path,
+            body           = calls[i].body,
+            content_type   = calls[i].content_type,
+            headers        = calls[i].headers,
+            app_base_url   = app_base_url,
+            keep_raw       = keep_raw,
+            timeout        = calls[i].timeout or timeout,
+            retry          = calls[i].retry or retry,
+        ), missing)
+        for index, response in zip(missing, singles):
+            results[index] = response
+
+    return results
+
+
+def _post_batch(
+        context: dict,
+        batch_url: str,
+        proxy_headers: dict,
+        batch: list,
+        app_base_url: Optional[str],
+        keep_raw: bool,
+        timeout: float,
+        retry: RetryConfig
+) -> Optional[tuple]:
+    """
+    One envelope round trip. Returns (responses, per_call) — per_call is False when
+    every response is the envelope's own failure — or None when the proxy has no
+    batch endpoint.
+    """
+    payload = {
+        "context": context,
+        "requests": [
+            _proxied_request(r.method, r.path, r.body, r.content_type, r.headers, app_base_url)
+            for r in batch
+        ]
+    }
+
+    def _reply(status_code: int, resp_content: bytes) -> ApiResponse:
+        # The envelope's own status decides retries; the per-request answers ride in body
+        return ApiResponse(status_code, _split_batch(status_code, resp_content, len(batch), keep_raw), {})
+
+    reply = _call_proxy(context, batch_url, dumps_bytes(payload), proxy_headers, timeout, retry, _reply)
+    if reply.status_code in _BATCH_UNSUPPORTED_STATUSES:
+        with _batch_lock:
+            _batch_unsupported[batch_url] = time.monotonic() + PASSTHROUGH_BATCH_UNSUPPORTED_TTL
+        return None
+    return reply.body
+
+
+def _split_batch(status_code: int, resp_content: bytes, size: int, keep_raw: bool) -> tuple:
+    if status_code in _BATCH_UNSUPPORTED_STATUSES:
+        return [], False
+
+    try:
+        proxy_data = loads(resp_content)
     except Exception:
-        # Fallback to raw text if JSON parsing fails entirely
-        final_body = resp.text
+        raw = resp_content if keep_raw else None
+        text = resp_content.decode("utf-8", errors="replace")
+        return [VendorResponse(actual_resp=raw, status_code=status_code, body=text, headers={}) for _ in range(size)], False
+
+    if not proxy_data.get("success", False):
+        # Envelope rejected as a whole (bad key, quota, ...) — every request gets that answer
+        return [_unwrap(proxy_data, status_code, resp_content if keep_raw else None) for _ in range(size)], False
+
+    entries = proxy_data.get("data", {}).get("responses") or []
+    # A short list leaves the tail to the single-call fallback
+    return [
+        _unwrap(entry, entry.get("statusCode", status_code), dumps_bytes(entry) if keep_raw else None)
+        for entry in entries[:size]
+    ], True
 
-    return VendorResponse(actual_resp=resp.content, status_code=final_status, body=final_body, headers=final_headers)
 
 def make_passthrough_call_normalised(
         context: dict,
@@ -127,7 +467,9 @@ def make_passthrough_call_normalised(
         body: Optional[dict] = None,
         content_type: str = None,
         headers: Optional[dict] = None,
-        app_base_url: str = None
+        app_base_url: str = None,
+        timeout: float = 30,
+        retry: RetryConfig = DEFAULT_RETRY
 ) -> ApiResponse:
     result = make_passthrough_call(
         context        = context,
@@ -138,6 +480,8 @@ def make_passthrough_call_normalised(
         content_type   = content_type,
         headers        = headers,
         app_base_url   = app_base_url,
+        timeout        = timeout,
+        retry          = retry,
     )
     return ApiResponse(
         status_code = result.status_code,
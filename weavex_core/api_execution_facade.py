@@ -18,10 +18,15 @@
 #       path           = "/v1/employees/all",
 #   )
 #   employees = result.body.get("employees", [])
+#
+#   # asyncio callers
+#   result = await ApiExecutionFacade.execute_async(context=context, integration_id=integration_id,
+#                                                   method="GET", path="/v1/employees/all")
 
+import asyncio
 from typing import Optional, Any
 
-from .execute_api import execute_api, ApiResponse, RetryConfig, DEFAULT_RETRY
+from .execute_api import execute_api, execute_api_async, ApiResponse, RetryConfig, DEFAULT_RETRY
 from .api import make_passthrough_call_normalised
 
 SKILL_INTEGRATION_PREFIX = "wvx_sk_"
@@ -45,6 +50,7 @@ class ApiExecutionFacade:
             app_base_url:   Optional[str]  = None,
             timeout:        int            = 30,
             retry:          RetryConfig    = DEFAULT_RETRY,
+            cache:          bool           = False,
     ) -> ApiResponse:
         """
         Unified entry point for all API execution.
@@ -61,8 +67,10 @@ class ApiExecutionFacade:
             headers:        Additional headers
             content_type:   Content-Type (default: application/json)
             app_base_url:   Optional base URL override (Knit passthrough only)
-            timeout:        Request timeout in seconds
-            retry:          Retry configuration
+            timeout:        Request timeout in seconds (both routes)
+            retry:          Retry configuration (both routes)
+            cache:          Revalidate GET/HEAD against the conditional response cache
+                            (skill executor only)
 
         Returns:
             ApiResponse with status_code, body, headers
@@ -78,6 +86,7 @@ class ApiExecutionFacade:
                 content_type   = content_type,
                 timeout        = timeout,
                 retry          = retry,
+                cache          = cache,
             )
         else:
             return ApiExecutionFacade._execute_knit(
@@ -89,6 +98,54 @@ class ApiExecutionFacade:
                 headers        = headers,
                 content_type   = content_type,
                 app_base_url   = app_base_url,
+                timeout        = timeout,
+                retry          = retry,
+            )
+
+    @staticmethod
+    async def execute_async(
+            context:        Any,
+            integration_id: str,
+            method:         str,
+            path:           str,
+            body:           Optional[dict] = None,
+            headers:        Optional[dict] = None,
+            content_type:   str            = "application/json",
+            app_base_url:   Optional[str]  = None,
+            timeout:        int            = 30,
+            retry:          RetryConfig    = DEFAULT_RETRY,
+            cache:          bool           = False,
+    ) -> ApiResponse:
+        """
+        asyncio variant of execute(). Skill integrations run natively on
+        execute_api_async; Knit passthrough calls run in a worker thread.
+        """
+        if ApiExecutionFacade._is_skill(integration_id):
+            return await execute_api_async(
+                context        = context,
+                integration_id = integration_id,
+                method         = method,
+                path           = path,
+                body           = body,
+                headers        = headers,
+                content_type   = content_type,
+                timeout        = timeout,
+                retry          = retry,
+                cache          = cache,
+            )
+        else:
+            return await asyncio.to_thread(
+                ApiExecutionFacade._execute_knit,
+                context        = context,
+                integration_id = integration_id,
+                method         = method,
+                path           = path,
+                body           = body,
+                headers        = headers,
+                content_type   = content_type,
+                app_base_url   = app_base_url,
+                timeout        = timeout,
+                retry          = retry,
             )
 
     @staticmethod
@@ -102,6 +159,7 @@ class ApiExecutionFacade:
             content_type:   str,
             timeout:        int,
             retry:          RetryConfig,
+            cache:          bool,
     ) -> ApiResponse:
         return execute_api(
             context        = context,
@@ -113,6 +171,7 @@ class ApiExecutionFacade:
             content_type   = content_type,
             timeout        = timeout,
             retry          = retry,
+            cache          = cache,
         )
 
     @staticmethod
@@ -125,6 +184,8 @@ class ApiExecutionFacade:
             headers:        Optional[dict],
             content_type:   str,
             app_base_url:   Optional[str],
+            timeout:        int,
+            retry:          RetryConfig,
     ) -> ApiResponse:
         return make_passthrough_call_normalised(
             context        = context,
@@ -135,4 +196,6 @@ class ApiExecutionFacade:
             content_type   = content_type,
             headers        = headers,
             app_base_url   = app_base_url,
+            timeout        = timeout,
+            retry          = retry,
         )
\ No newline at end of file
@@ -0,0 +1,10 @@
+# weavex_core/benchmarks/__init__.py
+#
+# Standalone benchmarks for weavex_core hot paths. Not imported by the package;
+# run each module directly, e.g.:
+#   python -m weavex_core.benchmarks.bench_tracing
+#
+# mock_vendor.py is not a benchmark: it holds the local vendor / vault stand-ins
+# bench_load.py runs against, for reuse in ad-hoc experiments; mock_proxy.py
+# stands in for the Knit passthrough proxy in the same way. The test suite's
+# conftest.py imports both, so they must keep working without a benchmark run.
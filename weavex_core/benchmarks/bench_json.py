@@ -0,0 +1,121 @@
+# weavex_core/benchmarks/bench_json.py
+#
+# json_codec vs stdlib json on payloads shaped like weavex_core's hot paths:
+#
+#   vendor_response   5k HRIS employee records            _parse_body (loads)
+#   dw_write          20k warehouse rows                  _call_bridge payload (dumps_bytes)
+#   passthrough       double-encoded proxy envelope       make_passthrough_call (loads ×2)
+#   log_payload       API log entry with nested payloads  logging_utils (dumps, default=str)
+#
+# Also checks that canonical_dumps() is byte-identical to the serialisation
+# create_sync_hash always used.
+#
+# Usage:
+#   python -m weavex_core.benchmarks.bench_json [repeat]
+
+import sys
+import json
+import time
+import hashlib
+import datetime
+
+from weavex_core import json_codec
+
+
+def _employee(i: int) -> dict:
+    return {
+        "id":          f"EMP{i:06d}",
+        "firstName":   "Jane",
+        "lastName":    f"Doe-{i}",
+        "workEmail":   f"jane.doe{i}@company.com",
+        "department":  {"id": i % 40, "name": "Engineering", "costCenter": "CC-1042"},
+        "location":    {"city": "Zürich", "country": "CH", "remote": i % 3 == 0},
+        "salary":      95000.5 + i,
+        "hireDate":    "2021-03-15",
+        "customFields": [{"key": f"cf_{k}", "value": f"value-{k}-{i}"} for k in range(8)],
+        "manager":     None if i % 50 == 0 else f"EMP{i // 50:06d}",
+    }
+
+
+def _row(i: int) -> dict:
+    return {
+        "employee_id":  f"EMP{i:06d}",
+        "full_name":    f"Jane Doe {i}",
+        "email":        f"jane.doe{i}@company.com",
+        "department":   "Engineering",
+        "salary":       95000.5 + i,
+        "active":       i % 7 != 0,
+        "hired_at":     "2021-03-15T09:00:00Z",
+        "tags":         ["hris", "sync", str(i % 13)],
+    }
+
+
+def _payloads() -> dict:
+    employees = [_employee(i) for i in range(5000)]
+    inner     = json.dumps({"employees": employees[:1000]})
+    return {
+        "vendor_response": json.dumps({"employees": employees}).encode(),
+        "dw_write":        {"context": {"execution_id": "x"}, "table": "hr.employees", "mode": "append",
+                            "rows": [_row(i) for i in range(20000)]},
+        "passthrough":     json.dumps({"success": True, "data": {"response": {"headers": {}, "body": json.dumps(inner)}}}).encode(),
+        "log_payload":     {"log_table": "API", "method": "GET", "status_code": 200, "timestamp": datetime.datetime.now(),
+                            "request_payload": {"filters": {"status": "Active"}},
+                            "response_payload": {"employees": employees[:200]}},
+    }
+
+
+def _legacy(name: str, payload):
+    if name == "vendor_response":
+        return json.loads(payload)
+    if name == "dw_write":
+        return json.dumps(payload).encode("utf-8")
+    if name == "passthrough":
+        body = json.loads(payload)["data"]["response"]["body"]
+        return json.loads(json.loads(body))
+    return json.dumps(payload, default=str)
+
+
+def _codec(name: str, payload):
+    if name == "vendor_response":
+        return json_codec.loads(payload)
+    if name == "dw_write":
+        return json_codec.dumps_bytes(payload)
+    if name == "passthrough":
+        body = json_codec.loads(payload)["data"]["response"]["body"]
+        return json_codec.loads(json_codec.loads(body))
+    return json_codec.dumps(payload, default=str)
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def check_canonical() -> bool:
+    samples = [_employee(i) for i in range(200)] + [{"when": datetime.date(2024, 1, 2), "ü": "é", "n": 1e21}]
+    for obj in samples:
+        legacy = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str, ensure_ascii=True)
+        if hashlib.sha256(legacy.encode()).digest() != hashlib.sha256(json_codec.canonical_dumps(obj).encode()).digest():
+            return False
+    return True
+
+
+def run_benchmark(repeat: int = 5) -> dict:
+    results = {}
+    for name, payload in _payloads().items():
+        legacy = _best_of(lambda: _legacy(name, payload), repeat)
+        codec  = _best_of(lambda: _codec(name, payload), repeat)
+        results[name] = (legacy, codec)
+    return results
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"json_codec backend: {json_codec.BACKEND}   (best of {repeat})")
+    for name, (legacy, codec) in run_benchmark(repeat).items():
+        print(f"  {name:<16} stdlib {legacy:8.2f} ms   codec {codec:8.2f} ms   {legacy / codec:5.1f}x")
+    print(f"  canonical_dumps byte-identical to create_sync_hash serialisation: {check_canonical()}")
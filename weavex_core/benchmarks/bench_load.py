@@ -0,0 +1,242 @@
+# weavex_core/benchmarks/bench_load.py
+#
+# Throughput and tail latency of execute_api under concurrent load, against the
+# local stand-ins in mock_vendor.py — no network, repeatable on a laptop.
+#
+# Scenarios (vendor behaviour):
+#   baseline      20 ms ± 10 ms, 1% of calls at 250 ms
+#   rate_limited  baseline + 10% 429 with Retry-After: 0.05
+#   token_expiry  baseline + access tokens expire every second (401 → refresh)
+#   error_bursts  baseline + 200 ms of 503s every 2 s
+#   large_bodies  baseline with ~600 KB JSON responses
+#
+# Entry points:
+#   execute_api   worker threads calling execute_api
+#   facade        worker threads calling ApiExecutionFacade.execute
+#   async         one event loop, ApiExecutionFacade.execute_async under a semaphore
+#
+# Reported per run: requests/s, p50/p95/p99 latency, failed calls, vendor
+# requests, retries (from the retry budget), token refreshes, and peak RSS.
+# RSS is a process high-water mark — run a single scenario per process to
+# attribute memory. Backoff is scaled down (50 ms base) so runs take seconds.
+# Every call asks for a different page, so in-flight coalescing of identical
+# GETs does not collapse the load.
+#
+# Usage:
+#   python -m weavex_core.benchmarks.bench_load                        # every scenario, execute_api
+#   python -m weavex_core.benchmarks.bench_load rate_limited --entry async --calls 5000 --concurrency 64
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import dataclasses
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+from weavex_core.benchmarks.mock_vendor import MockVendor, MockVault, VendorProfile
+from weavex_core.api_execution_facade import ApiExecutionFacade
+from weavex_core.execute_api import RetryConfig
+from weavex_core.retry_budget import get_retry_budget_stats
+
+ex = sys.modules["weavex_core.execute_api"]
+
+SCENARIOS = {
+    "baseline":     VendorProfile(),
+    "rate_limited": VendorProfile(rate_429=0.1),
+    "token_expiry": VendorProfile(token_ttl_seconds=1.0),
+    "error_bursts": VendorProfile(burst_every_seconds=2.0, burst_seconds=0.2),
+    "large_bodies": VendorProfile(items=2000, item_bytes=256),
+}
+
+ENTRIES = ("execute_api", "facade", "async")
+
+RETRY = RetryConfig(backoff_seconds=0.05, max_backoff_seconds=0.5)
+
+
+@dataclass
+class LoadResult:
+    scenario:        str
+    entry:           str
+    calls:           int
+    concurrency:     int
+    seconds:         float
+    rps:             float
+    p50_ms:          float
+    p95_ms:          float
+    p99_ms:          float
+    failed:          int
+    errors:          dict      # exception type / status → count
+    vendor_requests: int
+    retries:         int
+    refreshes:       int
+    peak_rss_mb:     Optional[float]
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _outcome(call, index: int) -> Optional[str]:
+    """None on success, otherwise a label for the error table."""
+    try:
+        response = call(index)
+    except Exception as e:
+        return type(e).__name__
+    return None if response.ok else f"HTTP {response.status_code}"
+
+
+def _run_threads(call, calls: int, concurrency: int) -> tuple[list, Counter]:
+    latencies, errors = [], Counter()
+
+    def _timed(index: int):
+        start   = time.perf_counter()
+        outcome = _outcome(call, index)
+        return time.perf_counter() - start, outcome
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency, outcome in pool.map(_timed, range(calls)):
+            latencies.append(latency)
+            if outcome:
+                errors[outcome] += 1
+    return latencies, errors
+
+
+def _run_async(integration_id: str, path: str, calls: int, concurrency: int) -> tuple[list, Counter]:
+    latencies, errors = [], Counter()
+
+    async def _one(semaphore: asyncio.Semaphore, index: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await ApiExecutionFacade.execute_async(
+                    context={}, integration_id=integration_id, method="GET", path=f"{path}?page={index}", retry=RETRY
+                )
+                outcome = None if response.ok else f"HTTP {response.status_code}"
+            except Exception as e:
+                outcome = type(e).__name__
+            latencies.append(time.perf_counter() - start)
+            if outcome:
+                errors[outcome] += 1
+
+    async def _main() -> None:
+        semaphore = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(_one(semaphore, index) for index in range(calls)))
+
+    asyncio.run(_main())
+    return latencies, errors
+
+
+def run_scenario(
+        scenario:    str,
+        entry:       str = "execute_api",
+        calls:       int = 2000,
+        concurrency: int = 32,
+        profile:     Optional[VendorProfile] = None
+) -> LoadResult:
+    profile = dataclasses.replace(profile or SCENARIOS[scenario])
+    # A fresh integration per run: credential cache, breaker and limiter state
+    # from an earlier run must not leak into this one.
+    integration_id = f"wvx_sk_bench_{scenario}_{entry}_{time.monotonic_ns()}"
+    path           = "/v1/employees"
+
+    with MockVendor(profile) as vendor, MockVault(vendor) as vault:
+        previous_url = os.environ.get("WEAVEX_CONNECT_SERVER_URL")
+        os.environ["WEAVEX_CONNECT_SERVER_URL"] = vault.url
+        try:
+            # Warm-up outside the measurement: vault fetch and first connection.
+            ex.execute_api({}, integration_id, "GET", path, retry=RETRY)
+            before_vendor  = vendor.stats()
+            before_retries = get_retry_budget_stats().retries
+
+            start = time.perf_counter()
+            if entry == "async":
+                latencies, errors = _run_async(integration_id, path, calls, concurrency)
+            elif entry == "facade":
+                latencies, errors = _run_threads(
+                    lambda index: ApiExecutionFacade.execute(
+                        context={}, integration_id=integration_id, method="GET", path=f"{path}?page={index}", retry=RETRY
+                    ),
+                    calls, concurrency
+                )
+            else:
+                latencies, errors = _run_threads(
+                    lambda index: ex.execute_api({}, integration_id, "GET", f"{path}?page={index}", retry=RETRY),
+                    calls, concurrency
+                )
+            seconds = time.perf_counter() - start
+        finally:
+            if previous_url is None:
+                os.environ.pop("WEAVEX_CONNECT_SERVER_URL", None)
+            else:
+                os.environ["WEAVEX_CONNECT_SERVER_URL"] = previous_url
+
+        after_vendor = vendor.stats()
+
+    latencies.sort()
+    return LoadResult(
+        scenario        = scenario,
+        entry           = entry,
+        calls           = calls,
+        concurrency     = concurrency,
+        seconds         = seconds,
+        rps             = calls / seconds,
+        p50_ms          = _percentile(latencies, 0.50) * 1000,
+        p95_ms          = _percentile(latencies, 0.95) * 1000,
+        p99_ms          = _percentile(latencies, 0.99) * 1000,
+        failed          = sum(errors.values()),
+        errors          = dict(errors),
+        vendor_requests = after_vendor["requests"] - before_vendor["requests"],
+        retries         = get_retry_budget_stats().retries - before_retries,
+        refreshes       = after_vendor["refreshes"] - before_vendor["refreshes"],
+        peak_rss_mb     = _peak_rss_mb()
+    )
+
+
+def _print(result: LoadResult) -> None:
+    rss = f"{result.peak_rss_mb:7.1f} MB" if result.peak_rss_mb is not None else "      n/a"
+    print(
+        f"  {result.scenario:<13} {result.entry:<11} {result.rps:8.0f} req/s   "
+        f"p50 {result.p50_ms:7.1f}  p95 {result.p95_ms:7.1f}  p99 {result.p99_ms:7.1f} ms   "
+        f"failed {result.failed:5d}  vendor {result.vendor_requests:6d}  retries {result.retries:5d}  "
+        f"refreshes {result.refreshes:3d}  rss {rss}"
+    )
+    if result.errors:
+        print(f"  {'':<13} errors: {result.errors}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m weavex_core.benchmarks.bench_load")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario", help=", ".join(SCENARIOS))
+    parser.add_argument("--entry", choices=ENTRIES, default="execute_api")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--verbose", action="store_true", help="show weavex_core retry / breaker warnings")
+    args = parser.parse_args()
+    if not args.verbose:
+        logging.getLogger("weavex_core").setLevel(logging.ERROR)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    print(f"execute_api load — {args.calls} calls, concurrency {args.concurrency}, entry {args.entry}")
+    for name in args.scenarios or SCENARIOS:
+        _print(run_scenario(name, args.entry, args.calls, args.concurrency))
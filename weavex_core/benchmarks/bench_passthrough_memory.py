@@ -0,0 +1,99 @@
+# weavex_core/benchmarks/bench_passthrough_memory.py
+#
+# Client-side memory of make_passthrough_call on multi-MB vendor responses,
+# against the local stand-ins in mock_proxy.py / mock_vendor.py. The servers run
+# in a child process, so tracemalloc only sees the caller's allocations.
+#
+# Modes:
+#   raw+body     keep_raw=True, body read — raw reply bytes kept next to the decoded body
+#   body         default, body read       — decoded on access, raw bytes dropped
+#   status-only  default, body never read — only the proxy's body string is held
+#
+# Reported per mode: peak RSS growth during the call and body access, and MB
+# still allocated while the response is alive (tracemalloc). Every mode runs in
+# a fresh client process, warmed up on a small response, so the RSS high-water
+# mark belongs to the measured call alone. tracemalloc is not used for the peak:
+# orjson reserves a scratch buffer far larger than the pages it touches. Each
+# size runs with the vendor body single- and double-encoded in the envelope.
+#
+# Usage:
+#   python -m weavex_core.benchmarks.bench_passthrough_memory            # 2, 8 and 32 MB
+#   python -m weavex_core.benchmarks.bench_passthrough_memory 64
+
+import gc
+import os
+import sys
+import tracemalloc
+import multiprocessing
+
+from weavex_core.api import make_passthrough_call
+from weavex_core.benchmarks.mock_vendor import MockVendor, VendorProfile
+from weavex_core.benchmarks.mock_proxy import MockProxy
+from weavex_core.benchmarks.bench_load import _peak_rss_mb
+
+
+CONTEXT   = {"knit_api_key": "bench-key", "execution_id": "bench-execution"}
+ITEM_SIZE = 1024
+
+MODES = ("raw+body", "body", "status-only")
+
+
+def _serve(conn, size_mb: int, double_encode: bool) -> None:
+    profile = VendorProfile(
+        latency_ms = 0, jitter_ms = 0, tail_rate = 0,
+        items      = size_mb * 1024 * 1024 // (ITEM_SIZE + 30),
+        item_bytes = ITEM_SIZE
+    )
+    with MockVendor(profile) as vendor, MockProxy(vendor, double_encode=double_encode) as proxy:
+        conn.send(proxy.passthrough_url)
+        conn.recv()     # parent is done
+
+
+def _client(conn, url: str, mode: str) -> None:
+    os.environ["WEAVEX_PASSTHROUGH_URL"] = url
+    # Warm-up on the vendor's small 404: imports, connection, first allocations
+    make_passthrough_call(CONTEXT, "wvx_sk_bench", "GET", "/missing").body
+    gc.collect()
+    before = _peak_rss_mb()
+    tracemalloc.start()
+    response = make_passthrough_call(CONTEXT, "wvx_sk_bench", "GET", "/v1/employees", keep_raw=mode == "raw+body")
+    if mode != "status-only":
+        assert isinstance(response.body, dict), response.status_code
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    peak     = _peak_rss_mb()
+    conn.send((peak - before if peak is not None else None, retained))
+
+
+def _in_process(target, *args):
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.get_context("spawn").Process(target=target, args=(child, *args), daemon=True)
+    process.start()
+    return process, parent
+
+
+def run_benchmark(size_mb: int, double_encode: bool) -> dict:
+    server, server_conn = _in_process(_serve, size_mb, double_encode)
+    url = server_conn.recv()
+    try:
+        results = {}
+        for mode in MODES:
+            client, client_conn = _in_process(_client, url, mode)
+            results[mode] = client_conn.recv()
+            client.join()
+        return results
+    finally:
+        server_conn.send("stop")
+        server.join(timeout=10)
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2, 8, 32]
+    print("make_passthrough_call client memory — peak RSS growth / retained MB")
+    for size_mb in sizes:
+        for double_encode in (False, True):
+            results = run_benchmark(size_mb, double_encode)
+            cells   = "   ".join(
+                f"{mode} {peak if peak is not None else float('nan'):7.1f} / {kept:6.1f}" for mode, (peak, kept) in results.items()
+            )
+            print(f"  {size_mb:4d} MB {'double' if double_encode else 'single':<7} {cells}")
@@ -0,0 +1,108 @@
+# weavex_core/benchmarks/bench_tracing.py
+#
+# Per-request tracing overhead of execute_api, before and after moving from
+# print(..., flush=True) to the level-gated module logger.
+#
+#   legacy        the old print sequence (START, credential + auth header dumps,
+#                 REQUEST, body, status, RESPONSE), written to /dev/null
+#   logger        the current calls at the default level (DEBUG disabled)
+#   logger+debug  the current calls with WEAVEX_EXECUTE_API_DEBUG on,
+#                 handler writing to /dev/null
+#
+# No network: each variant runs the same request preparation, only the
+# tracing differs. "untraced" is preparation with the logger disabled.
+#
+# Usage:
+#   python -m weavex_core.benchmarks.bench_tracing [iterations]
+
+import os
+import sys
+import json
+import time
+import logging
+import contextlib
+
+from weavex_core import execute_api as _execute_api_module   # noqa: F401  (function shadows module)
+
+ex = sys.modules["weavex_core.execute_api"]
+
+CREDENTIALS = {
+    "authType":        "bearer",
+    "baseUrl":         "https://api.vendor.example/v1",
+    "accessToken":     "x" * 64,
+    "__errorSpecs":    [],
+    "__rateLimitSpec": {},
+}
+METHOD = "POST"
+PATH   = "/employees"
+BODY   = {"firstName": "Jane", "lastName": "Doe", "workEmail": "jane.doe@company.com"}
+
+
+def _legacy(integration_id: str) -> None:
+    """Replica of the tracing execute_api did per request before the logger."""
+    print(f"[execute_api] START {METHOD} {PATH} integration={integration_id}", flush=True)
+    url          = ex._build_url(CREDENTIALS, PATH)
+    auth_headers = ex._build_auth_headers(CREDENTIALS)
+    all_headers  = {**auth_headers, "Content-Type": "application/json"}
+    print(CREDENTIALS, flush=True)
+    print(auth_headers, flush=True)
+    print(
+        f"[execute_api] REQUEST {METHOD} {url} "
+        f"authType={CREDENTIALS.get('authType')} "
+        f"hasBody={BODY is not None} "
+        f"headers={list(all_headers.keys())}",
+        flush=True
+    )
+    request_body = json.dumps(BODY)
+    print(f"[execute_api] content_type=application/json body_type={type(request_body)} body={str(request_body)}", flush=True)
+    print(200, flush=True)
+    print(f"[execute_api] RESPONSE 200 {METHOD} {PATH} attempt=1", flush=True)
+
+
+def _current(integration_id: str) -> None:
+    ex.logger.debug("START %s %s integration=%s", METHOD, PATH, integration_id)
+    ex._prepare_request(CREDENTIALS, METHOD, PATH, {}, BODY, "application/json")
+    ex.logger.debug("RESPONSE %d %s %s attempt=%d", 200, METHOD, PATH, 1)
+
+
+def _time(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn("bench-integration")
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run_benchmark(iterations: int = 20000) -> dict:
+    results = {}
+    with open(os.devnull, "w") as devnull:
+        ex.enable_debug_logging(False)
+        ex.logger.disabled = True
+        try:
+            results["untraced"] = _time(_current, iterations)
+        finally:
+            ex.logger.disabled = False
+
+        with contextlib.redirect_stdout(devnull):
+            results["legacy"] = _time(_legacy, iterations)
+
+        results["logger"] = _time(_current, iterations)
+
+        handler = logging.StreamHandler(devnull)
+        ex.logger.addHandler(handler)
+        ex.logger.setLevel(logging.DEBUG)
+        propagate, ex.logger.propagate = ex.logger.propagate, False
+        try:
+            results["logger+debug"] = _time(_current, iterations)
+        finally:
+            ex.logger.removeHandler(handler)
+            ex.logger.propagate = propagate
+            ex.enable_debug_logging(False)
+
+    return results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"execute_api request preparation + tracing, per request ({n} iterations)")
+    for name, micros in run_benchmark(n).items():
+        print(f"  {name:<14} {micros:8.2f} µs")
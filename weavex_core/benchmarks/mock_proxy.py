@@ -0,0 +1,109 @@
+# weavex_core/benchmarks/mock_proxy.py
+#
+# Local stand-in for the Knit passthrough proxy, so make_passthrough_call and
+# make_passthrough_calls run with no network. Point them at it through
+# WEAVEX_PASSTHROUGH_URL; requests are forwarded to the upstream (a MockVendor
+# or any base URL) with the proxy's own Authorization, as the real proxy
+# injects the integration's credentials.
+#
+#   POST /v1.0/weavex.passthrough        one request  → the single-call envelope
+#   POST /v1.0/weavex.passthrough.batch  many requests → one entry per request
+#                                        (404 when started with batch=False)
+#
+# double_encode=True wraps each vendor body in a second JSON string, as some
+# proxy deployments do.
+#
+# Usage:
+#   with MockVendor() as vendor, MockProxy(vendor) as proxy:
+#       os.environ["WEAVEX_PASSTHROUGH_URL"] = proxy.passthrough_url
+#       make_passthrough_calls(context, "wvx_sk_bench", [{"method": "GET", "path": "/v1/employees"}] * 100)
+#       proxy.stats()   # → {"envelopes": 2, "batch_envelopes": 2, "forwarded": 100}
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+import requests
+
+from weavex_core.benchmarks.mock_vendor import _Server, MockVendor
+
+
+PASSTHROUGH_PATH = "/v1.0/weavex.passthrough"
+
+
+class MockProxy(_Server):
+    def __init__(
+            self,
+            upstream:      Union[MockVendor, str],
+            batch:         bool = True,
+            double_encode: bool = False,
+            token:         str  = "bench-token-0"
+    ):
+        super().__init__()
+        self.upstream      = upstream
+        self.batch         = batch
+        self.double_encode = double_encode
+        self.token         = token
+        self._lock         = threading.Lock()
+        self._session      = requests.Session()
+        self._executor     = ThreadPoolExecutor(max_workers=16, thread_name_prefix="mock-proxy")
+        self._stats        = {"envelopes": 0, "batch_envelopes": 0, "forwarded": 0}
+
+    @property
+    def passthrough_url(self) -> str:
+        return f"{self.url}{PASSTHROUGH_PATH}"
+
+    def stop(self) -> None:
+        super().stop()
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> tuple[int, dict, bytes]:
+        if method != "POST" or path not in (PASSTHROUGH_PATH, f"{PASSTHROUGH_PATH}.batch"):
+            return 404, {}, b'{"success": false, "error": {"msg": "not found"}}'
+        is_batch = path.endswith(".batch")
+        if is_batch and not self.batch:
+            return 404, {}, b'{"success": false, "error": {"msg": "not found"}}'
+        if not headers.get("Authorization", "").startswith("Bearer "):
+            return 401, {}, b'{"success": false, "error": {"msg": "missing api key"}}'
+
+        payload = json.loads(body)
+        with self._lock:
+            self._stats["envelopes"] += 1
+            self._stats["batch_envelopes"] += is_batch
+
+        if not is_batch:
+            status, envelope = self._forward(payload)
+            return status, {}, json.dumps(envelope).encode()
+
+        entries = list(self._executor.map(self._forward, payload.get("requests") or []))
+        responses = [{"statusCode": status, **envelope} for status, envelope in entries]
+        return 200, {}, json.dumps({"success": True, "data": {"responses": responses}}).encode()
+
+    def _forward(self, request: dict) -> tuple[int, dict]:
+        base_url = request.get("baseUrl") or (
+            self.upstream.url if isinstance(self.upstream, MockVendor) else self.upstream
+        )
+        headers = dict(request.get("headers") or {})
+        headers["Authorization"] = f"Bearer {self.token}"
+        if request.get("body") is not None:
+            headers["Content-Type"] = request.get("contentType") or "application/json"
+        with self._lock:
+            self._stats["forwarded"] += 1
+        try:
+            resp = self._session.request(
+                request["method"], f"{base_url.rstrip('/')}{request['path']}",
+                data=(request.get("body") or "").encode() or None, headers=headers, timeout=30
+            )
+        except requests.RequestException as e:
+            return 502, {"success": False, "error": {"msg": f"upstream error: {e}"}}
+        body = json.dumps(resp.text) if self.double_encode else resp.text
+        return resp.status_code, {
+            "success": True,
+            "data": {"response": {"headers": dict(resp.headers), "body": body}}
+        }
@@ -0,0 +1,223 @@
+# weavex_core/benchmarks/mock_vendor.py
+#
+# Local stand-ins for a vendor API and the connect-server vault, so execute_api
+# can be load-tested on a laptop with no network. Both are stdlib
+# ThreadingHTTPServer instances on 127.0.0.1 with HTTP/1.1 keep-alive.
+#
+# MockVendor — every path under /v1/ answers according to a VendorProfile:
+#   latency         latency_ms + uniform(0, jitter_ms), and tail_ms for tail_rate of calls
+#   rate limiting   429 with Retry-After for rate_429 of calls
+#   token expiry    access tokens die after token_ttl_seconds → 401; POST /oauth/token
+#                   issues a new one (refresh_token grant)
+#   5xx bursts      every burst_every_seconds, burst_seconds of burst_status answers
+#   large bodies    {"items": [...]} with items × item_bytes of payload
+#
+# MockVault — GET/PUT /api/vault/{integration_id}, serving oauth2 credentials that
+# point at the vendor and storing what token refreshes write back.
+#
+# Injected failures draw from a seeded RNG, so two runs of a scenario see the
+# same mix. The servers are Python too: their overhead is part of every number,
+# which is fine for comparing runs of weavex_core against each other.
+#
+# Usage:
+#   with MockVendor(VendorProfile(latency_ms=20, rate_429=0.05)) as vendor, MockVault(vendor) as vault:
+#       os.environ["WEAVEX_CONNECT_SERVER_URL"] = vault.url
+#       execute_api(context, "wvx_sk_bench", "GET", "/v1/employees")
+#       vendor.stats()   # → {"requests": ..., "statuses": {...}, "refreshes": ...}
+
+import json
+import time
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+
+@dataclass
+class VendorProfile:
+    latency_ms:          float           = 20.0
+    jitter_ms:           float           = 10.0
+    tail_rate:           float           = 0.01
+    tail_ms:             float           = 250.0
+    rate_429:            float           = 0.0
+    retry_after_seconds: float           = 0.05
+    token_ttl_seconds:   Optional[float] = None
+    burst_every_seconds: Optional[float] = None
+    burst_seconds:       float           = 0.25
+    burst_status:        int             = 503
+    items:               int             = 20
+    item_bytes:          int             = 64
+    seed:                int             = 7
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads     = True
+    request_queue_size = 1024    # the stdlib default of 5 drops SYNs under load → 1 s tails
+
+
+class _Server:
+    def __init__(self):
+        self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self):
+        handler      = type("Handler", (_Handler,), {"app": self})
+        self._server = _HTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class MockVendor(_Server):
+    def __init__(self, profile: Optional[VendorProfile] = None):
+        super().__init__()
+        self.profile    = profile or VendorProfile()
+        self._lock      = threading.Lock()
+        self._rng       = random.Random(self.profile.seed)
+        self._started   = time.monotonic()
+        self._tokens    = {"bench-token-0": time.monotonic()}   # token → issued at
+        self._issued    = 0
+        self._requests  = 0
+        self._statuses  = Counter()
+        self._refreshes = 0
+        self._body      = json.dumps({
+            "items": [{"id": i, "payload": "x" * self.profile.item_bytes} for i in range(self.profile.items)]
+        }).encode()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"requests": self._requests, "statuses": dict(self._statuses), "refreshes": self._refreshes}
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> tuple[int, dict, bytes]:
+        if path.startswith("/oauth/token"):
+            return self._issue_token()
+        if not path.startswith("/v1/"):
+            return 404, {}, b'{"error": "not found"}'
+
+        profile = self.profile
+        with self._lock:
+            self._requests += 1
+            roll_tail = self._rng.random() < profile.tail_rate
+            roll_429  = self._rng.random() < profile.rate_429
+            jitter    = self._rng.uniform(0, profile.jitter_ms)
+        time.sleep((profile.tail_ms if roll_tail else profile.latency_ms + jitter) / 1000.0)
+
+        if self._in_burst():
+            return self._answer(profile.burst_status, {}, b'{"error": "unavailable"}')
+        if roll_429:
+            return self._answer(429, {"Retry-After": f"{profile.retry_after_seconds:g}"}, b'{"error": "rate limited"}')
+        if not self._token_valid(headers.get("Authorization", "")):
+            return self._answer(401, {}, b'{"error": "invalid_token"}')
+        if method in ("POST", "PUT", "PATCH"):
+            return self._answer(201, {}, b'{"id": "created", "received": %d}' % len(body))
+        return self._answer(200, {}, self._body)
+
+    def _answer(self, status: int, headers: dict, body: bytes) -> tuple[int, dict, bytes]:
+        with self._lock:
+            self._statuses[status] += 1
+        return status, headers, body
+
+    def _in_burst(self) -> bool:
+        every = self.profile.burst_every_seconds
+        if not every:
+            return False
+        return (time.monotonic() - self._started) % every < self.profile.burst_seconds
+
+    def _token_valid(self, authorization: str) -> bool:
+        token = authorization.removeprefix("Bearer ").strip()
+        with self._lock:
+            issued = self._tokens.get(token)
+        if issued is None:
+            return False
+        ttl = self.profile.token_ttl_seconds
+        return ttl is None or time.monotonic() - issued < ttl
+
+    def _issue_token(self) -> tuple[int, dict, bytes]:
+        with self._lock:
+            self._issued    += 1
+            self._refreshes += 1
+            token = f"bench-token-{self._issued}"
+            self._tokens[token] = time.monotonic()
+        return 200, {}, json.dumps({"access_token": token, "refresh_token": "bench-refresh", "token_type": "Bearer"}).encode()
+
+
+class MockVault(_Server):
+    def __init__(self, vendor: MockVendor):
+        super().__init__()
+        self.vendor       = vendor
+        self._lock        = threading.Lock()
+        self._credentials = {}
+        self.fetches      = 0
+        self.writes       = 0
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> tuple[int, dict, bytes]:
+        if not path.startswith("/api/vault/"):
+            return 404, {}, b'{"error": "not found"}'
+        integration_id = urlsplit(path).path.rsplit("/", 1)[1]
+        with self._lock:
+            if method == "PUT":
+                self.writes += 1
+                stored = {k: v for k, v in json.loads(body).items() if not k.startswith("__")}
+                self._credentials[integration_id] = stored
+                return 200, {}, b"{}"
+            self.fetches += 1
+            credentials = self._credentials.get(integration_id) or self._initial_credentials()
+        return 200, {}, json.dumps({"credentials": credentials, "errorSpecs": [], "rateLimitSpec": {}}).encode()
+
+    def _initial_credentials(self) -> dict:
+        return {
+            "authType":     "oauth2",
+            "baseUrl":      self.vendor.url,
+            "accessToken":  "bench-token-0",
+            "refreshToken": "bench-refresh",
+            "tokenUrl":     f"{self.vendor.url}/oauth/token",
+            "clientId":     "bench-client",
+            "clientSecret": "bench-secret",
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    app              = None
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body   = self.rfile.read(length) if length else self._read_chunked()
+        status, headers, payload = self.app.handle(self.command, self.path, self.headers, body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_chunked(self) -> bytes:
+        if self.headers.get("Transfer-Encoding") != "chunked":
+            return b""
+        chunks = []
+        while size := int(self.rfile.readline().strip() or b"0", 16):
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+        self.rfile.readline()
+        return b"".join(chunks)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
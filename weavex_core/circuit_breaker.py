@@ -0,0 +1,276 @@
+# weavex_core/circuit_breaker.py
+#
+# Circuit breaker per integration and vendor host. When a vendor is down,
+# execute_api stops sending after a few failures and fails fast instead of
+# spending max_retries backoffs on every record of a run.
+#
+# States:
+#   closed     calls flow; outcomes are tracked
+#   open       calls fail immediately until open_seconds have passed
+#   half_open  one probe call is let through; success closes, failure re-opens
+#
+# Every state change starts a new generation. admit() hands the caller the
+# generation it was admitted in; an outcome reported with an older generation
+# is ignored, so calls that were already in flight when the breaker tripped
+# cannot close it — only the half-open probe can.
+#
+# A failure is a timeout, a network error or a 5xx (500/502/503/504).
+# 4xx responses, including 429, are the vendor answering — they count as success.
+# The breaker trips on `failure_threshold` consecutive failures, or when at least
+# `min_calls` of the last `window` calls have a failure rate ≥ `failure_rate`.
+#
+# Tuning (env):
+#   WEAVEX_BREAKER_ENABLED            default true
+#   WEAVEX_BREAKER_FAILURE_THRESHOLD  default 5
+#   WEAVEX_BREAKER_FAILURE_RATE       default 0.5
+#   WEAVEX_BREAKER_WINDOW             default 20
+#   WEAVEX_BREAKER_MIN_CALLS          default 10
+#   WEAVEX_BREAKER_OPEN_SECONDS       default 30
+#
+# Usage (orchestrator side):
+#   for state in get_circuit_breaker_states(integration_id):
+#       if state.state == "open":
+#           reschedule(after=state.retry_in_seconds)
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+CLOSED    = "closed"
+OPEN      = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_STATUSES = (500, 502, 503, 504)
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass
+class BreakerConfig:
+    failure_threshold: int   = _env_int("WEAVEX_BREAKER_FAILURE_THRESHOLD", 5)
+    failure_rate:      float = _env_float("WEAVEX_BREAKER_FAILURE_RATE", 0.5)
+    window:            int   = _env_int("WEAVEX_BREAKER_WINDOW", 20)
+    min_calls:         int   = _env_int("WEAVEX_BREAKER_MIN_CALLS", 10)
+    open_seconds:      float = _env_float("WEAVEX_BREAKER_OPEN_SECONDS", 30)
+
+
+@dataclass
+class BreakerState:
+    integration_id:       str
+    host:                 str
+    state:                str        # closed | open | half_open
+    consecutive_failures: int
+    failure_rate:         float      # over the rolling window
+    calls_in_window:      int
+    rejected:             int        # calls failed fast since the breaker was created
+    retry_in_seconds:     float      # 0 unless open
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class BreakerTicket:
+    """A call admitted by a breaker, tagged with the generation that admitted it."""
+    breaker:    "CircuitBreaker"
+    generation: int
+
+    def record_status(self, status_code: int) -> None:
+        self.breaker.record_status(status_code, self.generation)
+
+    def record_failure(self) -> None:
+        self.breaker.record_failure(self.generation)
+
+
+class CircuitBreaker:
+    def __init__(self, integration_id: str, host: str, config: BreakerConfig):
+        self.integration_id = integration_id
+        self.host           = host
+        self.config         = config
+        self._lock          = threading.Lock()
+        self._state         = CLOSED
+        self._outcomes      = deque(maxlen=config.window)    # True = failure
+        self._consecutive   = 0
+        self._opened_at     = 0.0
+        self._probe_at      = 0.0
+        self._rejected      = 0
+        self._generation    = 0
+
+    def admit(self) -> Optional[BreakerTicket]:
+        """A ticket if a call may go out now, else None. In half_open only one probe is admitted."""
+        with self._lock:
+            now = time.time()
+            if self._state == CLOSED:
+                return BreakerTicket(self, self._generation)
+            if self._state == OPEN and now - self._opened_at >= self.config.open_seconds:
+                self._enter(HALF_OPEN)
+                self._probe_at = now
+                return BreakerTicket(self, self._generation)
+            # A probe that never reported back (caller crashed) must not wedge the
+            # breaker. The new probe gets a new generation, so a late answer from
+            # the lost one is ignored.
+            if self._state == HALF_OPEN and now - self._probe_at >= self.config.open_seconds:
+                self._generation += 1
+                self._probe_at    = now
+                return BreakerTicket(self, self._generation)
+            self._rejected += 1
+            return None
+
+    def allow(self) -> bool:
+        """True if a call may go out now. Prefer admit() so the outcome can be matched to the admission."""
+        return self.admit() is not None
+
+    def record_status(self, status_code: int, generation: Optional[int] = None) -> None:
+        if status_code in FAILURE_STATUSES:
+            self.record_failure(generation)
+        else:
+            self.record_success(generation)
+
+    def record_success(self, generation: Optional[int] = None) -> None:
+        with self._lock:
+            if self._is_stale(generation):
+                return
+            self._outcomes.append(False)
+            self._consecutive = 0
+            if self._state == HALF_OPEN:
+                self._enter(CLOSED)
+                self._outcomes.clear()
+                logger.info("circuit closed integration=%s host=%s", self.integration_id, self.host)
+
+    def record_failure(self, generation: Optional[int] = None) -> None:
+        with self._lock:
+            if self._is_stale(generation):
+                return
+            self._outcomes.append(True)
+            self._consecutive += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._should_trip()):
+                logger.warning(
+                    "circuit opened integration=%s host=%s consecutive_failures=%d — failing fast for %gs",
+                    self.integration_id, self.host, self._consecutive, self.config.open_seconds
+                )
+                self._enter(OPEN)
+                self._opened_at = time.time()
+
+    def snapshot(self) -> BreakerState:
+        with self._lock:
+            calls     = len(self._outcomes)
+            failures  = sum(self._outcomes)
+            retry_in  = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self._opened_at + self.config.open_seconds - time.time())
+            return BreakerState(
+                integration_id       = self.integration_id,
+                host                 = self.host,
+                state                = self._state,
+                consecutive_failures = self._consecutive,
+                failure_rate         = failures / calls if calls else 0.0,
+                calls_in_window      = calls,
+                rejected             = self._rejected,
+                retry_in_seconds     = retry_in
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._enter(CLOSED)
+            self._consecutive = 0
+            self._outcomes.clear()
+
+    def _enter(self, state: str) -> None:
+        self._state       = state
+        self._generation += 1
+
+    def _is_stale(self, generation: Optional[int]) -> bool:
+        # Without a generation the outcome is taken at face value, except that
+        # only an admitted probe may move the breaker out of open/half_open.
+        if generation is None:
+            return self._state != CLOSED
+        return generation != self._generation
+
+    def _should_trip(self) -> bool:
+        if self._consecutive >= self.config.failure_threshold:
+            return True
+        calls = len(self._outcomes)
+        return calls >= self.config.min_calls and sum(self._outcomes) / calls >= self.config.failure_rate
+
+
+# ── Registry ──────────────────────────────────────────────────────────────────
+
+ENABLED = os.environ.get("WEAVEX_BREAKER_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+class _BreakerRegistry:
+    def __init__(self):
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+        self._lock:     threading.Lock                        = threading.Lock()
+        self.config:    BreakerConfig                         = BreakerConfig()
+
+    def get(self, integration_id: str, base_url: Optional[str]) -> CircuitBreaker:
+        host = urlsplit(base_url or "").netloc or "unknown"
+        key  = (integration_id, host)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(integration_id, host, self.config)
+            return breaker
+
+    def states(self, integration_id: Optional[str]) -> list[BreakerState]:
+        with self._lock:
+            breakers = [b for (iid, _), b in self._breakers.items() if integration_id in (None, iid)]
+        return [b.snapshot() for b in breakers]
+
+    def _reset_after_fork(self) -> None:
+        self._lock     = threading.Lock()
+        self._breakers = {}
+
+
+_registry = _BreakerRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry._reset_after_fork)
+
+
+def get_circuit_breaker(integration_id: str, base_url: Optional[str]) -> Optional[CircuitBreaker]:
+    """Returns the breaker for an integration's vendor host, or None when breakers are disabled."""
+    if not ENABLED:
+        return None
+    return _registry.get(integration_id, base_url)
+
+
+def get_circuit_breaker_states(integration_id: Optional[str] = None) -> list[BreakerState]:
+    """Breaker snapshots for one integration (every host it talks to), or for all."""
+    return _registry.states(integration_id)
+
+
+def configure_circuit_breakers(config: BreakerConfig) -> None:
+    """Replaces the tuning for breakers created from now on; existing breakers are dropped."""
+    with _registry._lock:
+        _registry.config    = config
+        _registry._breakers = {}
+
+
+def reset_circuit_breaker(integration_id: str) -> None:
+    """Closes every breaker of an integration, e.g. after the vendor confirmed recovery."""
+    with _registry._lock:
+        breakers = [b for (iid, _), b in _registry._breakers.items() if iid == integration_id]
+    for breaker in breakers:
+        breaker.reset()
@@ -0,0 +1,117 @@
+# weavex_core/compression.py
+#
+# Opt-in request-body compression for execute_api.
+# Enabled per integration by the compressionSpec bundled with vault credentials;
+# integrations without one are sent uncompressed, exactly as before.
+#
+#   "compressionSpec": {
+#       "requestEncoding": ["zstd", "gzip"],   # preference order, or a single string
+#       "minBytes":        1024,               # smaller bodies are not worth it
+#       "level":           null                # codec default when omitted
+#   }
+#
+# The first listed encoding whose codec is installed wins: gzip and deflate are
+# always available, zstd needs `zstandard`, br needs `brotli` (or `brotlicffi`).
+# Only in-memory bodies (bytes / str) are compressed, and never when the caller
+# already set a Content-Encoding header.
+#
+# Responses need nothing from here: the pooled httpx clients advertise every
+# encoding they can decode (gzip, deflate, plus br / zstd when installed) and
+# decode chunk by chunk as the body is read, so the compressed payload is never
+# buffered next to the decoded one — execute_api_stream stays flat too.
+#
+# Usage:
+#   content, encoding = compress_body(content, credentials.get("__compressionSpec"))
+#   if encoding:
+#       headers["Content-Encoding"] = encoding
+
+import zlib
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+DEFAULT_MIN_BYTES = 1024
+
+
+def _gzip(data: bytes, level: Optional[int]) -> bytes:
+    # wbits=31 → gzip container; level 6 matches gzip(1)
+    compressor = zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _deflate(data: bytes, level: Optional[int]) -> bytes:
+    # HTTP "deflate" is the zlib format (RFC 1950), not raw deflate
+    return zlib.compress(data, 6 if level is None else level)
+
+
+def _zstd(data: bytes, level: Optional[int]) -> bytes:
+    return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+
+
+def _br(data: bytes, level: Optional[int]) -> bytes:
+    # brotli's default quality (11) is far too slow for request bodies
+    return brotli.compress(data, quality=5 if level is None else level)
+
+
+_CODECS = {"gzip": _gzip, "deflate": _deflate}
+if zstandard is not None:
+    _CODECS["zstd"] = _zstd
+if brotli is not None:
+    _CODECS["br"] = _br
+
+
+def available_encodings() -> list[str]:
+    return list(_CODECS)
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    encoding:  Optional[str]          # None → compression off
+    min_bytes: int           = DEFAULT_MIN_BYTES
+    level:     Optional[int] = None
+
+    @classmethod
+    def from_spec(cls, spec: Optional[dict]) -> "CompressionConfig":
+        """Builds a config from a camelCase skill compressionSpec."""
+        if not spec:
+            return _OFF
+        preferred = spec.get("requestEncoding") or []
+        if isinstance(preferred, str):
+            preferred = [preferred]
+        encoding = next((e.lower() for e in preferred if e.lower() in _CODECS), None)
+        return cls(
+            encoding  = encoding,
+            min_bytes = int(spec.get("minBytes", DEFAULT_MIN_BYTES)),
+            level     = spec.get("level")
+        )
+
+
+_OFF = CompressionConfig(encoding=None)
+
+
+def compress_body(content: Any, spec: Union[dict, CompressionConfig, None]) -> tuple[Any, Optional[str]]:
+    """
+    Returns (content, encoding). encoding is None when the body was left as is:
+    compression off, no usable codec, a streaming body, or below min_bytes.
+    """
+    config = spec if isinstance(spec, CompressionConfig) else CompressionConfig.from_spec(spec)
+    if config.encoding is None:
+        return content, None
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if not isinstance(content, (bytes, bytearray)) or len(content) < config.min_bytes:
+        return content, None
+    return _CODECS[config.encoding](bytes(content), config.level), config.encoding
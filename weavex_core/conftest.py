@@ -0,0 +1,70 @@
+import ast
+import os
+import sys
+import time
+import importlib
+import subprocess
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from weavex_core.benchmarks.mock_vendor import MockVendor, MockVault, VendorProfile
+
+
+@dataclass
+class VendorEnv:
+    vendor:         MockVendor
+    vault:          MockVault
+    integration_id: str
+
+
+@pytest.fixture
+def execute_api_module():
+    """
+    The weavex_core.execute_api module, for monkeypatching its internals.
+    The package re-exports the execute_api function under the module's name,
+    so `from weavex_core import execute_api` yields the function instead.
+    """
+    return importlib.import_module("weavex_core.execute_api")
+
+
+@pytest.fixture
+def import_constant():
+    """
+    Reads a module-level constant as a fresh interpreter sees it under extra env
+    vars — for settings parsed once at import:
+
+        import_constant("weavex_core.api", "PASSTHROUGH_BATCH_SIZE", WEAVEX_PASSTHROUGH_BATCH_SIZE="10")
+    """
+    def read(module: str, name: str, **env: str):
+        script = f"import importlib; print(repr(getattr(importlib.import_module({module!r}), {name!r})))"
+        result = subprocess.run(
+            [sys.executable, "-c", script], env={**os.environ, **env}, capture_output=True, text=True, check=True
+        )
+        return ast.literal_eval(result.stdout)
+
+    return read
+
+
+@pytest.fixture
+def mock_vendor(monkeypatch):
+    """
+    Starts a local MockVendor + MockVault and points execute_api at the vault.
+
+        env = mock_vendor(VendorProfile(latency_ms=0, rate_429=0.2))
+        execute_api({}, env.integration_id, "GET", "/v1/employees")
+
+    Each call gets a fresh integration id, so credential, breaker and limiter
+    state never leaks between tests.
+    """
+    with ExitStack() as stack:
+        def start(profile: Optional[VendorProfile] = None) -> VendorEnv:
+            profile = profile or VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0)
+            vendor  = stack.enter_context(MockVendor(profile))
+            vault   = stack.enter_context(MockVault(vendor))
+            monkeypatch.setenv("WEAVEX_CONNECT_SERVER_URL", vault.url)
+            return VendorEnv(vendor, vault, f"wvx_sk_test_{time.monotonic_ns()}")
+
+        yield start
@@ -0,0 +1,100 @@
+# weavex_core/credential_store.py
+#
+# Node-local credential store shared by every worker process in a container.
+# Backs execute_api's in-process _CredentialCache so N workers hit the vault
+# once per integration instead of N times, and a token refreshed in one
+# process is seen by the others on their very next call.
+#
+# SQLite in WAL mode handles cross-process locking; put it on local disk or
+# tmpfs (e.g. /dev/shm), never on a network share. The file holds live
+# credentials, so it is created 0600 inside a 0700 directory.
+#
+# Enable with:
+#   WEAVEX_CREDENTIAL_CACHE_PATH=/dev/shm/weavex/credentials.db
+
+import os
+import sqlite3
+import logging
+import threading
+from typing import Optional
+
+from .json_codec import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS credentials (
+    integration_id TEXT PRIMARY KEY,
+    payload        TEXT NOT NULL,
+    fetched_at     REAL NOT NULL
+)
+"""
+
+
+class SqliteCredentialStore:
+    def __init__(self, path: str):
+        self._path  = path
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+
+    def get(self, integration_id: str) -> Optional[tuple[dict, float]]:
+        """Returns (credentials, fetched_at) or None."""
+        row = self._conn().execute(
+            "SELECT payload, fetched_at FROM credentials WHERE integration_id = ?",
+            (integration_id,)
+        ).fetchone()
+        if not row:
+            return None
+        return loads(row[0]), row[1]
+
+    def fetched_at(self, integration_id: str) -> Optional[float]:
+        """Cheap version check — lets a process notice another process's refresh."""
+        row = self._conn().execute(
+            "SELECT fetched_at FROM credentials WHERE integration_id = ?",
+            (integration_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, integration_id: str, credentials: dict, fetched_at: float) -> None:
+        # Last writer by fetch time wins, so a slow stale write cannot clobber a refresh.
+        self._conn().execute(
+            """
+            INSERT INTO credentials (integration_id, payload, fetched_at) VALUES (?, ?, ?)
+            ON CONFLICT(integration_id) DO UPDATE SET
+                payload    = excluded.payload,
+                fetched_at = excluded.fetched_at
+            WHERE excluded.fetched_at > credentials.fetched_at
+            """,
+            (integration_id, dumps(credentials), fetched_at)
+        )
+
+    def delete(self, integration_id: str) -> None:
+        self._conn().execute("DELETE FROM credentials WHERE integration_id = ?", (integration_id,))
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite connections must not cross threads or survive a fork.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self._path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        self._local.conn = conn
+        self._local.pid  = os.getpid()
+        return conn
+
+
+def shared_store_from_env() -> Optional[SqliteCredentialStore]:
+    path = os.environ.get("WEAVEX_CREDENTIAL_CACHE_PATH")
+    if not path:
+        return None
+    try:
+        return SqliteCredentialStore(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("shared credential cache disabled — cannot open %s: %s", path, e)
+        return None
@@ -14,19 +14,90 @@
 #   )
 #
 #   rows = result.body.get("employees") or []
+#
+#   # asyncio callers — same semantics, backoff never blocks the event loop
+#   result = await execute_api_async(context, integration_id, "GET", "/v1/employees/directory")
+#
+#   # reference data — revalidated with ETag / Last-Modified, 304s served from cache
+#   result = execute_api(context, integration_id, "GET", "/v1/meta/lists", cache=True)
+#
+#   # bounded total time — the deadline covers every attempt and backoff
+#   # (context["deadline"], epoch seconds, is honoured too)
+#   result = execute_api(context, integration_id, "GET", "/v1/employees/all",
+#                        retry=RetryConfig(deadline_seconds=120))
+#
+#   # large uploads — streamed from disk in chunks, the file is re-opened on retry
+#   result = execute_api(context, integration_id, "POST", "/v1/files",
+#                        body=Path("/tmp/export.csv"), content_type="text/csv")
+#
+#   # huge responses — items streamed one by one, memory stays flat
+#   for employee in execute_api_stream(context, integration_id, "GET", "/v1/employees/all",
+#                                      items_path="employees.item"):
+#       ...
 
 import os
+import sys
 import time
+import logging
 import hmac
 import hashlib
 import base64
 import json
+import copy
+import asyncio
+import dataclasses
+import random
+import sqlite3
 import threading
+import contextlib
+import contextvars
+from email.utils import parsedate_to_datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Iterator
 
 import httpx
 
+from .http_pool import get_vendor_client, get_async_vendor_client
+from .rate_limit import get_rate_limiter
+from .singleflight import SingleFlight, AsyncSingleFlight
+from .credential_store import SqliteCredentialStore, shared_store_from_env
+from .json_stream import iter_json_items
+from .json_codec import dumps_bytes, loads
+from .compression import compress_body
+from .upload import Upload, is_upload
+from .response_cache import ResponseCache, CACHEABLE_METHODS, get_response_cache
+from .circuit_breaker import BreakerTicket, get_circuit_breaker
+from .errors import WeavexError
+from .retry_budget import get_retry_budget
+
+
+# ── Tracing ───────────────────────────────────────────────────────────────────
+#
+# All request tracing goes through this logger and is formatted lazily, so a
+# disabled level costs one isEnabledFor check. Retries, refreshes and errors
+# log at INFO/WARNING; per-request lines (START/REQUEST/RESPONSE) at DEBUG.
+# Credential values and auth headers are never logged.
+#
+# WEAVEX_EXECUTE_API_DEBUG=true (off by default) enables DEBUG traces and, if the
+# host app has not configured logging, prints them to stdout.
+
+logger = logging.getLogger(__name__)
+
+
+def enable_debug_logging(enabled: bool = True) -> None:
+    """Turns per-request DEBUG traces on or off at runtime."""
+    logger.setLevel(logging.DEBUG if enabled else logging.NOTSET)
+    if enabled and not logger.handlers and not logging.getLogger().handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("[%(name)s] %(levelname)s %(message)s"))
+        logger.addHandler(handler)
+
+
+if os.environ.get("WEAVEX_EXECUTE_API_DEBUG", "").strip().lower() in ("1", "true", "yes", "on"):
+    enable_debug_logging()
+
 
 # ── Response ──────────────────────────────────────────────────────────────────
 
@@ -45,52 +116,318 @@ class ApiResponse:
 
 @dataclass
 class RetryConfig:
-    retry_on:            list[int] = field(default_factory=lambda: [429, 500, 502, 503, 504])
-    max_retries:         int       = 3
-    backoff_seconds:     float     = 2.0
-    respect_retry_after: bool      = True
+    retry_on:                list[int]       = field(default_factory=lambda: [429, 500, 502, 503, 504])
+    max_retries:             int             = 3
+    backoff_seconds:         float           = 2.0
+    respect_retry_after:     bool            = True
+    jitter:                  bool            = True    # full jitter: wait uniform(0, backoff)
+    max_backoff_seconds:     float           = 30.0
+    max_retry_after_seconds: float           = 60.0    # a longer Retry-After ends retrying
+    deadline_seconds:        Optional[float] = None    # total time across attempts and waits
 
 
 DEFAULT_RETRY = RetryConfig()
 
 
+class _RetryPlan:
+    """
+    Per-call retry bookkeeping: the call deadline, the process retry budget and
+    backoff. A wait that would overrun the deadline, or a retry the budget cannot
+    cover, ends retrying — the caller gets the last response or error instead.
+    The same goes for a rate-limit wait: a call is not held past its deadline.
+
+    The deadline is the earlier of retry.deadline_seconds from now and
+    context["deadline"] (epoch seconds, e.g. the Temporal activity's end).
+    A streaming body that cannot be re-read (replayable=False) is never retried.
+    """
+
+    def __init__(self, context: Any, retry: RetryConfig, replayable: bool = True):
+        self.retry      = retry
+        self.deadline   = _call_deadline(context, retry)
+        self.replayable = replayable
+        get_retry_budget().deposit()
+
+    def remaining(self) -> Optional[float]:
+        return None if self.deadline is None else self.deadline - time.time()
+
+    def fits(self, wait: float) -> bool:
+        """False when waiting `wait` seconds would reach the deadline."""
+        remaining = self.remaining()
+        return remaining is None or wait < remaining
+
+    def attempt_timeout(self, timeout: float) -> Optional[float]:
+        """Timeout for the next attempt, or None once the deadline has passed."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            return None
+        return min(timeout, remaining)
+
+    def backoff(self, attempt: int) -> Optional[float]:
+        """Wait before `attempt` after a timeout or network error, or None to stop."""
+        if attempt > self.retry.max_retries:
+            return None
+        wait = self._allow(_backoff_seconds(attempt, self.retry))
+        if wait is not None:
+            logger.info("backoff %.2fs before attempt %d", wait, attempt + 1)
+        return wait
+
+    def wait_for(self, response: ApiResponse, attempt: int) -> Optional[float]:
+        """Wait before retrying `response`, or None when it is final."""
+        if response.status_code not in self.retry.retry_on or attempt >= self.retry.max_retries:
+            return None
+        wait = _get_wait_time(response, attempt, self.retry)
+        return None if wait is None else self._allow(wait)
+
+    def _allow(self, wait: float) -> Optional[float]:
+        if not self.replayable:
+            logger.info("not retrying — the streaming request body cannot be sent again")
+            return None
+        if not self.fits(wait):
+            logger.info("not retrying — wait %.2fs exceeds the %.2fs left before the deadline", wait, self.remaining())
+            return None
+        if not get_retry_budget().withdraw():
+            logger.warning("not retrying — process retry budget exhausted")
+            return None
+        return wait
+
+
+def _call_deadline(context: Any, retry: RetryConfig) -> Optional[float]:
+    deadlines = []
+    if retry.deadline_seconds:
+        deadlines.append(time.time() + retry.deadline_seconds)
+    context_deadline = context.get("deadline") if isinstance(context, dict) else None
+    if context_deadline:
+        try:
+            deadlines.append(float(context_deadline))
+        except (TypeError, ValueError):
+            pass
+    return min(deadlines) if deadlines else None
+
+
 # ── Credential cache ──────────────────────────────────────────────────────────
 
 @dataclass
 class _CachedCredentials:
     credentials: dict
     fetched_at:  float
+    fresh_until: float      # jittered TTL — served as-is until then
+    stale_until: float      # served while a background refresh runs
+    checked_at:  float      # last look at the shared store for a newer entry
+
+
+@dataclass
+class CredentialCacheStats:
+    hits:        int
+    stale_hits:  int
+    misses:      int
+    coalesced:   int        # callers that waited on another caller's fetch
+    refreshes:   int        # loader calls (foreground + background)
+    evictions:   int        # LRU evictions
+    shared_hits: int        # entries adopted from the node-local shared store
+    size:        int
 
 
 class _CredentialCache:
-    def __init__(self, ttl_seconds: int = 300):
-        self._cache: dict[str, _CachedCredentials] = {}
-        self._lock:  threading.Lock                 = threading.Lock()
-        self._ttl:   int                            = ttl_seconds
+    """
+    LRU credential cache with stale-while-revalidate.
+
+    Fresh entries are returned directly. Entries past their (jittered) TTL but
+    inside the stale window are still returned while one background refresh
+    runs. Concurrent misses for the same integration share a single fetch.
+
+    With a shared store (WEAVEX_CREDENTIAL_CACHE_PATH) every write is published
+    to it, and reads adopt a newer entry written by another process. A fresh
+    local entry is checked against the store at most every shared_check_seconds;
+    a missing or stale one, and get() (the token refresh path), always check.
+    """
+
+    def __init__(
+            self,
+            ttl_seconds:          int                             = 300,
+            stale_seconds:        int                             = 120,
+            jitter:               float                           = 0.1,
+            max_size:             int                             = 1024,
+            shared:               Optional[SqliteCredentialStore] = None,
+            shared_check_seconds: float                           = 5.0
+    ):
+        self._cache:         OrderedDict[str, _CachedCredentials] = OrderedDict()
+        self._lock:          threading.Lock                        = threading.Lock()
+        self._ttl:           int                                   = ttl_seconds
+        self._stale:         int                                   = stale_seconds
+        self._jitter:        float                                 = jitter
+        self._max_size:      int                                   = max_size
+        self._flight:        SingleFlight                          = SingleFlight()
+        self._revalidating:  set[str]                              = set()
+        self._shared:        Optional[SqliteCredentialStore]       = shared
+        self._shared_check:  float                                 = shared_check_seconds
+        self._hits = self._stale_hits = self._misses = self._refreshes = self._evictions = 0
+        self._shared_hits = 0
 
     def get(self, integration_id: str) -> Optional[dict]:
+        """Latest known credentials (fresh or stale) without triggering a fetch."""
+        self._adopt_shared(integration_id, force=True)
         with self._lock:
             entry = self._cache.get(integration_id)
-            if not entry:
-                return None
-            if time.time() - entry.fetched_at > self._ttl:
-                del self._cache[integration_id]
+            if not entry or time.time() > entry.stale_until:
                 return None
             return entry.credentials
 
+    def lookup(self, integration_id: str, loader: Callable[[str], dict], check_shared: bool = True) -> Optional[dict]:
+        """
+        Non-fetching read: fresh or stale hit (scheduling revalidation), else None.
+        check_shared=False skips the shared store even when a check is due.
+        """
+        if check_shared:
+            self._adopt_shared(integration_id)
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(integration_id)
+            if not entry or now > entry.stale_until:
+                return None
+            self._cache.move_to_end(integration_id)
+            if now <= entry.fresh_until:
+                self._hits += 1
+                return entry.credentials
+            self._stale_hits += 1
+            schedule = integration_id not in self._revalidating
+            if schedule:
+                self._revalidating.add(integration_id)
+        if schedule:
+            _background.submit(self._revalidate, integration_id, loader)
+        return entry.credentials
+
+    def get_or_load(self, integration_id: str, loader: Callable[[str], dict]) -> dict:
+        cached = self.lookup(integration_id, loader)
+        if cached is not None:
+            return cached
+        with self._lock:
+            self._misses += 1
+        credentials, _ = self._flight.do(integration_id, self._load, integration_id, loader)
+        return credentials
+
     def set(self, integration_id: str, credentials: dict) -> None:
+        now = time.time()
         with self._lock:
-            self._cache[integration_id] = _CachedCredentials(
-                credentials = credentials,
-                fetched_at  = time.time()
-            )
+            self._store(integration_id, credentials, now)
+        self._publish(integration_id, credentials, now)
 
     def evict(self, integration_id: str) -> None:
         with self._lock:
             self._cache.pop(integration_id, None)
+        if self._shared is not None:
+            try:
+                self._shared.delete(integration_id)
+            except sqlite3.Error as e:
+                logger.warning("shared credential cache delete failed integration=%s error=%s", integration_id, e)
 
+    def stats(self) -> CredentialCacheStats:
+        with self._lock:
+            return CredentialCacheStats(
+                hits        = self._hits,
+                stale_hits  = self._stale_hits,
+                misses      = self._misses,
+                coalesced   = self._flight.shared_count,
+                refreshes   = self._refreshes,
+                evictions   = self._evictions,
+                shared_hits = self._shared_hits,
+                size        = len(self._cache)
+            )
 
-_cache = _CredentialCache(ttl_seconds=300)
+    def _load(self, integration_id: str, loader: Callable[[str], dict]) -> dict:
+        started     = time.time()
+        credentials = loader(integration_id)
+        with self._lock:
+            self._refreshes += 1
+            entry = self._cache.get(integration_id)
+            # A token refresh that landed while we were fetching is newer than
+            # what the vault returned when the fetch started — keep it.
+            if entry and entry.fetched_at > started:
+                return entry.credentials
+            fetched_at = time.time()
+            self._store(integration_id, credentials, fetched_at)
+        self._publish(integration_id, credentials, fetched_at)
+        return credentials
+
+    def _revalidate(self, integration_id: str, loader: Callable[[str], dict]) -> None:
+        try:
+            self._flight.do(integration_id, self._load, integration_id, loader)
+        except Exception as e:
+            logger.warning("background credential refresh failed integration=%s error=%s", integration_id, e)
+        finally:
+            with self._lock:
+                self._revalidating.discard(integration_id)
+
+    def shared_check_due(self, integration_id: str) -> bool:
+        """True when the next lookup will read the shared store."""
+        if self._shared is None:
+            return False
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(integration_id)
+            return entry is None or now > entry.fresh_until or now - entry.checked_at >= self._shared_check
+
+    def _adopt_shared(self, integration_id: str, force: bool = False) -> None:
+        """Pulls the shared entry when another process wrote a newer one."""
+        if self._shared is None or not (force or self.shared_check_due(integration_id)):
+            return
+        with self._lock:
+            entry    = self._cache.get(integration_id)
+            local_at = entry.fetched_at if entry else None
+            if entry is not None:
+                entry.checked_at = time.time()
+        try:
+            shared_at = self._shared.fetched_at(integration_id)
+            if shared_at is None or (local_at is not None and shared_at <= local_at):
+                return
+            row = self._shared.get(integration_id)
+        except sqlite3.Error as e:
+            logger.warning("shared credential cache read failed integration=%s error=%s", integration_id, e)
+            return
+        if row:
+            credentials, fetched_at = row
+            with self._lock:
+                self._store(integration_id, credentials, fetched_at)
+                self._shared_hits += 1
+
+    def _publish(self, integration_id: str, credentials: dict, fetched_at: float) -> None:
+        if self._shared is None:
+            return
+        try:
+            self._shared.put(integration_id, credentials, fetched_at)
+        except sqlite3.Error as e:
+            logger.warning("shared credential cache write failed integration=%s error=%s", integration_id, e)
+
+    def _store(self, integration_id: str, credentials: dict, now: float) -> None:
+        ttl = self._ttl * random.uniform(1.0 - self._jitter, 1.0)
+        self._cache[integration_id] = _CachedCredentials(
+            credentials = credentials,
+            fetched_at  = now,
+            fresh_until = now + ttl,
+            stale_until = now + ttl + self._stale,
+            checked_at  = time.time()
+        )
+        self._cache.move_to_end(integration_id)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
+    def _reset_after_fork(self) -> None:
+        self._lock         = threading.Lock()
+        self._revalidating = set()
+        self._flight.reset()
+
+
+# Background credential revalidation — small pool, never on the request path.
+_background = ThreadPoolExecutor(max_workers=4, thread_name_prefix="credential-refresh")
+
+_cache = _CredentialCache(ttl_seconds=300, shared=shared_store_from_env())
+
+
+def get_credential_cache_stats() -> CredentialCacheStats:
+    """Hit/stale/miss/refresh counters for the process-wide credential cache."""
+    return _cache.stats()
 
 
 # ── Connect server client ─────────────────────────────────────────────────────
@@ -108,7 +445,7 @@ def _fetch_credentials(integration_id: str) -> dict:
     Error specs and rate limit config are bundled into the response.
     """
     url = f"{_get_connect_server_url()}/api/vault/{integration_id}"
-    print(f"[execute_api] fetching credentials for {integration_id} from {url}", flush=True)
+    logger.debug("fetching credentials integration=%s url=%s", integration_id, url)
 
     with httpx.Client(timeout=10) as client:
         response = client.get(url)
@@ -128,14 +465,17 @@ def _fetch_credentials(integration_id: str) -> dict:
     credentials = data.get("credentials", data)
     credentials["__errorSpecs"]    = data.get("errorSpecs", [])
     credentials["__rateLimitSpec"] = data.get("rateLimitSpec", {})
-
-    print(
-        f"[execute_api] credentials fetched for {integration_id}: "
-        f"authType={credentials.get('authType')} "
-        f"hasBaseUrl={bool(credentials.get('baseUrl'))} "
-        f"errorSpecs={len(credentials['__errorSpecs'])} "
-        f"hasRateLimit={bool(credentials['__rateLimitSpec'])}",
-        flush=True
+    credentials["__paginationSpec"] = data.get("paginationSpec", {})
+    credentials["__compressionSpec"] = data.get("compressionSpec", {})
+    credentials["__batchSpecs"]      = data.get("batchSpecs", [])
+
+    logger.info(
+        "credentials fetched integration=%s authType=%s hasBaseUrl=%s errorSpecs=%d hasRateLimit=%s",
+        integration_id,
+        credentials.get("authType"),
+        bool(credentials.get("baseUrl")),
+        len(credentials["__errorSpecs"]),
+        bool(credentials["__rateLimitSpec"])
     )
     return credentials
 
@@ -145,19 +485,40 @@ def _update_credentials(integration_id: str, credentials: dict) -> None:
     with httpx.Client(timeout=10) as client:
         response = client.put(url, json=credentials)
     if response.status_code not in (200, 204):
-        print(
-            f"WARN: failed to update credentials for '{integration_id}': "
-            f"{response.status_code}",
-            flush=True
+        logger.warning(
+            "failed to update credentials integration=%s status=%d",
+            integration_id, response.status_code
         )
 
 
-def _build_retry_config(error_specs: dict) -> RetryConfig:
+# Vault write-backs run on a single background worker so a token refresh never
+# waits on the PUT. One worker keeps writes for an integration in order.
+_vault_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vault-writeback")
+
+
+def _update_credentials_in_background(integration_id: str, credentials: dict) -> None:
+    def _write():
+        try:
+            _update_credentials(integration_id, credentials)
+        except Exception as e:
+            logger.warning("failed to update credentials integration=%s error=%s", integration_id, e)
+    _vault_writer.submit(_write)
+
+
+def _reset_workers_after_fork() -> None:
+    # The parent's worker threads do not exist in the child.
+    global _vault_writer, _background
+    _vault_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vault-writeback")
+    _background   = ThreadPoolExecutor(max_workers=4, thread_name_prefix="credential-refresh")
+
+
+def _build_retry_config(error_specs: dict, base: RetryConfig = DEFAULT_RETRY) -> RetryConfig:
+    """Skill error specs decide what is retried; caps, jitter and deadline come from `base`."""
     specs      = error_specs.get("errorSpecs", [])
     rate_limit = error_specs.get("rateLimitSpec", {})
 
     if not specs:
-        return DEFAULT_RETRY
+        return base
 
     retryable_codes    = [s["statusCode"] for s in specs if s.get("retryable", False)]
     backoff_ms         = next(
@@ -166,7 +527,8 @@ def _build_retry_config(error_specs: dict) -> RetryConfig:
     )
     retry_after_header = rate_limit.get("retryAfterHeader")
 
-    return RetryConfig(
+    return dataclasses.replace(
+        base,
         retry_on             = retryable_codes or [429, 500, 502, 503, 504],
         max_retries          = 3,
         backoff_seconds      = (backoff_ms / 1000.0) if backoff_ms else 2.0,
@@ -175,15 +537,45 @@ def _build_retry_config(error_specs: dict) -> RetryConfig:
 
 
 def _get_credentials(integration_id: str, force_refresh: bool = False) -> dict:
-    if not force_refresh:
-        cached = _cache.get(integration_id)
-        if cached:
-            print(f"[execute_api] using cached credentials for {integration_id}", flush=True)
-            return cached
+    if force_refresh:
+        credentials = _fetch_credentials(integration_id)
+        _cache.set(integration_id, credentials)
+        return credentials
+    return _cache.get_or_load(integration_id, _fetch_credentials)
+
+
+# ── Client-side rate limiting ────────────────────────────────────────────────
+
+def _reserve_capacity(integration_id: str, rate_limit: dict) -> float:
+    """Seconds to wait before the next call so the integration stays within its rateLimitSpec."""
+    limiter = get_rate_limiter(integration_id, rate_limit)
+    if limiter is None:
+        return 0.0
+    wait = limiter.reserve()
+    if wait > 0:
+        logger.info("rate limit wait integration=%s wait=%.2fs", integration_id, wait)
+    return wait
+
+
+def _observe_rate_limit(integration_id: str, rate_limit: dict, headers: dict) -> None:
+    limiter = get_rate_limiter(integration_id, rate_limit)
+    if limiter is not None:
+        limiter.observe(headers)
 
-    credentials = _fetch_credentials(integration_id)
-    _cache.set(integration_id, credentials)
-    return credentials
+
+def _pause_rate_limit(integration_id: str, rate_limit: dict, seconds: float) -> None:
+    # A 429 means the vendor quota is spent for everyone, not just this call.
+    limiter = get_rate_limiter(integration_id, rate_limit)
+    if limiter is not None:
+        limiter.pause(seconds)
+
+
+async def _rate_limit_async(fn: Callable, integration_id: str, rate_limit: dict, *args) -> Any:
+    """Runs one of the helpers above — in a worker thread when the bucket blocks on a file lock."""
+    limiter = get_rate_limiter(integration_id, rate_limit)
+    if limiter is not None and limiter.blocking:
+        return await asyncio.to_thread(fn, integration_id, rate_limit, *args)
+    return fn(integration_id, rate_limit, *args)
 
 
 # ── Auth header builders ──────────────────────────────────────────────────────
@@ -254,7 +646,7 @@ def _refresh_oauth_token(integration_id: str, credentials: dict) -> dict:
             client_id     = oauth_app.get("clientId", "")
             client_secret = oauth_app.get("clientSecret", "")
         except Exception as e:
-            print(f"[refresh] could not read oauth_app vault: {e}", flush=True)
+            logger.warning("could not read oauth_app vault integration=%s error=%s", integration_id, e)
 
     if not all([refresh_token, token_url, client_id, client_secret]):
         raise RuntimeError(
@@ -262,7 +654,7 @@ def _refresh_oauth_token(integration_id: str, credentials: dict) -> dict:
             f"missing refreshToken, tokenUrl, clientId, or clientSecret"
         )
 
-    print(f"[execute_api] refreshing OAuth token for {integration_id}", flush=True)
+    logger.info("refreshing OAuth token integration=%s", integration_id)
 
     refresh_params = {
         "grant_type":    "refresh_token",
@@ -276,7 +668,7 @@ def _refresh_oauth_token(integration_id: str, credentials: dict) -> dict:
 
         # if form body fails, retry with query params (some APIs like Zoho prefer this)
         if response.status_code != 200:
-            print(f"[refresh] form body failed ({response.status_code}), retrying with query params", flush=True)
+            logger.info("token refresh form body failed status=%d — retrying with query params", response.status_code)
             response = client.post(token_url, params=refresh_params)
 
     if response.status_code != 200:
@@ -294,8 +686,8 @@ def _refresh_oauth_token(integration_id: str, credentials: dict) -> dict:
     if "expires_in" in tokens:
         updated["expiresAt"] = int(time.time() * 1000) + tokens["expires_in"] * 1000
 
-    _update_credentials(integration_id, updated)
     _cache.set(integration_id, updated)
+    _update_credentials_in_background(integration_id, updated)
     return updated
 
 
@@ -307,7 +699,7 @@ def _refresh_client_credentials_token(integration_id: str, credentials: dict) ->
     if not all([token_url, client_id, client_secret]):
         raise RuntimeError(f"Cannot refresh — missing tokenUrl, clientId, or clientSecret")
 
-    print(f"[execute_api] refreshing client credentials token for {integration_id}", flush=True)
+    logger.info("refreshing client credentials token integration=%s", integration_id)
 
     refresh_params = {
         "grant_type":    "client_credentials",
@@ -319,7 +711,7 @@ def _refresh_client_credentials_token(integration_id: str, credentials: dict) ->
         response = client.post(token_url, data=refresh_params)
 
         if response.status_code != 200:
-            print(f"[refresh] form body failed ({response.status_code}), retrying with query params", flush=True)
+            logger.info("token refresh form body failed status=%d — retrying with query params", response.status_code)
             response = client.post(token_url, params=refresh_params)
 
     if response.status_code != 200:
@@ -333,12 +725,81 @@ def _refresh_client_credentials_token(integration_id: str, credentials: dict) ->
     if "expires_in" in tokens:
         updated["expiresAt"] = int(time.time() * 1000) + tokens["expires_in"] * 1000
 
-    _update_credentials(integration_id, updated)
     _cache.set(integration_id, updated)
-    print(f"[execute_api] client credentials token refreshed for {integration_id}", flush=True)
+    _update_credentials_in_background(integration_id, updated)
+    logger.info("client credentials token refreshed integration=%s", integration_id)
     return updated
 
 
+# ── Single-flight refresh ─────────────────────────────────────────────────────
+
+OAUTH_AUTH_TYPES = ("oauth2", "oauth2_authorization_code", "oauth2_client_credentials")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Refresh this many seconds before expiresAt so in-flight calls never carry a dead token.
+TOKEN_REFRESH_MARGIN_SECONDS = _env_int("WEAVEX_TOKEN_REFRESH_MARGIN_SECONDS", 60)
+
+_refresh_flight = SingleFlight()
+
+
+def _token_expiring(credentials: dict) -> bool:
+    if credentials.get("authType") not in OAUTH_AUTH_TYPES:
+        return False
+    expires_at = credentials.get("expiresAt")
+    if not expires_at:
+        return False
+    try:
+        return float(expires_at) / 1000.0 - time.time() < TOKEN_REFRESH_MARGIN_SECONDS
+    except (TypeError, ValueError):
+        return False
+
+
+def _refresh_token_once(integration_id: str, credentials: dict) -> dict:
+    """
+    Refreshes the OAuth token with at most one refresh in flight per integration.
+    Concurrent callers wait for and share the leader's result. A caller arriving
+    after another refresh already replaced its token reuses that token instead
+    of refreshing again (some providers revoke the previous refresh token).
+    """
+    stale_token = credentials.get("accessToken")
+
+    def _refresh() -> dict:
+        current = _cache.get(integration_id) or credentials
+        if current.get("accessToken") != stale_token and not _token_expiring(current):
+            logger.info("token already refreshed — reusing integration=%s", integration_id)
+            return current
+        return _refresh_oauth_token(integration_id, current)
+
+    refreshed, shared = _refresh_flight.do(integration_id, _refresh)
+    if shared:
+        logger.info("joined in-flight token refresh integration=%s", integration_id)
+    return refreshed
+
+
+def _ensure_fresh_token(integration_id: str, credentials: dict) -> dict:
+    """Proactive refresh ahead of expiresAt. Falls back to current credentials on failure."""
+    if not _token_expiring(credentials):
+        return credentials
+    try:
+        return _refresh_token_once(integration_id, credentials)
+    except RuntimeError as e:
+        logger.warning("proactive token refresh failed integration=%s error=%s", integration_id, e)
+        return credentials
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_flight.reset)
+    os.register_at_fork(after_in_child=_reset_workers_after_fork)
+    os.register_at_fork(after_in_child=_cache._reset_after_fork)
+
+
 def _decode_integration_id(integration_id: str) -> tuple[str, str, str]:
     """Returns (account_id, customer_id, app_id)."""
     try:
@@ -366,7 +827,7 @@ def _fetch_oauth_app(account_id: str, skill_id: str) -> dict:
         if response.status_code == 200:
             return response.json()
     except Exception as e:
-        print(f"[refresh] failed to fetch oauth_app: {e}", flush=True)
+        logger.warning("failed to fetch oauth_app account=%s skill=%s error=%s", account_id, skill_id, e)
     return {}
 
 # ── URL builder ───────────────────────────────────────────────────────────────
@@ -388,6 +849,119 @@ def _build_url(credentials: dict, path: str) -> str:
     return base_url + "/" + path.lstrip("/")
 
 
+# ── Circuit breaker ───────────────────────────────────────────────────────────
+
+def _admit(integration_id: str, credentials: dict) -> Optional[BreakerTicket]:
+    """Returns a ticket from the vendor host's breaker, or raises while it is open."""
+    breaker = get_circuit_breaker(integration_id, credentials.get("baseUrl"))
+    if breaker is None:
+        return None
+    ticket = breaker.admit()
+    if ticket is not None:
+        return ticket
+    state = breaker.snapshot()
+    logger.debug("circuit open integration=%s host=%s retry_in=%.1fs", integration_id, state.host, state.retry_in_seconds)
+    raise WeavexError(
+        error_type = "connector_server_error",
+        connector  = integration_id,
+        step       = "execute_api",
+        detail     = {"circuit_breaker": state.to_dict()},
+        raw_error  = f"Circuit open for {state.host} — failing fast for {state.retry_in_seconds:.0f}s"
+    )
+
+
+def _record_status(ticket: Optional[BreakerTicket], status_code: int) -> None:
+    if ticket is not None:
+        ticket.record_status(status_code)
+    _notify_attempt(status_code)
+
+
+def _record_failure(ticket: Optional[BreakerTicket]) -> None:
+    if ticket is not None:
+        ticket.record_failure()
+    _notify_attempt(None)
+
+
+# ── Attempt observers ─────────────────────────────────────────────────────────
+#
+# Callers that pace their own traffic (execute_api_many with concurrency="auto")
+# need every attempt's outcome, not just the final response: a 429 absorbed by
+# a retry is still a signal to slow down.
+
+_attempt_observer: contextvars.ContextVar[Optional[Callable[[Optional[int]], None]]] = \
+    contextvars.ContextVar("weavex_attempt_observer", default=None)
+
+
+@contextlib.contextmanager
+def observe_attempts(callback: Callable[[Optional[int]], None]) -> Iterator[None]:
+    """
+    Calls callback(status_code) after every attempt made by execute_api calls in
+    this context — None for a timeout or network error. Retried attempts included.
+    """
+    token = _attempt_observer.set(callback)
+    try:
+        yield
+    finally:
+        _attempt_observer.reset(token)
+
+
+def _notify_attempt(status_code: Optional[int]) -> None:
+    callback = _attempt_observer.get()
+    if callback is not None:
+        callback(status_code)
+
+
+# ── In-flight deduplication ───────────────────────────────────────────────────
+
+DEDUP_METHODS = ("GET", "HEAD")
+
+# WEAVEX_EXECUTE_API_DEDUP=false turns coalescing off (e.g. endpoints with side effects on GET).
+DEDUP_ENABLED = os.environ.get("WEAVEX_EXECUTE_API_DEDUP", "true").strip().lower() not in ("0", "false", "no", "off")
+
+_request_flight       = SingleFlight()
+_async_request_flight = AsyncSingleFlight()
+
+
+@dataclass
+class RequestDedupStats:
+    coalesced:       int      # sync callers that attached to an in-flight request
+    coalesced_async: int      # same, for execute_api_async
+
+
+def get_request_dedup_stats() -> RequestDedupStats:
+    return RequestDedupStats(
+        coalesced       = _request_flight.shared_count,
+        coalesced_async = _async_request_flight.shared_count
+    )
+
+
+def _dedup_key(
+        integration_id: str,
+        method:         str,
+        path:           str,
+        headers:        Optional[dict],
+        body:           Any
+) -> Optional[tuple]:
+    if not DEDUP_ENABLED or body is not None or method.upper() not in DEDUP_METHODS:
+        return None
+    varying = tuple(sorted((k.lower(), str(v)) for k, v in (headers or {}).items()))
+    return integration_id, method.upper(), path, varying
+
+
+def _copy_response(response: ApiResponse) -> ApiResponse:
+    """Followers get their own copy so one caller mutating the body cannot affect another."""
+    return ApiResponse(
+        status_code = response.status_code,
+        body        = copy.deepcopy(response.body),
+        headers     = dict(response.headers)
+    )
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_request_flight.reset)
+    os.register_at_fork(after_in_child=_async_request_flight.reset)
+
+
 # ── Core execution ────────────────────────────────────────────────────────────
 
 def execute_api(
@@ -399,23 +973,78 @@ def execute_api(
         body:           Optional[Any]  = None,
         content_type:   str            = "application/json",
         timeout:        int            = 30,
-        retry:          RetryConfig    = DEFAULT_RETRY
+        retry:          RetryConfig    = DEFAULT_RETRY,
+        cache:          bool           = False,
+        files:          Optional[Any]  = None
 ) -> ApiResponse:
     """
     Executes an API call for a connected integration.
+
+    body may also be a file object, a Path, an iterator of bytes or a factory
+    returning one — it is streamed, never read into memory. files= sends
+    multipart/form-data with body (a dict) as the form fields. See upload.py.
+
+    cache=True (GET/HEAD only) revalidates against the conditional response
+    cache: a stored ETag / Last-Modified is sent and a 304 returns the stored
+    response. See response_cache.py.
+
+    Identical concurrent GET/HEAD calls (same integration, method, path and
+    headers) are coalesced: one request goes out and every caller gets the
+    response. The first caller's timeout and retry settings apply.
     """
-    print(f"[execute_api] START {method} {path} integration={integration_id}", flush=True)
+    if is_upload(body, files):
+        with Upload(body, files) as upload:
+            return _execute_api(context, integration_id, method, path, headers, upload, content_type, timeout, retry, cache)
+    key = _dedup_key(integration_id, method, path, headers, body)
+    if key is None:
+        return _execute_api(context, integration_id, method, path, headers, body, content_type, timeout, retry, cache)
+    response, shared = _request_flight.do(
+        key, _execute_api, context, integration_id, method, path, headers, body, content_type, timeout, retry, cache
+    )
+    return _copy_response(response) if shared else response
+
 
-    credentials = _get_credentials(integration_id)
+def _execute_api(
+        context:        Any,
+        integration_id: str,
+        method:         str,
+        path:           str,
+        headers:        Optional[dict],
+        body:           Optional[Any],
+        content_type:   str,
+        timeout:        int,
+        retry:          RetryConfig,
+        cache:          bool
+) -> ApiResponse:
+    logger.debug("START %s %s integration=%s", method, path, integration_id)
+
+    credentials = _ensure_fresh_token(integration_id, _get_credentials(integration_id))
     error_specs = credentials.get("__errorSpecs", [])
     rate_limit  = credentials.get("__rateLimitSpec", {})
     skill_specs = {"errorSpecs": error_specs, "rateLimitSpec": rate_limit}
-    retry       = _build_retry_config(skill_specs) if error_specs else retry
+    retry       = _build_retry_config(skill_specs, retry) if error_specs else retry
+    plan        = _RetryPlan(context, retry, replayable=not isinstance(body, Upload) or body.replayable)
+    cache_store = _response_cache_for(cache, method)
 
     attempt    = 0
     last_error = None
 
     while attempt <= retry.max_retries:
+        if plan.attempt_timeout(timeout) is None:
+            last_error = f"deadline exceeded ({last_error or 'no attempt made'})"
+            break
+        ticket  = _admit(integration_id, credentials)
+        wait    = _reserve_capacity(integration_id, rate_limit)
+        if wait > 0:
+            if not plan.fits(wait):
+                last_error = f"deadline exceeded (rate limit wait {wait:.2f}s)"
+                break
+            time.sleep(wait)
+        attempt_timeout = plan.attempt_timeout(timeout)
+        if attempt_timeout is None:
+            last_error = f"deadline exceeded ({last_error or 'no attempt made'})"
+            break
+
         try:
             response = _execute_once(
                 integration_id = integration_id,
@@ -425,100 +1054,426 @@ def execute_api(
                 extra_headers  = headers or {},
                 body           = body,
                 content_type   = content_type,
-                timeout        = timeout
+                timeout        = attempt_timeout,
+                cache          = cache_store
             )
         except httpx.TimeoutException:
-            last_error = f"Request timed out after {timeout}s"
-            print(f"[execute_api] TIMEOUT attempt={attempt+1} {method} {path}", flush=True)
+            _record_failure(ticket)
+            last_error = f"Request timed out after {attempt_timeout:g}s"
+            logger.warning("TIMEOUT attempt=%d %s %s integration=%s", attempt + 1, method, path, integration_id)
             attempt += 1
-            if attempt <= retry.max_retries:
-                _backoff(attempt, retry.backoff_seconds)
+            wait     = plan.backoff(attempt)
+            if wait is None:
+                break
+            time.sleep(wait)
             continue
         except httpx.RequestError as e:
+            _record_failure(ticket)
             last_error = f"Network error: {e}"
-            print(f"[execute_api] NETWORK ERROR attempt={attempt+1} {method} {path}: {e}", flush=True)
+            logger.warning("NETWORK ERROR attempt=%d %s %s integration=%s error=%s", attempt + 1, method, path, integration_id, e)
             attempt += 1
-            if attempt <= retry.max_retries:
-                _backoff(attempt, retry.backoff_seconds)
+            wait     = plan.backoff(attempt)
+            if wait is None:
+                break
+            time.sleep(wait)
             continue
 
-        print(
-            f"[execute_api] RESPONSE {response.status_code} "
-            f"{method} {path} attempt={attempt+1}",
-            flush=True
-        )
+        logger.debug("RESPONSE %d %s %s attempt=%d", response.status_code, method, path, attempt + 1)
+        _record_status(ticket, response.status_code)
+        _observe_rate_limit(integration_id, rate_limit, response.headers)
 
         # ── handle auth errors ────────────────────────────────────────────────
         if response.status_code == 401:
-            if attempt == 0 and credentials.get("authType") in ("oauth2", "oauth2_authorization_code", "oauth2_client_credentials"):
-                print(f"[execute_api] 401 on {integration_id} — attempting token refresh", flush=True)
-                try:
-                    credentials = _refresh_oauth_token(integration_id, credentials)
-                    attempt    += 1
-                    continue
-                except RuntimeError as e:
-                    raise RuntimeError(
-                        f"Auth failed for '{integration_id}' and token refresh failed: {e}"
-                    )
-            elif attempt == 0:
-                print(f"[execute_api] 401 on {integration_id} — refetching credentials", flush=True)
-                _cache.evict(integration_id)
-                try:
-                    credentials = _get_credentials(integration_id, force_refresh=True)
-                    attempt    += 1
-                    continue
-                except RuntimeError:
-                    pass
-            raise RuntimeError(
-                f"Authentication failed for '{integration_id}' "
-                f"(status 401) — check credentials in connect"
-            )
+            credentials = _recover_from_401(integration_id, credentials, attempt, plan.replayable)
+            attempt    += 1
+            continue
 
         # ── handle retryable errors ───────────────────────────────────────────
-        if response.status_code in retry.retry_on and attempt < retry.max_retries:
-            wait = _get_wait_time(response, attempt, retry)
-            print(
-                f"[execute_api] RETRY {response.status_code} attempt={attempt+1} "
-                f"for {integration_id} — waiting {wait}s",
-                flush=True
+        wait = plan.wait_for(response, attempt)
+        if wait is not None:
+            logger.info(
+                "RETRY %d attempt=%d integration=%s wait=%.2fs",
+                response.status_code, attempt + 1, integration_id, wait
             )
+            if response.status_code == 429:
+                _pause_rate_limit(integration_id, rate_limit, wait)
             time.sleep(wait)
             attempt += 1
             continue
 
         # ── non-retryable error — log with error spec meaning if available ────
         if not response.ok:
-            spec = next(
-                (s for s in error_specs if s["statusCode"] == response.status_code),
-                None
+            _log_error_spec(integration_id, response, error_specs)
+
+        return response
+
+    raise RuntimeError(
+        f"execute_api failed for '{integration_id}' after "
+        f"{attempt} attempt(s): {last_error}"
+    )
+
+
+def _recover_from_401(integration_id: str, credentials: dict, attempt: int, replayable: bool = True) -> dict:
+    """
+    Returns credentials to retry with after a 401, or raises when the 401 is final.
+    It always is for a streamed body that cannot be sent again.
+    """
+    if not replayable:
+        logger.info("401 — streamed body cannot be replayed integration=%s", integration_id)
+        _cache.evict(integration_id)
+    elif attempt == 0 and credentials.get("authType") in OAUTH_AUTH_TYPES:
+        logger.info("401 — attempting token refresh integration=%s", integration_id)
+        try:
+            return _refresh_token_once(integration_id, credentials)
+        except RuntimeError as e:
+            raise RuntimeError(
+                f"Auth failed for '{integration_id}' and token refresh failed: {e}"
+            )
+    elif attempt == 0:
+        logger.info("401 — refetching credentials integration=%s", integration_id)
+        _cache.evict(integration_id)
+        try:
+            return _get_credentials(integration_id, force_refresh=True)
+        except RuntimeError:
+            pass
+    raise RuntimeError(
+        f"Authentication failed for '{integration_id}' "
+        f"(status 401) — check credentials in connect"
+    )
+
+
+# ── Streaming execution ───────────────────────────────────────────────────────
+
+def execute_api_stream(
+        context:        Any,
+        integration_id: str,
+        method:         str,
+        path:           str,
+        items_path:     str,
+        headers:        Optional[dict] = None,
+        body:           Optional[Any]  = None,
+        content_type:   str            = "application/json",
+        timeout:        int            = 30,
+        retry:          RetryConfig    = DEFAULT_RETRY,
+        chunk_size:     int            = 65536,
+        files:          Optional[Any]  = None
+) -> Iterator[Any]:
+    """
+    Streams the JSON values under `items_path` (ijson prefix, e.g. "employees.item")
+    straight from the socket, keeping memory flat regardless of response size.
+
+    Failures before the first item is yielded are retried exactly like
+    execute_api. Once items have been yielded the call cannot be replayed
+    transparently, so a later network error raises RuntimeError.
+    A non-2xx final response raises RuntimeError with the status and body.
+    body and files take the same streamed uploads as execute_api.
+    """
+    if is_upload(body, files):
+        with Upload(body, files) as upload:
+            yield from _execute_api_stream(
+                context, integration_id, method, path, items_path, headers, upload, content_type, timeout, retry, chunk_size
+            )
+        return
+    yield from _execute_api_stream(
+        context, integration_id, method, path, items_path, headers, body, content_type, timeout, retry, chunk_size
+    )
+
+
+def _execute_api_stream(
+        context:        Any,
+        integration_id: str,
+        method:         str,
+        path:           str,
+        items_path:     str,
+        headers:        Optional[dict],
+        body:           Optional[Any],
+        content_type:   str,
+        timeout:        int,
+        retry:          RetryConfig,
+        chunk_size:     int
+) -> Iterator[Any]:
+    logger.debug("START stream %s %s integration=%s", method, path, integration_id)
+
+    credentials = _ensure_fresh_token(integration_id, _get_credentials(integration_id))
+    error_specs = credentials.get("__errorSpecs", [])
+    rate_limit  = credentials.get("__rateLimitSpec", {})
+    skill_specs = {"errorSpecs": error_specs, "rateLimitSpec": rate_limit}
+    retry       = _build_retry_config(skill_specs, retry) if error_specs else retry
+    plan        = _RetryPlan(context, retry, replayable=not isinstance(body, Upload) or body.replayable)
+
+    attempt    = 0
+    last_error = None
+
+    while attempt <= retry.max_retries:
+        if plan.attempt_timeout(timeout) is None:
+            last_error = f"deadline exceeded ({last_error or 'no attempt made'})"
+            break
+        ticket  = _admit(integration_id, credentials)
+        wait    = _reserve_capacity(integration_id, rate_limit)
+        if wait > 0:
+            if not plan.fits(wait):
+                last_error = f"deadline exceeded (rate limit wait {wait:.2f}s)"
+                break
+            time.sleep(wait)
+        attempt_timeout = plan.attempt_timeout(timeout)
+        if attempt_timeout is None:
+            last_error = f"deadline exceeded ({last_error or 'no attempt made'})"
+            break
+
+        yielded  = False
+        recorded = False     # a 2xx is the attempt's outcome even if the body breaks off later
+        try:
+            request = _prepare_request(credentials, method, path, headers or {}, body, content_type)
+            client  = get_vendor_client(credentials["baseUrl"])
+            with client.stream(**request, timeout=attempt_timeout) as stream:
+                if 200 <= stream.status_code < 300:
+                    _record_status(ticket, stream.status_code)
+                    recorded = True
+                    _observe_rate_limit(integration_id, rate_limit, stream.headers)
+                    for item in iter_json_items(stream.iter_bytes(chunk_size), items_path):
+                        yielded = True
+                        yield item
+                    return
+                stream.read()
+                response = _to_api_response(stream)
+        except httpx.TimeoutException:
+            if not recorded:
+                _record_failure(ticket)
+            if yielded:
+                raise RuntimeError(f"execute_api_stream timed out mid-stream for '{integration_id}' after {timeout}s")
+            last_error = f"Request timed out after {attempt_timeout:g}s"
+            logger.warning("TIMEOUT attempt=%d %s %s integration=%s", attempt + 1, method, path, integration_id)
+            attempt += 1
+            wait     = plan.backoff(attempt)
+            if wait is None:
+                break
+            time.sleep(wait)
+            continue
+        except httpx.RequestError as e:
+            if not recorded:
+                _record_failure(ticket)
+            if yielded:
+                raise RuntimeError(f"execute_api_stream interrupted mid-stream for '{integration_id}': {e}")
+            last_error = f"Network error: {e}"
+            logger.warning("NETWORK ERROR attempt=%d %s %s integration=%s error=%s", attempt + 1, method, path, integration_id, e)
+            attempt += 1
+            wait     = plan.backoff(attempt)
+            if wait is None:
+                break
+            time.sleep(wait)
+            continue
+
+        logger.debug("RESPONSE %d %s %s attempt=%d", response.status_code, method, path, attempt + 1)
+        _record_status(ticket, response.status_code)
+        _observe_rate_limit(integration_id, rate_limit, response.headers)
+
+        if response.status_code == 401:
+            credentials = _recover_from_401(integration_id, credentials, attempt, plan.replayable)
+            attempt    += 1
+            continue
+
+        wait = plan.wait_for(response, attempt)
+        if wait is not None:
+            logger.info(
+                "RETRY %d attempt=%d integration=%s wait=%.2fs",
+                response.status_code, attempt + 1, integration_id, wait
+            )
+            if response.status_code == 429:
+                _pause_rate_limit(integration_id, rate_limit, wait)
+            time.sleep(wait)
+            attempt += 1
+            continue
+
+        _log_error_spec(integration_id, response, error_specs)
+        raise RuntimeError(
+            f"execute_api_stream {method} {path} failed for '{integration_id}': "
+            f"{response.status_code} — {str(response.body)[:200]}"
+        )
+
+    raise RuntimeError(
+        f"execute_api failed for '{integration_id}' after "
+        f"{attempt} attempt(s): {last_error}"
+    )
+
+
+# ── Async execution ───────────────────────────────────────────────────────────
+
+async def execute_api_async(
+        context:        Any,
+        integration_id: str,
+        method:         str,
+        path:           str,
+        headers:        Optional[dict] = None,
+        body:           Optional[Any]  = None,
+        content_type:   str            = "application/json",
+        timeout:        int            = 30,
+        retry:          RetryConfig    = DEFAULT_RETRY,
+        cache:          bool           = False,
+        files:          Optional[Any]  = None
+) -> ApiResponse:
+    """
+    asyncio variant of execute_api with identical retry, refresh, caching, coalescing,
+    streaming upload and logging semantics. Vault and token-refresh calls run in a
+    worker thread; backoff uses asyncio.sleep. body may also be an async iterator.
+    """
+    if is_upload(body, files):
+        with Upload(body, files, asynchronous=True) as upload:
+            return await _execute_api_async(
+                context, integration_id, method, path, headers, upload, content_type, timeout, retry, cache
+            )
+    key = _dedup_key(integration_id, method, path, headers, body)
+    if key is None:
+        return await _execute_api_async(
+            context, integration_id, method, path, headers, body, content_type, timeout, retry, cache
+        )
+    response, shared = await _async_request_flight.do(
+        key, _execute_api_async, context, integration_id, method, path, headers, body, content_type, timeout, retry, cache
+    )
+    return _copy_response(response) if shared else response
+
+
+async def _execute_api_async(
+        context:        Any,
+        integration_id: str,
+        method:         str,
+        path:           str,
+        headers:        Optional[dict],
+        body:           Optional[Any],
+        content_type:   str,
+        timeout:        int,
+        retry:          RetryConfig,
+        cache:          bool
+) -> ApiResponse:
+    logger.debug("START async %s %s integration=%s", method, path, integration_id)
+
+    credentials = await _get_credentials_async(integration_id)
+    if _token_expiring(credentials):
+        credentials = await asyncio.to_thread(_ensure_fresh_token, integration_id, credentials)
+    error_specs = credentials.get("__errorSpecs", [])
+    rate_limit  = credentials.get("__rateLimitSpec", {})
+    skill_specs = {"errorSpecs": error_specs, "rateLimitSpec": rate_limit}
+    retry       = _build_retry_config(skill_specs, retry) if error_specs else retry
+    plan        = _RetryPlan(context, retry, replayable=not isinstance(body, Upload) or body.replayable)
+    cache_store = _response_cache_for(cache, method)
+
+    attempt    = 0
+    last_error = None
+
+    while attempt <= retry.max_retries:
+        if plan.attempt_timeout(timeout) is None:
+            last_error = f"deadline exceeded ({last_error or 'no attempt made'})"
+            break
+        ticket  = _admit(integration_id, credentials)
+        wait    = await _rate_limit_async(_reserve_capacity, integration_id, rate_limit)
+        if wait > 0:
+            if not plan.fits(wait):
+                last_error = f"deadline exceeded (rate limit wait {wait:.2f}s)"
+                break
+            await asyncio.sleep(wait)
+        attempt_timeout = plan.attempt_timeout(timeout)
+        if attempt_timeout is None:
+            last_error = f"deadline exceeded ({last_error or 'no attempt made'})"
+            break
+
+        try:
+            response = await _execute_once_async(
+                integration_id = integration_id,
+                credentials    = credentials,
+                method         = method,
+                path           = path,
+                extra_headers  = headers or {},
+                body           = body,
+                content_type   = content_type,
+                timeout        = attempt_timeout,
+                cache          = cache_store
+            )
+        except httpx.TimeoutException:
+            _record_failure(ticket)
+            last_error = f"Request timed out after {attempt_timeout:g}s"
+            logger.warning("TIMEOUT attempt=%d %s %s integration=%s", attempt + 1, method, path, integration_id)
+            attempt += 1
+            wait     = plan.backoff(attempt)
+            if wait is None:
+                break
+            await asyncio.sleep(wait)
+            continue
+        except httpx.RequestError as e:
+            _record_failure(ticket)
+            last_error = f"Network error: {e}"
+            logger.warning("NETWORK ERROR attempt=%d %s %s integration=%s error=%s", attempt + 1, method, path, integration_id, e)
+            attempt += 1
+            wait     = plan.backoff(attempt)
+            if wait is None:
+                break
+            await asyncio.sleep(wait)
+            continue
+
+        logger.debug("RESPONSE %d %s %s attempt=%d", response.status_code, method, path, attempt + 1)
+        _record_status(ticket, response.status_code)
+        await _rate_limit_async(_observe_rate_limit, integration_id, rate_limit, response.headers)
+
+        # ── handle auth errors ────────────────────────────────────────────────
+        if response.status_code == 401:
+            credentials = await asyncio.to_thread(_recover_from_401, integration_id, credentials, attempt, plan.replayable)
+            attempt    += 1
+            continue
+
+        # ── handle retryable errors ───────────────────────────────────────────
+        wait = plan.wait_for(response, attempt)
+        if wait is not None:
+            logger.info(
+                "RETRY %d attempt=%d integration=%s wait=%.2fs",
+                response.status_code, attempt + 1, integration_id, wait
             )
-            if spec and not spec.get("retryable", True):
-                error_field = spec.get("errorField")
-                if error_field and isinstance(response.body, dict):
-                    msg = response.body
-                    for key in error_field.split("."):
-                        msg = msg.get(key, msg) if isinstance(msg, dict) else msg
-                    print(
-                        f"[execute_api] non-retryable {response.status_code} "
-                        f"for {integration_id}: {msg}",
-                        flush=True
-                    )
-                else:
-                    meaning = spec.get("meaning", "Unknown error")
-                    print(
-                        f"[execute_api] non-retryable {response.status_code} "
-                        f"for {integration_id}: {meaning}",
-                        flush=True
-                    )
+            if response.status_code == 429:
+                await _rate_limit_async(_pause_rate_limit, integration_id, rate_limit, wait)
+            await asyncio.sleep(wait)
+            attempt += 1
+            continue
+
+        # ── non-retryable error — log with error spec meaning if available ────
+        if not response.ok:
+            _log_error_spec(integration_id, response, error_specs)
 
         return response
 
     raise RuntimeError(
         f"execute_api failed for '{integration_id}' after "
-        f"{retry.max_retries} retries: {last_error}"
+        f"{attempt} attempt(s): {last_error}"
     )
 
 
+async def _get_credentials_async(integration_id: str, force_refresh: bool = False) -> dict:
+    if not force_refresh:
+        # A shared-store check is a SQLite read that can wait on a lock — never on the loop.
+        if _cache.shared_check_due(integration_id):
+            cached = await asyncio.to_thread(_cache.lookup, integration_id, _fetch_credentials)
+        else:
+            cached = _cache.lookup(integration_id, _fetch_credentials, check_shared=False)
+        if cached is not None:
+            return cached
+    return await asyncio.to_thread(_get_credentials, integration_id, force_refresh)
+
+
+async def _execute_once_async(
+        integration_id: str,
+        credentials:    dict,
+        method:         str,
+        path:           str,
+        extra_headers:  dict,
+        body:           Any,
+        content_type:   str,
+        timeout:        int,
+        cache:          Optional[ResponseCache] = None
+) -> ApiResponse:
+    request   = _prepare_request(credentials, method, path, extra_headers, body, content_type)
+    cache_key = ResponseCache.key(integration_id, method, request["url"], extra_headers) if cache else None
+    cached    = await _response_cache_async(_add_validators, cache, cache_key, request)
+    client    = get_async_vendor_client(credentials["baseUrl"])
+    response  = await client.request(**request, timeout=timeout)
+    return _to_api_response(await _response_cache_async(_through_cache, cache, cache_key, cached, response))
+
+
 def _execute_once(
         integration_id: str,
         credentials:    dict,
@@ -527,50 +1482,137 @@ def _execute_once(
         extra_headers:  dict,
         body:           Any,
         content_type:   str,
-        timeout:        int
+        timeout:        int,
+        cache:          Optional[ResponseCache] = None
 ) -> ApiResponse:
+    request   = _prepare_request(credentials, method, path, extra_headers, body, content_type)
+    cache_key = ResponseCache.key(integration_id, method, request["url"], extra_headers) if cache else None
+    cached    = _add_validators(cache, cache_key, request)
+    client    = get_vendor_client(credentials["baseUrl"])
+    response  = client.request(**request, timeout=timeout)
+    return _to_api_response(_through_cache(cache, cache_key, cached, response))
+
+
+# ── Response cache ────────────────────────────────────────────────────────────
+
+def _response_cache_for(enabled: bool, method: str) -> Optional[ResponseCache]:
+    if enabled and method.upper() in CACHEABLE_METHODS:
+        return get_response_cache()
+    return None
+
+
+def _add_validators(cache: Optional[ResponseCache], key: Optional[tuple], request: dict):
+    """Looks up the stored entry and turns the request into a conditional one."""
+    if cache is None:
+        return None
+    cached = cache.get(key)
+    if cached is not None:
+        # Caller-supplied validators win.
+        present = {name.lower() for name in request["headers"]}
+        for name, value in cached.validators().items():
+            if name.lower() not in present:
+                request["headers"][name] = value
+    return cached
+
+
+def _through_cache(cache: Optional[ResponseCache], key: Optional[tuple], cached, response: httpx.Response) -> httpx.Response:
+    if cache is None:
+        return response
+    if response.status_code == 304 and cached is not None:
+        cache.hit()
+        logger.debug("CACHE 304 %s %s integration=%s", key[1], key[2], key[0])
+        return cached.to_response(response)
+    if response.status_code == 200:
+        cache.store(key, response)
+    return response
+
+
+async def _response_cache_async(fn: Callable, cache: Optional[ResponseCache], *args) -> Any:
+    """Runs one of the helpers above — in a worker thread when the cache has a disk tier."""
+    if cache is not None and cache.on_disk:
+        return await asyncio.to_thread(fn, cache, *args)
+    return fn(cache, *args)
+
+
+def _prepare_request(
+        credentials:   dict,
+        method:        str,
+        path:          str,
+        extra_headers: dict,
+        body:          Any,
+        content_type:  str
+) -> dict:
+    """Builds the httpx.request kwargs shared by the sync and async executors."""
     url          = _build_url(credentials, path)
     auth_headers = _build_auth_headers(credentials)
     auth_params  = _build_auth_params(credentials)
 
-    print(credentials, flush=True)
-    print(auth_headers, flush=True)
-
     all_headers = {**auth_headers, **extra_headers}
-    if body is not None:
+    multipart   = isinstance(body, Upload) and bool(body.files)
+    if body is not None and not multipart:   # httpx sets the multipart boundary itself
         all_headers["Content-Type"] = content_type
 
-    print(
-        f"[execute_api] REQUEST {method} {url} "
-        f"authType={credentials.get('authType')} "
-        f"hasBody={body is not None} "
-        f"headers={list(all_headers.keys())}",
-        flush=True
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        # Header names only — values carry credentials.
+        logger.debug(
+            "REQUEST %s %s authType=%s hasBody=%s headers=%s",
+            method, url, credentials.get("authType"), body is not None, list(all_headers)
+        )
 
     request_body = None
-    if body is not None:
+    form         = None
+    if multipart and body.asynchronous:
+        request_body, form_headers = body.encoded_form()
+        all_headers.update(form_headers)
+    elif multipart:
+        form = body.form()
+    elif isinstance(body, Upload):
+        request_body, length = body.content()
+        if length is not None:
+            all_headers["Content-Length"] = str(length)
+    elif body is not None:
         if isinstance(body, dict) and content_type == "application/x-www-form-urlencoded":
             from urllib.parse import urlencode
             request_body = urlencode(body)   # ← "email=test%40weavex.dev&name=Weavex+Test"
-        elif isinstance(body, dict) and content_type == "application/json":
-            request_body = json.dumps(body)
+        elif isinstance(body, (dict, list)) and content_type == "application/json":
+            request_body = dumps_bytes(body)
         else:
             request_body = body
 
-    print(f"[execute_api] content_type={content_type} body_type={type(request_body)} body={str(request_body)}", flush=True)
-
-    with httpx.Client(timeout=timeout) as client:
-        response = client.request(
-            method  = method.upper(),
-            url     = url,
-            headers = all_headers,
-            params  = auth_params or None,
-            content = request_body
+    # Opt-in per integration (compressionSpec); a caller-set Content-Encoding wins.
+    if request_body is not None and not any(h.lower() == "content-encoding" for h in all_headers):
+        request_body, encoding = compress_body(request_body, credentials.get("__compressionSpec"))
+        if encoding:
+            # A caller-set Content-Length counts the uncompressed body; httpx would keep it.
+            all_headers = {k: v for k, v in all_headers.items() if k.lower() != "content-length"}
+            all_headers["Content-Encoding"] = encoding
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "content_type=%s content_encoding=%s body_type=%s body_size=%s",
+            content_type, all_headers.get("Content-Encoding"), type(request_body).__name__, _body_size(request_body)
         )
 
+    request = {
+        "method":  method.upper(),
+        "url":     url,
+        "headers": all_headers,
+        "params":  auth_params or None,
+        "content": request_body
+    }
+    if form is not None:
+        request["data"], request["files"] = form
+    return request
+
+
+def _body_size(request_body: Any) -> Optional[int]:
+    if isinstance(request_body, (str, bytes)):
+        return len(request_body)
+    return None
+
+
+def _to_api_response(response: httpx.Response) -> ApiResponse:
     parsed_body = _parse_body(response)
-    print(response.status_code, flush=True)
     return ApiResponse(
         status_code = response.status_code,
         body        = parsed_body,
@@ -578,33 +1620,74 @@ def _execute_once(
     )
 
 
+def _log_error_spec(integration_id: str, response: ApiResponse, error_specs: list) -> None:
+    spec = next(
+        (s for s in error_specs if s["statusCode"] == response.status_code),
+        None
+    )
+    if spec and not spec.get("retryable", True):
+        error_field = spec.get("errorField")
+        if error_field and isinstance(response.body, dict):
+            msg = response.body
+            for key in error_field.split("."):
+                msg = msg.get(key, msg) if isinstance(msg, dict) else msg
+            logger.warning(
+                "non-retryable %d integration=%s error=%s",
+                response.status_code, integration_id, msg
+            )
+        else:
+            meaning = spec.get("meaning", "Unknown error")
+            logger.warning(
+                "non-retryable %d integration=%s meaning=%s",
+                response.status_code, integration_id, meaning
+            )
+
+
 def _parse_body(response: httpx.Response) -> Any:
     content_type = response.headers.get("content-type", "")
     if not response.content:
         return None
     if "application/json" in content_type:
         try:
-            return response.json()
+            return loads(response.content)
         except Exception:
             return response.text
     return response.text
 
 
-def _get_wait_time(response: ApiResponse, attempt: int, retry: RetryConfig) -> float:
+def _get_wait_time(response: ApiResponse, attempt: int, retry: RetryConfig) -> Optional[float]:
+    """Seconds to wait before retrying `response`, or None when Retry-After exceeds the cap."""
     if retry.respect_retry_after:
-        retry_after = (
+        retry_after = _parse_retry_after(
                 response.headers.get("retry-after") or
                 response.headers.get("Retry-After")
         )
-        if retry_after:
-            try:
-                return float(retry_after)
-            except ValueError:
-                pass
-    return retry.backoff_seconds * (2 ** attempt)
+        if retry_after is not None:
+            if retry_after > retry.max_retry_after_seconds:
+                logger.info(
+                    "not retrying — Retry-After %.0fs exceeds cap %.0fs",
+                    retry_after, retry.max_retry_after_seconds
+                )
+                return None
+            return retry_after
+    return _backoff_seconds(attempt + 1, retry)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is delta-seconds or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
 
 
-def _backoff(attempt: int, base: float) -> None:
-    wait = base * (2 ** (attempt - 1))
-    print(f"[execute_api] backoff {wait}s before attempt {attempt+1}", flush=True)
-    time.sleep(wait)
\ No newline at end of file
+def _backoff_seconds(retry_number: int, retry: RetryConfig) -> float:
+    """Capped exponential backoff; with jitter, full jitter over [0, backoff]."""
+    ceiling = min(retry.max_backoff_seconds, retry.backoff_seconds * (2 ** (retry_number - 1)))
+    return random.uniform(0, ceiling) if retry.jitter else ceiling
@@ -0,0 +1,303 @@
+# weavex_core/execute_api_batched.py
+#
+# Micro-batching of single-record writes into a vendor's bulk endpoint.
+# Step code keeps submitting one record at a time; records are buffered and
+# sent as one batch call once max_items are waiting or the oldest has waited
+# max_wait_ms. Each caller gets its own per-item ApiResponse back.
+#
+#   100 PATCHes → 1 POST /crm/v3/objects/contacts/batch/update
+#
+# Config comes from the call (BatchConfig) or, for skill integrations, from the
+# named entry in the batchSpecs bundled with vault credentials:
+#
+#   "batchSpecs": [{
+#       "name":        "update_contacts",
+#       "method":      "POST",
+#       "path":        "/crm/v3/objects/contacts/batch/update",
+#       "maxItems":    100,
+#       "maxWaitMs":   50,
+#       "itemsField":  "inputs",     # body = {"inputs": [...]}; null → bare JSON array
+#       "resultsPath": "results",    # per-item results in the response; null → body is the array
+#       "matchField":  "id",         # match results to items by this field; null → by position
+#       "errorsPath":  "errors"      # attached to items that got no result
+#   }]
+#
+# Per-item outcome:
+#   batch call not 2xx        every item gets the batch status and body
+#   result found for item     the batch status (207 → 200) with the item's result as body
+#   no result for item        MISSING_RESULT_STATUS with the vendor's errors block
+#   execute_api raised        every item's future raises the same exception
+#
+# Retries, token refresh, rate limiting and the circuit breaker apply to the
+# batch call as a whole, exactly as for any execute_api call.
+#
+# Usage:
+#   from weavex_core.execute_api_batched import MicroBatcher
+#
+#   with MicroBatcher.from_skill_spec(context, integration_id, "update_contacts") as batcher:
+#       futures = [batcher.submit({"id": c["id"], "properties": c["changes"]}) for c in contacts]
+#   for contact, future in zip(contacts, futures):
+#       response = future.result()        # per-item ApiResponse
+#
+#   # worker threads (e.g. one per record) simply block on their own item
+#   response = batcher.call({"id": "123", "properties": {"phone": "..."}})
+
+import copy
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from typing import Optional, Any
+
+from .execute_api import execute_api, ApiResponse, RetryConfig, DEFAULT_RETRY, _get_credentials, _copy_response
+from .execute_api_paginated import _dig
+
+
+# The vendor accepted the batch but returned no result for this item.
+MISSING_RESULT_STATUS = 502
+
+logger = logging.getLogger(__name__)
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+@dataclass
+class BatchConfig:
+    path:         str
+    method:       str            = "POST"
+    max_items:    int            = 100
+    max_wait_ms:  float          = 50.0
+    items_field:  Optional[str]  = "inputs"    # dotted; None → the body is the bare item list
+    body_extra:   dict           = field(default_factory=dict)   # merged into the envelope
+    results_path: Optional[str]  = "results"   # dotted; None → the response body is the list
+    match_field:  Optional[str]  = None        # None → results are in item order
+    errors_path:  Optional[str]  = "errors"
+    headers:      Optional[dict] = None
+
+    def __post_init__(self):
+        if self.max_items < 1:
+            raise ValueError("max_items must be >= 1")
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> "BatchConfig":
+        """Builds a config from a camelCase skill batchSpec."""
+        mapping = {
+            "path":        "path",
+            "method":      "method",
+            "maxItems":    "max_items",
+            "maxWaitMs":   "max_wait_ms",
+            "bodyExtra":   "body_extra",
+            "matchField":  "match_field",
+            "headers":     "headers",
+        }
+        config = cls(**{attr: spec[key] for key, attr in mapping.items() if spec.get(key) is not None})
+        # null is meaningful for these three, so they are copied even when None
+        for key, attr in (("itemsField", "items_field"), ("resultsPath", "results_path"), ("errorsPath", "errors_path")):
+            if key in spec:
+                setattr(config, attr, spec[key])
+        return config
+
+    def envelope(self, items: list) -> Any:
+        if not self.items_field:
+            return items
+        body   = copy.deepcopy(self.body_extra)
+        target = body
+        *parents, leaf = self.items_field.split(".")
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = items
+        return body
+
+    def split(self, response: ApiResponse, items: list) -> list[ApiResponse]:
+        """One ApiResponse per item, in item order."""
+        if not response.ok:
+            return [_copy_response(response) for _ in items]
+
+        results = _dig(response.body, self.results_path)
+        if not isinstance(results, list):
+            results = []
+        if self.match_field:
+            by_key  = {str(r.get(self.match_field)): r for r in results if isinstance(r, dict)}
+            matched = [by_key.get(str(item.get(self.match_field))) if isinstance(item, dict) else None for item in items]
+        else:
+            matched = [results[i] if i < len(results) else None for i in range(len(items))]
+
+        status = 200 if response.status_code == 207 else response.status_code
+        errors = _dig(response.body, self.errors_path) if self.errors_path else None
+        return [
+            ApiResponse(status, result, dict(response.headers)) if result is not None else
+            ApiResponse(
+                MISSING_RESULT_STATUS,
+                {"error": "batch response has no result for this item", "errors": errors},
+                dict(response.headers)
+            )
+            for result in matched
+        ]
+
+
+# ── Batcher ───────────────────────────────────────────────────────────────────
+
+@dataclass
+class BatcherStats:
+    items:          int
+    batches:        int
+    flushed_full:   int     # batches sent because max_items were waiting
+    flushed_timer:  int     # batches sent because max_wait_ms elapsed
+    flushed_manual: int     # flush() / close()
+    failed:         int     # batch calls where execute_api raised
+
+
+class MicroBatcher:
+    """
+    Buffers single-item submissions and sends them through config.path in
+    batches. Up to max_in_flight batch calls run concurrently; when they are
+    all busy and the buffer is full, submit() blocks until a batch goes out.
+    """
+
+    def __init__(
+            self,
+            context:        Any,
+            integration_id: str,
+            config:         BatchConfig,
+            timeout:        int         = 30,
+            retry:          RetryConfig = DEFAULT_RETRY,
+            max_in_flight:  int         = 4
+    ):
+        self.context        = context
+        self.integration_id = integration_id
+        self.config         = config
+        self.timeout        = timeout
+        self.retry          = retry
+        self._cond          = threading.Condition()
+        self._buffer        = []        # (item, Future, time.monotonic() it was queued at)
+        self._flush_now     = False
+        self._closed        = False
+        self._slots         = threading.Semaphore(max_in_flight)
+        self._executor      = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="micro-batch")
+        self._stats         = dict(items=0, batches=0, flushed_full=0, flushed_timer=0, flushed_manual=0, failed=0)
+        self._flusher       = threading.Thread(target=self._run, name="micro-batch-flusher", daemon=True)
+        self._flusher.start()
+
+    @classmethod
+    def from_skill_spec(cls, context: Any, integration_id: str, name: str, **kwargs) -> "MicroBatcher":
+        specs = _get_credentials(integration_id).get("__batchSpecs") or []
+        spec  = next((s for s in specs if s.get("name") == name), None)
+        if spec is None:
+            raise ValueError(
+                f"No batchSpec '{name}' for '{integration_id}' — pass a BatchConfig to MicroBatcher"
+            )
+        return cls(context, integration_id, BatchConfig.from_spec(spec), **kwargs)
+
+    def __enter__(self) -> "MicroBatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def submit(self, item: Any) -> Future:
+        """Queues one item; the Future resolves to its ApiResponse."""
+        future = Future()
+        with self._cond:
+            while len(self._buffer) >= self.config.max_items and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._buffer.append((item, future, time.monotonic()))
+            self._stats["items"] += 1
+            self._cond.notify_all()
+        return future
+
+    def call(self, item: Any) -> ApiResponse:
+        """submit() and wait — for callers that each own one record."""
+        return self.submit(item).result()
+
+    def flush(self) -> None:
+        """Sends whatever is buffered now without waiting for max_wait_ms."""
+        with self._cond:
+            if self._buffer:
+                self._flush_now = True
+                self._cond.notify_all()
+
+    def close(self) -> None:
+        """Flushes the buffer and waits for every batch call to finish."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._flusher.join()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> BatcherStats:
+        with self._cond:
+            return BatcherStats(**self._stats)
+
+    # ── Flushing ──────────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        max_wait = self.config.max_wait_ms / 1000.0
+        while True:
+            with self._cond:
+                while True:
+                    if not self._buffer:
+                        if self._closed:
+                            return
+                        self._flush_now = False
+                        self._cond.wait()
+                        continue
+                    waited = time.monotonic() - self._buffer[0][2]
+                    if len(self._buffer) >= self.config.max_items:
+                        reason = "flushed_full"
+                    elif self._flush_now or self._closed:
+                        reason = "flushed_manual"
+                    elif waited >= max_wait:
+                        reason = "flushed_timer"
+                    else:
+                        self._cond.wait(max_wait - waited)
+                        continue
+                    break
+                batch        = self._buffer[:self.config.max_items]
+                self._buffer = self._buffer[self.config.max_items:]
+                self._stats[reason] += 1
+                self._cond.notify_all()     # submitters blocked on a full buffer
+
+            batch = [(item, future) for item, future, _ in batch if future.set_running_or_notify_cancel()]
+            if batch:
+                self._slots.acquire()
+                self._executor.submit(self._send, batch)
+
+    def _send(self, batch: list) -> None:
+        items = [item for item, _ in batch]
+        try:
+            response = execute_api(
+                context        = self.context,
+                integration_id = self.integration_id,
+                method         = self.config.method,
+                path           = self.config.path,
+                headers        = self.config.headers,
+                body           = self.config.envelope(items),
+                timeout        = self.timeout,
+                retry          = self.retry
+            )
+            responses = self.config.split(response, items)
+        except Exception as e:
+            logger.warning(
+                "batch of %d failed integration=%s path=%s error=%s",
+                len(items), self.integration_id, self.config.path, e
+            )
+            with self._cond:
+                self._stats["batches"] += 1
+                self._stats["failed"]  += 1
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+
+        logger.debug(
+            "batch sent integration=%s path=%s items=%d status=%d",
+            self.integration_id, self.config.path, len(items), response.status_code
+        )
+        with self._cond:
+            self._stats["batches"] += 1
+        for (_, future), item_response in zip(batch, responses):
+            future.set_result(item_response)
@@ -0,0 +1,230 @@
+# weavex_core/execute_api_many.py
+#
+# Bounded-concurrency fan-out over execute_api.
+# Runs a list (or lazy iterator) of request specs against one integration with
+# at most `concurrency` calls in flight, sharing the pooled vendor client.
+# A failing request is reported on its own result and never aborts the batch.
+#
+# Usage:
+#   from weavex_core.execute_api_many import execute_api_many, ApiRequest
+#
+#   specs = (
+#       ApiRequest("PATCH", f"/v1/employees/{e['id']}", body=e["changes"], key=e["id"])
+#       for e in employees
+#   )
+#   for result in execute_api_many(context, integration_id, specs, concurrency=16):
+#       if not result.ok:
+#           print(result.request.key, result.error or result.response.status_code)
+#
+#   # Plain dicts work too:
+#   execute_api_many(context, integration_id, [{"method": "GET", "path": "/v1/a"}])
+#
+#   # Let the limit adapt to the vendor (AIMD, see adaptive_concurrency.py):
+#   execute_api_many(context, integration_id, specs, concurrency="auto")
+
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Optional, Any, Iterable, Iterator, Union
+
+from .execute_api import execute_api, observe_attempts, ApiResponse, RetryConfig, DEFAULT_RETRY
+from .adaptive_concurrency import AdaptiveLimiter, OVERLOAD_STATUSES, get_adaptive_limiter
+
+
+# ── Request / result ──────────────────────────────────────────────────────────
+
+@dataclass
+class ApiRequest:
+    method:       str
+    path:         str
+    headers:      Optional[dict]        = None
+    body:         Optional[Any]         = None
+    content_type: str                   = "application/json"
+    timeout:      Optional[int]         = None   # falls back to execute_api_many(timeout=...)
+    retry:        Optional[RetryConfig] = None   # falls back to execute_api_many(retry=...)
+    key:          Any                   = None   # caller correlation id, returned untouched
+
+
+@dataclass
+class ApiResult:
+    index:    int                        # position in the input sequence
+    request:  Optional[ApiRequest]       # None when the spec itself was malformed
+    response: Optional[ApiResponse] = None
+    error:    Optional[Exception]   = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.response is not None and self.response.ok
+
+
+def _coerce_request(spec: Union[ApiRequest, dict]) -> ApiRequest:
+    if isinstance(spec, ApiRequest):
+        return spec
+    if isinstance(spec, dict):
+        return ApiRequest(**spec)
+    raise TypeError(f"Unsupported request spec type: {type(spec).__name__}")
+
+
+# ── Fan-out ───────────────────────────────────────────────────────────────────
+
+def execute_api_many(
+        context:        Any,
+        integration_id: str,
+        requests:       Iterable[Union[ApiRequest, dict]],
+        concurrency:    Union[int, str] = 8,
+        ordered:        bool            = False,
+        timeout:        int             = 30,
+        retry:          RetryConfig     = DEFAULT_RETRY
+) -> Iterator[ApiResult]:
+    """
+    Executes many API calls for one integration with bounded parallelism.
+
+    Args:
+        context:        Pass as-is from activity params.
+        integration_id: Connected integration identifier.
+        requests:       ApiRequest objects or dicts with the same fields. May be a
+                        lazy iterator — specs are pulled only as slots free up.
+        concurrency:    Max calls in flight (default 8), or "auto" to use the
+                        integration's adaptive limit, learned from latency and
+                        429/503 responses and shared by every fan-out against
+                        it in this process.
+        ordered:        True yields results in input order, False (default) in
+                        completion order.
+        timeout:        Default per-request timeout in seconds.
+        retry:          Default retry configuration.
+
+    Yields:
+        ApiResult per request. Exceptions raised by execute_api are captured on
+        ApiResult.error instead of propagating. A spec that is not a valid
+        request yields a result with request=None and the TypeError as error.
+    """
+    limiter = get_adaptive_limiter(integration_id) if concurrency == "auto" else None
+    if limiter is None and (not isinstance(concurrency, int) or concurrency < 1):
+        raise ValueError("concurrency must be >= 1 or 'auto'")
+    max_workers = limiter.max_limit if limiter else concurrency
+
+    specs = iter(requests)
+
+    pending:   dict[Future, tuple[int, ApiRequest]] = {}
+    completed: dict[int, ApiResult]                 = {}
+    rejected:  list[ApiResult]                      = []
+    next_index   = 0
+    next_to_emit = 0
+    exhausted    = False
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="execute_api_many")
+    try:
+        while True:
+            limit = limiter.limit if limiter else concurrency
+            # In ordered mode a slow head-of-line call must not let the reorder
+            # buffer grow without bound, so submission pauses once the window is full.
+            window = limit if not ordered else limit * 4
+            while not exhausted and len(pending) + len(completed) + len(rejected) < window and _take_slot(limiter, len(pending), limit):
+                try:
+                    request = _coerce_request(next(specs))
+                except StopIteration:
+                    if limiter:
+                        limiter.cancel()
+                    exhausted = True
+                    break
+                except TypeError as e:
+                    # A malformed spec fails on its own result; its slot goes straight back.
+                    if limiter:
+                        limiter.cancel()
+                    rejected.append(ApiResult(index=next_index, request=None, error=e))
+                    next_index += 1
+                    continue
+                future = executor.submit(_run_one, context, integration_id, request, timeout, retry, limiter)
+                pending[future] = (next_index, request)
+                next_index += 1
+
+            finished, rejected = rejected, []
+            if not pending and not finished:
+                break
+
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, request = pending.pop(future)
+                    result = ApiResult(index=index, request=request)
+                    try:
+                        result.response = future.result()
+                    except Exception as e:
+                        result.error = e
+                    finished.append(result)
+
+            for result in finished:
+                if not ordered:
+                    yield result
+                    continue
+                completed[result.index] = result
+
+            while next_to_emit in completed:
+                yield completed.pop(next_to_emit)
+                next_to_emit += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if limiter:
+            # Calls cancelled before they started never released their slot.
+            for future in pending:
+                if future.cancelled():
+                    limiter.cancel()
+
+
+def _take_slot(limiter: Optional[AdaptiveLimiter], in_flight: int, limit: int) -> bool:
+    if limiter is None:
+        return in_flight < limit
+    if in_flight == 0:
+        # Other fan-outs may hold every slot — block rather than spin.
+        limiter.acquire()
+        return True
+    return limiter.try_acquire()
+
+
+def _run_one(
+        context:        Any,
+        integration_id: str,
+        request:        ApiRequest,
+        timeout:        int,
+        retry:          RetryConfig,
+        limiter:        Optional[AdaptiveLimiter] = None
+) -> ApiResponse:
+    if limiter is None:
+        return _call(context, integration_id, request, timeout, retry)
+    # Every attempt counts, not just the final one: a 429 or 503 that the
+    # retries inside execute_api absorbed is still congestion.
+    overloads = []
+
+    def on_attempt(status_code: Optional[int]) -> None:
+        if status_code is None or status_code in OVERLOAD_STATUSES:
+            overloads.append(status_code)
+
+    started   = time.monotonic()
+    completed = False
+    try:
+        with observe_attempts(on_attempt):
+            response = _call(context, integration_id, request, timeout, retry)
+        completed = True
+        return response
+    finally:
+        limiter.release(time.monotonic() - started, overloaded=bool(overloads) or not completed)
+
+
+def _call(
+        context:        Any,
+        integration_id: str,
+        request:        ApiRequest,
+        timeout:        int,
+        retry:          RetryConfig
+) -> ApiResponse:
+    return execute_api(
+        context        = context,
+        integration_id = integration_id,
+        method         = request.method,
+        path           = request.path,
+        headers        = request.headers,
+        body           = request.body,
+        content_type   = request.content_type,
+        timeout        = request.timeout if request.timeout is not None else timeout,
+        retry          = request.retry or retry
+    )
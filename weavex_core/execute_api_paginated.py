@@ -0,0 +1,318 @@
+# weavex_core/execute_api_paginated.py
+#
+# Generic pagination over ApiExecutionFacade.execute with next-page prefetch.
+# While the caller processes page N, page N+1 is already being fetched on a
+# background thread, so vendor latency overlaps with caller work.
+#
+# Styles:
+#   cursor  — next cursor read from the body (cursor_path), sent as cursor_param
+#   offset  — offset_param advanced by the number of items received
+#   page    — page_param incremented from start_page
+#   link    — RFC 5988 Link header, rel="next"
+#
+# Config comes from the call (PaginationConfig) or, for skill integrations,
+# from the paginationSpec bundled with vault credentials.
+#
+# Usage:
+#   from weavex_core.execute_api_paginated import execute_api_paginated, PaginationConfig
+#
+#   for employee in execute_api_paginated(
+#           context        = context,
+#           integration_id = integration_id,
+#           path           = "/v1/employees?status=Active",
+#           pagination     = PaginationConfig(style="cursor", items_path="data",
+#                                             cursor_path="meta.next_cursor", page_size=200),
+#           items          = True):
+#       ...
+
+import re
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass
+from typing import Optional, Any, Iterator
+from urllib.parse import urlsplit, urlencode, urlunsplit, unquote_plus
+
+from .execute_api import ApiResponse, RetryConfig, DEFAULT_RETRY, _get_credentials
+from .api_execution_facade import ApiExecutionFacade
+
+
+STYLES = ("cursor", "offset", "page", "link")
+
+logger = logging.getLogger(__name__)
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+@dataclass
+class PaginationConfig:
+    style:        str                        # cursor | offset | page | link
+    items_path:   Optional[str] = None       # dotted path to the record list, e.g. "data.items"
+    page_size:    Optional[int] = None       # sent as limit_param when set
+    limit_param:  str           = "limit"
+    cursor_param: str           = "cursor"
+    cursor_path:  Optional[str] = None       # dotted path to the next cursor, e.g. "paging.next.after"
+    offset_param: str           = "offset"
+    start_offset: int           = 0
+    page_param:   str           = "page"
+    start_page:   int           = 1
+    max_pages:    Optional[int] = None
+    prefetch:     bool          = True
+
+    def __post_init__(self):
+        if self.style not in STYLES:
+            raise ValueError(f"Unsupported pagination style '{self.style}' — expected one of {STYLES}")
+        if self.style == "cursor" and not self.cursor_path:
+            raise ValueError("cursor pagination requires cursor_path")
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> "PaginationConfig":
+        """Builds a config from a camelCase skill paginationSpec."""
+        mapping = {
+            "style":       "style",
+            "itemsPath":   "items_path",
+            "pageSize":    "page_size",
+            "limitParam":  "limit_param",
+            "cursorParam": "cursor_param",
+            "cursorPath":  "cursor_path",
+            "offsetParam": "offset_param",
+            "startOffset": "start_offset",
+            "pageParam":   "page_param",
+            "startPage":   "start_page",
+            "maxPages":    "max_pages",
+        }
+        return cls(**{attr: spec[key] for key, attr in mapping.items() if spec.get(key) is not None})
+
+
+# ── Pagination ────────────────────────────────────────────────────────────────
+
+def execute_api_paginated(
+        context:        Any,
+        integration_id: str,
+        path:           str,
+        method:         str                        = "GET",
+        pagination:     Optional[PaginationConfig] = None,
+        items:          bool                       = False,
+        body:           Optional[dict]             = None,
+        headers:        Optional[dict]             = None,
+        content_type:   str                        = "application/json",
+        app_base_url:   Optional[str]              = None,
+        timeout:        int                        = 30,
+        retry:          RetryConfig                = DEFAULT_RETRY
+) -> Iterator[Any]:
+    """
+    Iterates over every page of a paginated endpoint.
+
+    Args:
+        pagination: Pagination config. Defaults to the skill's paginationSpec.
+        items:      False (default) yields ApiResponse per page; True yields the
+                    individual records found at pagination.items_path.
+        Remaining arguments are passed to ApiExecutionFacade.execute.
+
+    A non-2xx page is yielded (in page mode) and ends the iteration; check
+    response.ok. In items mode a non-2xx page raises RuntimeError.
+
+    Only the pagination parameters are rewritten between pages; the rest of the
+    query string goes out exactly as given. A Link next URL on a different
+    origin than the integration's base URL (or app_base_url) is not followed:
+    the iteration ends there with a warning. Without either base URL only
+    relative next links are followed. A next page that was already requested —
+    a vendor echoing the same cursor or link — also ends the iteration.
+    """
+    config   = pagination or _config_from_skill_spec(integration_id)
+    base_url = (_skill_base_url(integration_id) or app_base_url) if config.style == "link" else None
+
+    def fetch(page_path: str) -> ApiResponse:
+        return ApiExecutionFacade.execute(
+            context        = context,
+            integration_id = integration_id,
+            method         = method,
+            path           = page_path,
+            body           = body,
+            headers        = headers,
+            content_type   = content_type,
+            app_base_url   = app_base_url,
+            timeout        = timeout,
+            retry          = retry,
+        )
+
+    state     = _PageState(config)
+    page_path = state.first_path(path)
+    pages     = 0
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="paginate-prefetch") if config.prefetch else None
+    future: Optional[Future] = None
+    try:
+        response = fetch(page_path)
+        while True:
+            pages += 1
+            next_path = None
+            if response.ok and (config.max_pages is None or pages < config.max_pages):
+                next_path = state.next_path(page_path, response, base_url)
+
+            # Kick off page N+1 before handing page N to the caller.
+            if next_path and executor:
+                future = executor.submit(fetch, next_path)
+
+            if items:
+                if not response.ok:
+                    raise RuntimeError(
+                        f"Pagination stopped on {method} {page_path}: status {response.status_code}"
+                    )
+                yield from _extract_items(response.body, config.items_path)
+            else:
+                yield response
+
+            if not next_path:
+                return
+            page_path = next_path
+            response  = future.result() if future else fetch(next_path)
+            future    = None
+    finally:
+        if future is not None:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+class _PageState:
+    def __init__(self, config: PaginationConfig):
+        self.config = config
+        self.offset = config.start_offset
+        self.page   = config.start_page
+        self.seen   = set()
+
+    def first_path(self, path: str) -> str:
+        c      = self.config
+        params = {c.limit_param: c.page_size} if c.page_size else {}
+        if c.style == "offset":
+            params[c.offset_param] = self.offset
+        elif c.style == "page":
+            params[c.page_param] = self.page
+        first = _with_params(path, params)
+        self.seen.add(first)
+        return first
+
+    def next_path(self, path: str, response: ApiResponse, base_url: Optional[str]) -> Optional[str]:
+        next_path = self._advance(path, response, base_url)
+        if next_path is None:
+            return None
+        if next_path in self.seen:
+            # Following it again would loop over the same pages forever.
+            logger.warning("Not following next page %s — it was already requested", next_path)
+            return None
+        self.seen.add(next_path)
+        return next_path
+
+    def _advance(self, path: str, response: ApiResponse, base_url: Optional[str]) -> Optional[str]:
+        c = self.config
+
+        if c.style == "link":
+            next_url = _next_link(response.headers)
+            return _relative_to_base(next_url, base_url) if next_url else None
+
+        if c.style == "cursor":
+            cursor = _dig(response.body, c.cursor_path)
+            return _with_params(path, {c.cursor_param: cursor}) if cursor else None
+
+        count = len(_extract_items(response.body, c.items_path))
+        # A short (or empty) page is the last one.
+        if count == 0 or (c.page_size and count < c.page_size):
+            return None
+        if c.style == "offset":
+            self.offset += count
+            return _with_params(path, {c.offset_param: self.offset})
+        self.page += 1
+        return _with_params(path, {c.page_param: self.page})
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def _config_from_skill_spec(integration_id: str) -> PaginationConfig:
+    if ApiExecutionFacade._is_skill(integration_id):
+        spec = _get_credentials(integration_id).get("__paginationSpec")
+        if spec:
+            return PaginationConfig.from_spec(spec)
+    raise ValueError(
+        f"No pagination config for '{integration_id}' — pass pagination=PaginationConfig(...)"
+    )
+
+
+def _skill_base_url(integration_id: str) -> Optional[str]:
+    if not ApiExecutionFacade._is_skill(integration_id):
+        return None
+    return _get_credentials(integration_id).get("baseUrl")
+
+
+def _dig(body: Any, dotted: Optional[str]) -> Any:
+    if not dotted:
+        return body
+    value = body
+    for key in dotted.split("."):
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None
+    return value
+
+
+def _extract_items(body: Any, items_path: Optional[str]) -> list:
+    found = _dig(body, items_path)
+    return found if isinstance(found, list) else []
+
+
+def _with_params(path: str, params: dict) -> str:
+    """
+    Sets the pagination params on path. Every other query pair is kept byte for
+    byte — repeated keys, order and encoding — since vendors may sign or compare URLs.
+    """
+    if not params:
+        return path
+    parts   = urlsplit(path)
+    pending = {k: str(v) for k, v in params.items()}
+    pairs   = []
+    for pair in parts.query.split("&") if parts.query else []:
+        key = unquote_plus(pair.split("=", 1)[0])
+        if key not in params:
+            pairs.append(pair)
+        elif key in pending:
+            # Replaced where it first appears; later repeats of a pagination key are dropped.
+            pairs.append(urlencode({key: pending.pop(key)}))
+    if pending:
+        pairs.append(urlencode(pending))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, "&".join(pairs), parts.fragment))
+
+
+_LINK_RE = re.compile(r'<([^>]*)>\s*((?:;\s*[^;,]+)*)')
+
+
+def _next_link(headers: dict) -> Optional[str]:
+    link = next((v for k, v in (headers or {}).items() if k.lower() == "link"), None)
+    if not link:
+        return None
+    for url, params in _LINK_RE.findall(link):
+        rels = re.findall(r'rel\s*=\s*"?([^";]+)"?', params)
+        if any("next" in rel.split() for rel in rels):
+            return url
+    return None
+
+
+def _relative_to_base(url: str, base_url: Optional[str]) -> Optional[str]:
+    """
+    execute_api takes paths relative to the credential baseUrl. Returns None for
+    an absolute URL that does not live under base_url — it would be sent to the
+    wrong host or path — and for any absolute URL when there is no base_url to
+    check it against.
+    """
+    parts = urlsplit(url)
+    if not parts.scheme and not parts.netloc:
+        return url
+    if not base_url:
+        logger.warning("Not following next link %s — no base URL to check its origin against", url)
+        return None
+    base = base_url.rstrip("/")
+    if url == base or url.startswith(base + "/") or url.startswith(base + "?"):
+        return url[len(base):] or "/"
+    logger.warning("Not following next link %s — it is outside the integration base URL %s", url, base)
+    return None
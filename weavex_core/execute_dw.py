@@ -10,11 +10,38 @@
 #       list_dw_datasets, list_dw_tables, describe_dw_table,
 #       create_dw_table
 #   )
+#
+#   # rows may be any iterable — a generator is streamed, never materialised
+#   execute_dw_write(context, integration_id, "hr.employees", (to_row(r) for r in records))
 
 import os
-import httpx
+import time
+import random
+import logging
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor, Future
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional, Union
+
+from .json_codec import dumps_bytes, loads
+from .http_pool import get_control_plane_session
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# execute_dw_write sends rows in chunks bounded by both limits, several at a time.
+DW_WRITE_CHUNK_ROWS    = _env_int("WEAVEX_DW_WRITE_CHUNK_ROWS", 10_000)
+DW_WRITE_CHUNK_BYTES   = _env_int("WEAVEX_DW_WRITE_CHUNK_BYTES", 8 * 1024 * 1024)
+DW_WRITE_CONCURRENCY   = _env_int("WEAVEX_DW_WRITE_CONCURRENCY", 4)
+DW_WRITE_CHUNK_RETRIES = _env_int("WEAVEX_DW_WRITE_CHUNK_RETRIES", 2)
+
+logger = logging.getLogger(__name__)
 
 
 # ── Result types ───────────────────────────────────────────────────────────────
@@ -34,9 +61,10 @@ class DWQueryResult:
 class DWWriteResult:
     rows_written: int
     rows_failed:  int
-    job_id:       str = ""
+    job_id:       str = ""                                  # the first chunk's job
     provider:     str = ""
     duration_ms:  int = 0
+    job_ids:      list[str] = field(default_factory=list)   # every chunk's job, in chunk order
 
 
 @dataclass
@@ -139,16 +167,37 @@ def execute_dw_write(
         context:           dict,
         integration_id:    str,
         table:             str,
-        rows:              list[dict],
+        rows:              Iterable[dict],
         write_mode:        str = "append",
         upsert_keys:       Optional[list[str]] = None,
         s3_integration_id: Optional[str] = None,
         batch_size:        int = 500,
-        timeout:           int = 120
+        timeout:           int = 120,
+        chunk_rows:        int = DW_WRITE_CHUNK_ROWS,
+        chunk_bytes:       int = DW_WRITE_CHUNK_BYTES,
+        concurrency:       int = DW_WRITE_CONCURRENCY,
+        chunk_retries:     int = DW_WRITE_CHUNK_RETRIES
 ) -> DWWriteResult:
     """
     Write rows to a data warehouse table.
 
+    Rows are streamed to the bridge in chunks of at most chunk_rows rows and
+    chunk_bytes of encoded rows, up to `concurrency` chunks in flight, so neither
+    the row list nor one giant request body has to exist in memory.
+
+      append   chunks in parallel
+      upsert   chunks are sent one at a time, in order — concurrent MERGEs into
+               one table conflict in the warehouse. Other upserts to the same
+               table from this process wait their turn too. Encoding the next
+               chunks still overlaps with the one in flight.
+      replace  the first chunk replaces the table on its own, the rest append
+
+    A chunk that times out or gets a network error / 5xx is retried on its own,
+    up to chunk_retries times. A retried chunk may be written twice if the
+    bridge finished the first attempt, so append writes are at-least-once.
+    When a chunk fails for good no further chunks are sent, and the error
+    reports how many rows were already written.
+
     Args:
         context:           Pass as-is from activity params.
         integration_id:    integration_ids.get("bigquery") etc.
@@ -156,38 +205,198 @@ def execute_dw_write(
                              BigQuery:  "project.dataset.table"  or "dataset.table"
                              Redshift:  "schema.table"
                              Snowflake: "database.schema.table"
-        rows:              List of dicts — keys are column names.
+        rows:              Iterable of dicts — keys are column names. A generator
+                           is consumed lazily.
         write_mode:        "append" | "upsert" | "replace"
         upsert_keys:       Required for write_mode="upsert".
         s3_integration_id: Required for Redshift bulk writes (>=500 rows).
         batch_size:        Rows per batch for inline writes (default 500).
-        timeout:           Operation timeout in seconds (default 120).
+        timeout:           Operation timeout in seconds, per chunk (default 120).
+        chunk_rows:        Max rows per request (default 10k).
+        chunk_bytes:       Max encoded rows per request (default 8 MiB).
+        concurrency:       Max chunks in flight (default 4).
+        chunk_retries:     Retries per chunk (default 2).
 
     Returns:
-        DWWriteResult with rows_written, rows_failed, job_id.
+        DWWriteResult with rows_written and rows_failed summed over all chunks,
+        job_id of the first chunk and job_ids of all of them.
     """
-    if not rows:
-        return DWWriteResult(rows_written=0, rows_failed=0)
-
-    response = _call_bridge("/write", {
-        "context":           context,
-        "integration_id":    integration_id,
-        "table":             table,
-        "rows":              rows,
-        "write_mode":        write_mode,
-        "upsert_keys":       upsert_keys,
-        "s3_integration_id": s3_integration_id,
-        "batch_size":        batch_size,
-        "timeout":           timeout
-    }, http_timeout=timeout + 30)
-
-    return DWWriteResult(
-        rows_written = response["rows_written"],
-        rows_failed  = response["rows_failed"],
-        job_id       = response.get("job_id", ""),
-        provider     = response.get("provider", ""),
-        duration_ms  = response.get("duration_ms", 0)
+    write = _ChunkedWrite(
+        payload = {
+            "context":           context,
+            "integration_id":    integration_id,
+            "table":             table,
+            "write_mode":        write_mode,
+            "upsert_keys":       upsert_keys,
+            "s3_integration_id": s3_integration_id,
+            "batch_size":        batch_size,
+            "timeout":           timeout
+        },
+        chunk_rows    = chunk_rows,
+        chunk_bytes   = chunk_bytes,
+        concurrency   = concurrency,
+        chunk_retries = chunk_retries,
+        http_timeout  = timeout + 30
     )
+    return write.run(rows)
+
+
+_upsert_locks      = {}    # (integration_id, table) → Lock held while an upsert chunk is in flight
+_upsert_locks_lock = threading.Lock()
+
+
+def _upsert_lock(integration_id: str, table: str) -> threading.Lock:
+    with _upsert_locks_lock:
+        return _upsert_locks.setdefault((integration_id, table), threading.Lock())
+
+
+def _reset_upsert_locks_after_fork() -> None:
+    global _upsert_locks_lock
+    _upsert_locks_lock = threading.Lock()
+    _upsert_locks.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_upsert_locks_after_fork)
+
+
+class _ChunkedWrite:
+    """One execute_dw_write call: chunking, the in-flight window and the tally."""
+
+    def __init__(
+            self,
+            payload:       dict,
+            chunk_rows:    int,
+            chunk_bytes:   int,
+            concurrency:   int,
+            chunk_retries: int,
+            http_timeout:  int
+    ):
+        if chunk_rows < 1 or chunk_bytes < 1 or concurrency < 1:
+            raise ValueError("chunk_rows, chunk_bytes and concurrency must be >= 1")
+        self.table         = payload["table"]
+        self.upsert        = payload["write_mode"] == "upsert"
+        self.replace_first = payload["write_mode"] == "replace"
+        self.chunk_rows    = chunk_rows
+        self.chunk_bytes   = chunk_bytes
+        self.chunk_retries = chunk_retries
+        self.http_timeout  = http_timeout
+        # The envelope is encoded once; each chunk splices its rows in as "rows":[...]
+        self._prefixes     = {
+            mode: dumps_bytes({**payload, "write_mode": mode})[:-1] + b',"rows":['
+            for mode in {payload["write_mode"], "append"}
+        }
+        self._mode         = payload["write_mode"] if not self.replace_first else "replace"
+        self._table_lock   = _upsert_lock(payload["integration_id"], self.table) if self.upsert else None
+        self._buffer       = []         # encoded rows of the next chunk
+        self._size         = 0
+        self._chunks       = 0
+        self._previous     = None       # last upsert chunk Future
+        self._slots        = threading.Semaphore(concurrency)
+        self._executor     = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="dw-write")
+        self._lock         = threading.Lock()
+        self._responses    = {}         # chunk number → bridge response
+        self._error        = None
+
+    def run(self, rows: Iterable[dict]) -> DWWriteResult:
+        started = time.monotonic()
+        try:
+            for row in rows:
+                if self._error is not None:
+                    break
+                encoded = dumps_bytes(row)
+                if self._buffer and (
+                        len(self._buffer) >= self.chunk_rows or
+                        self._size + len(encoded) + 1 > self.chunk_bytes
+                ):
+                    self._flush()
+                self._buffer.append(encoded)
+                self._size += len(encoded) + 1
+            if self._buffer and self._error is None:
+                self._flush()
+        finally:
+            self._executor.shutdown(wait=True)
+        return self._result(started)
+
+    def _flush(self) -> None:
+        rows         = self._buffer
+        self._buffer = []
+        self._size   = 0
+        chunk        = self._chunks
+        self._chunks += 1
+        body = self._prefixes[self._mode] + b",".join(rows) + b"]}"
+
+        if self._mode == "replace":
+            # Everything else appends to the table this chunk replaces, so it goes first, alone.
+            self._mode = "append"
+            self._send(chunk, body, len(rows), None)
+            return
+
+        self._slots.acquire()       # backpressure: at most `concurrency` bodies exist at once
+        future = self._executor.submit(self._send_slot, chunk, body, len(rows), self._previous)
+        if self.upsert:
+            self._previous = future
+
+    def _send_slot(self, chunk: int, body: bytes, count: int, previous: Optional[Future]) -> None:
+        try:
+            self._send(chunk, body, count, previous)
+        finally:
+            self._slots.release()
+
+    def _send(self, chunk: int, body: bytes, count: int, previous: Optional[Future]) -> None:
+        if previous is not None:
+            previous.result()       # upsert — keep the order, one MERGE at a time
+        if self._error is not None:
+            return
+        try:
+            if self._table_lock is not None:
+                with self._table_lock:
+                    response = self._post(body, count)
+            else:
+                response = self._post(body, count)
+        except Exception as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+            return
+        with self._lock:
+            self._responses[chunk] = response
+
+    def _post(self, body: bytes, count: int) -> dict:
+        for attempt in range(self.chunk_retries + 1):
+            try:
+                return _call_bridge("/write", body, http_timeout=self.http_timeout)
+            except _BridgeUnavailable as e:
+                if attempt == self.chunk_retries:
+                    raise
+                # full jitter over a capped exponential backoff, as execute_api does
+                wait = random.uniform(0, min(30.0, 2.0 * 2 ** attempt))
+                logger.warning(
+                    "DW write chunk of %d row(s) to %s failed attempt=%d error=%s — retrying in %.1fs",
+                    count, self.table, attempt + 1, e, wait
+                )
+                time.sleep(wait)
+
+    def _result(self, started: float) -> DWWriteResult:
+        responses = [self._responses[chunk] for chunk in sorted(self._responses)]
+        written   = sum(r["rows_written"] for r in responses)
+        if self._error is not None:
+            error = ValueError if isinstance(self._error, ValueError) else RuntimeError
+            raise error(
+                f"DW write to {self.table} stopped after {written} row(s) were written: {self._error}"
+            ) from self._error
+        if not responses:
+            return DWWriteResult(rows_written=0, rows_failed=0)
+
+        job_ids = [r["job_id"] for r in responses if r.get("job_id")]
+        return DWWriteResult(
+            rows_written = written,
+            rows_failed  = sum(r["rows_failed"] for r in responses),
+            job_id       = job_ids[0] if job_ids else "",
+            provider     = next((r["provider"] for r in responses if r.get("provider")), ""),
+            duration_ms  = int((time.monotonic() - started) * 1000),
+            job_ids      = job_ids
+        )
 
 
 # ── Discovery ──────────────────────────────────────────────────────────────────
@@ -340,27 +549,35 @@ def _bridge_url() -> str:
     return url.rstrip("/")
 
 
-def _call_bridge(endpoint: str, payload: dict, http_timeout: int = 30) -> dict:
+class _BridgeUnavailable(RuntimeError):
+    """Timeouts, network errors and 5xx — the ones worth retrying."""
+
+
+def _call_bridge(endpoint: str, payload: Union[dict, bytes], http_timeout: int = 30) -> dict:
     url = f"{_bridge_url()}{endpoint}"
     try:
-        with httpx.Client(timeout=http_timeout) as client:
-            response = client.post(url, json=payload)
-    except httpx.TimeoutException:
-        raise RuntimeError(f"Bridge server timed out on {endpoint} after {http_timeout}s")
-    except httpx.RequestError as e:
-        raise RuntimeError(f"Could not reach bridge server at {url}: {e}")
+        response = get_control_plane_session().post(
+            url,
+            data    = payload if isinstance(payload, bytes) else dumps_bytes(payload),
+            headers = {"Content-Type": "application/json"},
+            timeout = http_timeout
+        )
+    except requests.Timeout:
+        raise _BridgeUnavailable(f"Bridge server timed out on {endpoint} after {http_timeout}s")
+    except requests.RequestException as e:
+        raise _BridgeUnavailable(f"Could not reach bridge server at {url}: {e}")
 
     if response.status_code == 400:
         raise ValueError(f"DW operation failed: {_detail(response)}")
     if response.status_code >= 500:
-        raise RuntimeError(f"Bridge server error {response.status_code}: {_detail(response)}")
+        raise _BridgeUnavailable(f"Bridge server error {response.status_code}: {_detail(response)}")
     if response.status_code != 200:
         raise RuntimeError(f"Unexpected bridge response {response.status_code}")
 
-    return response.json()
+    return loads(response.content)
 
 
-def _detail(response: httpx.Response) -> str:
+def _detail(response: requests.Response) -> str:
     try:
         return response.json().get("detail", response.text[:200])
     except Exception:
@@ -0,0 +1,474 @@
+# weavex_core/http_pool.py
+#
+# Process-wide registry of pooled httpx clients for vendor calls.
+# One keep-alive client per vendor base URL, shared by every thread, so
+# repeated calls reuse DNS, TCP and TLS setup instead of paying it per attempt.
+#
+# Knit / Weavex control-plane services (passthrough proxy, service-mediator,
+# llm.config, cerebro, DW bridge) share one keep-alive requests.Session with a
+# connection pool per host and default timeouts — see "Control plane" below.
+#
+# Usage:
+#   from weavex_core.http_pool import get_vendor_client, get_pool_stats
+#
+#   client   = get_vendor_client(credentials["baseUrl"])
+#   response = client.request("GET", url, timeout=30)
+#
+#   get_pool_stats()   # → PoolStats(hits=..., misses=..., clients=..., base_urls=[...])
+#
+#   # asyncio callers get an AsyncClient bound to the running event loop
+#   client   = get_async_vendor_client(credentials["baseUrl"])
+#   response = await client.request("GET", url, timeout=30)
+#
+# Tuning (env):
+#   WEAVEX_HTTP_MAX_CONNECTIONS    max open connections per base URL  (default 100)
+#   WEAVEX_HTTP_MAX_KEEPALIVE      max idle keep-alive connections    (default 20)
+#   WEAVEX_HTTP_KEEPALIVE_EXPIRY   idle connection expiry, seconds    (default 30)
+#   WEAVEX_HTTP2                   "true" enables HTTP/2 when the h2 package is installed
+#
+#   session  = get_control_plane_session()
+#   response = session.post(url, json=payload)            # timeout defaults apply
+#   get_control_plane_stats()   # → [ControlPlaneHostStats(host=..., requests=..., connections=...)]
+#
+#   WEAVEX_CONTROL_PLANE_MAX_CONNECTIONS   pooled connections per host     (default 32)
+#   WEAVEX_CONTROL_PLANE_CONNECT_TIMEOUT   seconds, when a call sets none  (default 10)
+#   WEAVEX_CONTROL_PLANE_READ_TIMEOUT      seconds, when a call sets none  (default 120)
+#   WEAVEX_CONTROL_PLANE_IDLE_TIMEOUT      idle seconds before a pooled connection is
+#                                          reopened; keep below the server's idle timeout (default 30)
+
+import os
+import time
+import atexit
+import asyncio
+import weakref
+import threading
+import importlib.util
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ProtocolError
+from urllib3.util.retry import Retry
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass
+class PoolConfig:
+    max_connections:   int   = field(default_factory=lambda: _env_int("WEAVEX_HTTP_MAX_CONNECTIONS", 100))
+    max_keepalive:     int   = field(default_factory=lambda: _env_int("WEAVEX_HTTP_MAX_KEEPALIVE", 20))
+    keepalive_expiry:  float = field(default_factory=lambda: _env_float("WEAVEX_HTTP_KEEPALIVE_EXPIRY", 30.0))
+    http2:             bool  = field(default_factory=lambda: _env_bool("WEAVEX_HTTP2"))
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections           = self.max_connections,
+            max_keepalive_connections = self.max_keepalive,
+            keepalive_expiry          = self.keepalive_expiry
+        )
+
+    def http2_enabled(self) -> bool:
+        # httpx raises at construction time if http2=True without h2 installed
+        return self.http2 and importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class PoolStats:
+    hits:      int
+    misses:    int
+    clients:   int
+    base_urls: list[str]
+
+
+def _no_cookie_jar() -> CookieJar:
+    # Clients are shared across tenants hitting the same vendor host, so a
+    # Set-Cookie from one integration must never be replayed for another.
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+# ── Client pool ───────────────────────────────────────────────────────────────
+
+class _ClientPool:
+    def __init__(self, config: PoolConfig = None):
+        self._config:  PoolConfig              = config or PoolConfig()
+        self._clients: dict[str, httpx.Client] = {}
+        self._lock:    threading.Lock          = threading.Lock()
+        self._hits:    int                     = 0
+        self._misses:  int                     = 0
+
+    def get(self, base_url: str) -> httpx.Client:
+        key = base_url.rstrip("/")
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None and not client.is_closed:
+                self._hits += 1
+                return client
+            self._misses += 1
+            client = httpx.Client(
+                limits  = self._config.limits(),
+                http2   = self._config.http2_enabled(),
+                cookies = _no_cookie_jar()
+            )
+            self._clients[key] = client
+            return client
+
+    def configure(self, config: PoolConfig) -> None:
+        """Applies new limits. Call at worker startup — existing clients are closed and rebuilt lazily."""
+        with self._lock:
+            self._config = config
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                hits      = self._hits,
+                misses    = self._misses,
+                clients   = len(self._clients),
+                base_urls = sorted(self._clients)
+            )
+
+    def close_all(self) -> None:
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _reset_after_fork(self) -> None:
+        # The child shares the parent's sockets — drop references without
+        # closing them so the parent's TLS sessions are left untouched.
+        self._lock    = threading.Lock()
+        self._clients = {}
+        self._hits    = 0
+        self._misses  = 0
+
+
+class _AsyncClientPool:
+    """
+    AsyncClient connections are bound to the loop that opened them, so clients
+    are kept per event loop and released together with the loop.
+    """
+
+    def __init__(self, config: PoolConfig = None):
+        self._config:  PoolConfig = config or PoolConfig()
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock:    threading.Lock            = threading.Lock()
+        self._hits:    int                       = 0
+        self._misses:  int                       = 0
+
+    def get(self, base_url: str) -> httpx.AsyncClient:
+        key  = base_url.rstrip("/")
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            per_loop = self._clients.setdefault(loop, {})
+            client   = per_loop.get(key)
+            if client is not None and not client.is_closed:
+                self._hits += 1
+                return client
+            self._misses += 1
+            client = httpx.AsyncClient(
+                limits  = self._config.limits(),
+                http2   = self._config.http2_enabled(),
+                cookies = _no_cookie_jar()
+            )
+            per_loop[key] = client
+            return client
+
+    def configure(self, config: PoolConfig) -> None:
+        with self._lock:
+            self._config = config
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            base_urls = sorted({url for per_loop in self._clients.values() for url in per_loop})
+            return PoolStats(
+                hits      = self._hits,
+                misses    = self._misses,
+                clients   = sum(len(per_loop) for per_loop in self._clients.values()),
+                base_urls = base_urls
+            )
+
+    async def aclose_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            per_loop = self._clients.pop(loop, {})
+        for client in per_loop.values():
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+    def _reset_after_fork(self) -> None:
+        self._lock    = threading.Lock()
+        self._clients = weakref.WeakKeyDictionary()
+        self._hits    = 0
+        self._misses  = 0
+
+
+_pool       = _ClientPool()
+_async_pool = _AsyncClientPool()
+
+atexit.register(_pool.close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_pool._reset_after_fork)
+    os.register_at_fork(after_in_child=_async_pool._reset_after_fork)
+
+
+# ── Public helpers ────────────────────────────────────────────────────────────
+
+def get_vendor_client(base_url: str) -> httpx.Client:
+    """Returns the shared keep-alive client for a vendor base URL."""
+    return _pool.get(base_url)
+
+
+def configure_pool(
+        max_connections:  int   = None,
+        max_keepalive:    int   = None,
+        keepalive_expiry: float = None,
+        http2:            bool  = None
+) -> None:
+    """Overrides pool limits at runtime. Unset arguments keep their env/default value."""
+    config = PoolConfig()
+    if max_connections is not None:
+        config.max_connections = max_connections
+    if max_keepalive is not None:
+        config.max_keepalive = max_keepalive
+    if keepalive_expiry is not None:
+        config.keepalive_expiry = keepalive_expiry
+    if http2 is not None:
+        config.http2 = http2
+    _pool.configure(config)
+    _async_pool.configure(config)
+
+
+def get_async_vendor_client(base_url: str) -> httpx.AsyncClient:
+    """Returns the shared keep-alive AsyncClient for a base URL on the running loop."""
+    return _async_pool.get(base_url)
+
+
+async def aclose_async_clients() -> None:
+    """Closes the AsyncClients opened on the running loop. Await before the loop shuts down."""
+    await _async_pool.aclose_loop()
+
+
+def get_async_pool_stats() -> PoolStats:
+    """Hit/miss counters and open AsyncClients across all live event loops."""
+    return _async_pool.stats()
+
+
+def get_pool_stats() -> PoolStats:
+    """Hit/miss counters and open clients, for sizing the pool."""
+    return _pool.stats()
+
+
+def close_all_clients() -> None:
+    """Closes every pooled client. Safe to call more than once."""
+    _pool.close_all()
+
+
+# ── Control plane ─────────────────────────────────────────────────────────────
+#
+# requests.Session is shared across threads here: the adapter's urllib3 pools
+# are thread-safe, adapters are mounted once at creation, and cookies are
+# disabled (the same reason as for vendor clients — calls for different
+# tenants must never share state).
+
+@dataclass
+class ControlPlaneHostStats:
+    host:        str
+    requests:    int
+    connections: int     # TCP/TLS connections opened; requests - connections were reused
+
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+class _IdleExpiryPoolMixin:
+    """
+    Reopens pooled connections that sat idle longer than idle_timeout.
+
+    A server or load balancer closes idle keep-alive connections on its own
+    schedule; reopening ours first avoids racing that close on the next call.
+    """
+
+    idle_timeout: float = 30.0
+
+    def _get_conn(self, timeout=None):
+        conn       = super()._get_conn(timeout)
+        idle_since = getattr(conn, "_weavex_idle_since", None)
+        if idle_since is not None and conn.is_connected and time.monotonic() - idle_since > self.idle_timeout:
+            conn.close()        # urllib3 reconnects a closed connection on the next request
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._weavex_idle_since = time.monotonic()
+        super()._put_conn(conn)
+
+    def close_idle(self) -> None:
+        """Closes every connection waiting in the pool; they reconnect on next use."""
+        pool = self.pool
+        if pool is None:
+            return
+        with pool.mutex:
+            for conn in pool.queue:
+                if conn is not None:
+                    conn.close()
+
+
+class _ControlPlaneAdapter(HTTPAdapter):
+    """
+    Applies default timeouts to calls that pass none — requests' own default is
+    to wait forever — and replays an idempotent request once when a pooled
+    connection turned out to be closed by the server.
+    """
+
+    def __init__(self, timeout: tuple[float, float], idle_timeout: float, **kwargs):
+        self._default_timeout = timeout
+        self._idle_timeout    = idle_timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        mixin_attrs = {"idle_timeout": self._idle_timeout}
+        self.poolmanager.pool_classes_by_scheme = {
+            "http":  type("_IdleExpiryHTTPPool", (_IdleExpiryPoolMixin, HTTPConnectionPool), mixin_attrs),
+            "https": type("_IdleExpiryHTTPSPool", (_IdleExpiryPoolMixin, HTTPSConnectionPool), mixin_attrs),
+        }
+
+    def send(self, request, timeout=None, **kwargs):
+        timeout = self._default_timeout if timeout is None else timeout
+        try:
+            return super().send(request, timeout=timeout, **kwargs)
+        except requests.ConnectionError as e:
+            if not self._should_replay(request, e):
+                raise
+        # Any connection error raised in here came before the response headers.
+        # Siblings of the dropped connection idled just as long, so they are
+        # closed too and the replay goes out on a fresh connection.
+        pool = self.poolmanager.connection_from_url(request.url)
+        if isinstance(pool, _IdleExpiryPoolMixin):
+            pool.close_idle()
+        return super().send(request, timeout=timeout, **kwargs)
+
+    @staticmethod
+    def _should_replay(request, error: requests.ConnectionError) -> bool:
+        # ProtocolError is "connection aborted": reset, broken pipe, or closed
+        # without a response. Connect failures are retried by urllib3 itself.
+        cause = error.args[0] if error.args else None
+        if not isinstance(cause, ProtocolError):
+            return False
+        # urllib3 already discards a pooled connection the server closed while
+        # it sat idle, so a drop that gets here may have come after the server
+        # read the request. Only a request that is safe to apply twice is sent
+        # again; a POST surfaces the error to the caller.
+        return request.method in _IDEMPOTENT_METHODS
+
+
+class _ControlPlane:
+    def __init__(self):
+        self._session: requests.Session = None
+        self._adapter: HTTPAdapter      = None
+        self._lock:    threading.Lock   = threading.Lock()
+
+    def session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                max_connections = _env_int("WEAVEX_CONTROL_PLANE_MAX_CONNECTIONS", 32)
+                self._adapter   = _ControlPlaneAdapter(
+                    timeout          = (
+                        _env_float("WEAVEX_CONTROL_PLANE_CONNECT_TIMEOUT", 10.0),
+                        _env_float("WEAVEX_CONTROL_PLANE_READ_TIMEOUT", 120.0)
+                    ),
+                    idle_timeout     = _env_float("WEAVEX_CONTROL_PLANE_IDLE_TIMEOUT", 30.0),
+                    pool_connections = 16,                # hosts kept pooled
+                    pool_maxsize     = max_connections,
+                    # urllib3 retries only failures to connect: the request never
+                    # reached the server, so it is safe even for POST. read=False
+                    # re-raises read timeouts as requests.ReadTimeout, as by default.
+                    # A connection the server dropped while pooled is replayed by
+                    # the adapter instead (see _ControlPlaneAdapter.send).
+                    max_retries      = Retry(total=1, connect=1, read=False, status=0, other=0)
+                )
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                session.mount("https://", self._adapter)
+                session.mount("http://", self._adapter)
+                self._session = session
+            return self._session
+
+    def stats(self) -> list[ControlPlaneHostStats]:
+        with self._lock:
+            if self._adapter is None:
+                return []
+            pools = self._adapter.poolmanager.pools
+            stats = []
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                default_port = 443 if pool.scheme == "https" else 80
+                host         = pool.host if pool.port in (None, default_port) else f"{pool.host}:{pool.port}"
+                stats.append(ControlPlaneHostStats(
+                    host        = host,
+                    requests    = pool.num_requests,
+                    connections = pool.num_connections
+                ))
+            return sorted(stats, key=lambda s: s.host)
+
+    def close(self) -> None:
+        with self._lock:
+            session, self._session, self._adapter = self._session, None, None
+        if session is not None:
+            session.close()
+
+    def _reset_after_fork(self) -> None:
+        # Same as the vendor pool: abandon the parent's sockets, do not close them.
+        self._lock    = threading.Lock()
+        self._session = None
+        self._adapter = None
+
+
+_control_plane = _ControlPlane()
+
+atexit.register(_control_plane.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_control_plane._reset_after_fork)
+
+
+def get_control_plane_session() -> requests.Session:
+    """Returns the shared keep-alive session for Knit / Weavex control-plane calls."""
+    return _control_plane.session()
+
+
+def get_control_plane_stats() -> list[ControlPlaneHostStats]:
+    """Requests and opened connections per control-plane host with an open pool."""
+    return _control_plane.stats()
@@ -0,0 +1,174 @@
+# weavex_core/json_codec.py
+#
+# Internal JSON codec used by every hot path in weavex_core.
+# Picks the fastest installed backend — orjson, then msgspec — and falls back
+# to the stdlib json module. Force one with WEAVEX_JSON_BACKEND=orjson|msgspec|json.
+#
+# Compatibility with json.dumps / json.loads. The output is the same whichever
+# backend is installed:
+#   - Output is compact (no spaces after , and :) and UTF-8 rather than \u-escaped.
+#     Equivalent JSON, different bytes — never hash dumps() output.
+#   - Only what the stdlib encodes natively is encoded natively. Everything else
+#     (datetime, date, dataclass, Decimal, set, ...) goes through `default`
+#     exactly as with json.dumps, and raises TypeError without one.
+#   - Two exceptions, applied on the stdlib path too: a UUID encodes as its
+#     canonical string and an Enum as its value, as orjson does natively.
+#   - NaN and ±Infinity encode as null. The stdlib alone writes the literal NaN,
+#     which is not JSON and which vendors reject.
+#   - Anything the fast backend cannot handle (ints beyond 64 bits, non-str keys,
+#     subclasses of builtin types, ...) is retried with the stdlib, so no input
+#     that worked before now fails.
+#   - msgspec encodes datetimes, dataclasses, sets, ... itself with no way to
+#     route them to `default`, so it is only used for decoding.
+#   - Errors are ValueError (decode) and TypeError (encode), as before.
+#
+# canonical_dumps() is always the stdlib with a fixed configuration: its output
+# is byte-identical across backends and releases and is what hashing must use.
+#
+# Usage:
+#   from .json_codec import dumps, dumps_bytes, loads, canonical_dumps
+#
+#   content = dumps_bytes(payload)                 # request bodies
+#   data    = loads(response.content)              # bytes or str
+#   digest  = hashlib.sha256(canonical_dumps(obj).encode()).hexdigest()
+
+import os
+import json
+import math
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _select_backend() -> str:
+    forced = os.environ.get("WEAVEX_JSON_BACKEND", "").strip().lower()
+    if forced == "orjson" and orjson is not None:
+        return "orjson"
+    if forced == "msgspec" and msgspec is not None:
+        return "msgspec"
+    if forced == "json":
+        return "json"
+    if orjson is not None:
+        return "orjson"
+    if msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+BACKEND = _select_backend()
+
+if orjson is not None:
+    # Datetimes, dataclasses and subclasses of builtin types are handed to
+    # _orjson_hook instead of being encoded the orjson way. Non-str keys raise
+    # and fall back to the stdlib, which coerces them.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+if msgspec is not None:
+    _msgspec_decoder = msgspec.json.Decoder()
+
+
+# ── Encoding ──────────────────────────────────────────────────────────────────
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialises to UTF-8 JSON bytes — the form HTTP bodies and Pub/Sub messages need."""
+    if BACKEND == "orjson":
+        try:
+            return orjson.dumps(obj, default=_orjson_hook(default), option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj, default).encode("utf-8")
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    if BACKEND != "orjson":
+        return _stdlib_dumps(obj, default)
+    return dumps_bytes(obj, default).decode("utf-8")
+
+
+_STDLIB_NATIVE = (str, int, float, list, tuple, dict)
+
+
+def _orjson_hook(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    def hook(obj: Any) -> Any:
+        # The stdlib encodes a subclass of a builtin as its base type, never
+        # through `default` — raising sends the whole payload there.
+        if default is None or isinstance(obj, _STDLIB_NATIVE):
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return default(obj)
+    return hook
+
+
+def _stdlib_dumps(obj: Any, default: Optional[Callable[[Any], Any]]) -> str:
+    hook = _stdlib_hook(default)
+    try:
+        return json.dumps(obj, default=hook, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    except ValueError as exc:
+        if not str(exc).startswith("Out of range float"):
+            raise
+    # Rare: a NaN or ±Infinity somewhere. Replace them with None and encode again.
+    return json.dumps(
+        _finite(obj), default=lambda o: _finite(hook(o)), separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def _stdlib_hook(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    def hook(obj: Any) -> Any:
+        if isinstance(obj, UUID):
+            return str(obj)
+        if isinstance(obj, Enum):
+            return obj.value
+        if default is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return default(obj)
+    return hook
+
+
+def _finite(value: Any) -> Any:
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def canonical_dumps(obj: Any) -> str:
+    """Deterministic serialisation for hashing. Always stdlib, never change these arguments."""
+    return json.dumps(
+        obj,
+        sort_keys=True,          # dict key order never affects the output
+        separators=(",", ":"),   # no incidental whitespace differences
+        default=str,             # gracefully stringify non-JSON-native types
+        ensure_ascii=True,
+    )
+
+
+# ── Decoding ──────────────────────────────────────────────────────────────────
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    if BACKEND == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    elif BACKEND == "msgspec":
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError:
+            pass
+    # Also the slow path for what the fast backends reject but the stdlib
+    # accepts (NaN/Infinity, huge ints). Invalid JSON raises ValueError here.
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
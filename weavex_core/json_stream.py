@@ -0,0 +1,166 @@
+# weavex_core/json_stream.py
+#
+# Incremental JSON item extraction from a byte stream.
+# Yields the values found under an ijson-style prefix one at a time, so a
+# multi-hundred-MB response never has to be held in memory as a whole.
+#
+# Prefix syntax (same as ijson): dot-separated object keys, "item" for array
+# elements. "employees.item" → every element of the top-level "employees"
+# array; "item" → every element of a top-level array.
+#
+# Uses ijson (C backend when available) if installed, otherwise a stdlib
+# fallback built on json.JSONDecoder.raw_decode. The fallback buffers only the
+# current item, plus any sibling value it has to skip on the way to the prefix.
+#
+# Usage:
+#   for employee in iter_json_items(response.iter_bytes(), "employees.item"):
+#       ...
+
+import json
+import codecs
+from typing import Any, Iterable, Iterator
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def iter_json_items(chunks: Iterable[bytes], prefix: str) -> Iterator[Any]:
+    if ijson is not None:
+        return _iter_ijson(chunks, prefix)
+    return _iter_fallback(chunks, prefix)
+
+
+def _iter_ijson(chunks: Iterable[bytes], prefix: str) -> Iterator[Any]:
+    events = ijson.sendable_list()
+    coro   = ijson.items_coro(events, prefix, use_float=True)
+    for chunk in chunks:
+        coro.send(chunk)
+        if events:
+            yield from events
+            del events[:]
+    coro.close()
+    yield from events
+
+
+# ── Stdlib fallback ───────────────────────────────────────────────────────────
+
+_WHITESPACE = " \t\n\r"
+_NUMBER     = set("0123456789.eE+-")
+_decoder    = json.JSONDecoder()
+
+
+def _number_cut(obj: Any, rest: str) -> bool:
+    """True when a decoded number may be the start of a longer one split across chunks."""
+    return isinstance(obj, (int, float)) and not isinstance(obj, bool) and _NUMBER.issuperset(rest)
+
+
+class _Reader:
+    """Text buffer over a byte-chunk iterator with a consumed-prefix cursor."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8   = codecs.getincrementaldecoder("utf-8")()
+        self.buf     = ""
+        self.pos     = 0
+        self.eof     = False
+
+    def fill(self, min_growth: int = 1) -> bool:
+        """Reads until at least min_growth chars were added. False at end of stream."""
+        if self.pos > 65536:
+            self.buf, self.pos = self.buf[self.pos:], 0
+        added = 0
+        while added < min_growth:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                tail = self._utf8.decode(b"", final=True)
+                self.buf += tail
+                self.eof  = True
+                return bool(tail) or added > 0
+            text      = self._utf8.decode(chunk)
+            self.buf += text
+            added    += len(text)
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace char without consuming it ('' at end of stream)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if self.eof or not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON stream: expected '{char}', found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decodes the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number touching the end of the buffer may continue in the next
+                # chunk — so may one cut after "1." or "1e", which decodes as 1.
+                if self.eof or (end < len(self.buf) and not _number_cut(obj, self.buf[end:])):
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise ValueError("Malformed JSON stream: truncated value")
+            # Grow geometrically so re-parsing a large value stays linear overall.
+            self.fill(min_growth=max(1, len(self.buf) - self.pos))
+
+
+def _iter_fallback(chunks: Iterable[bytes], prefix: str) -> Iterator[Any]:
+    path   = [segment for segment in prefix.split(".") if segment] if prefix else []
+    reader = _Reader(chunks)
+    yield from _walk(reader, path)
+
+
+def _walk(reader: _Reader, path: list[str]) -> Iterator[Any]:
+    if not path:
+        yield reader.value()
+        return
+
+    segment, rest = path[0], path[1:]
+
+    if segment == "item":
+        if reader.peek() != "[":
+            reader.value()          # not an array — nothing under this prefix
+            return
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.pos += 1
+            return
+        while True:
+            yield from _walk(reader, rest)
+            sep = reader.peek()
+            reader.expect(sep if sep in ",]" else ",")
+            if sep == "]":
+                return
+
+    if reader.peek() != "{":
+        reader.value()
+        return
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == segment:
+            yield from _walk(reader, rest)
+        else:
+            reader.value()          # skip sibling value
+        sep = reader.peek()
+        reader.expect(sep if sep in ",}" else ",")
+        if sep == "}":
+            return
@@ -1,5 +1,5 @@
-import requests
 from .knit_utils import get_knit_config
+from .http_pool import get_control_plane_session
 
 def consume(context, event):
     base_url, headers = get_knit_config(context)
@@ -10,5 +10,5 @@ def consume(context, event):
         "event": event
     }
 
-    response = requests.post(url, headers=headers, json=payload)
+    response = get_control_plane_session().post(url, headers=headers, json=payload)
     return response.json()
\ No newline at end of file
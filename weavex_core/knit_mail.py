@@ -1,5 +1,5 @@
-import requests
 from .knit_utils import get_knit_config
+from .http_pool import get_control_plane_session
 
 def email(context, to, subject, html_content, attachment=None):
     base_url, headers = get_knit_config(context)
@@ -14,5 +14,5 @@ def email(context, to, subject, html_content, attachment=None):
     if attachment:
         payload["attachment"] = attachment
 
-    response = requests.post(url, headers=headers, json=payload)
+    response = get_control_plane_session().post(url, headers=headers, json=payload)
     return response.json()
\ No newline at end of file
@@ -1,7 +1,7 @@
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, BaseMessage
 from langchain_core.language_models import BaseChatModel
 from dataclasses import dataclass
-import requests
+from .http_pool import get_control_plane_session
 
 @dataclass
 class LLMResponse:
@@ -29,7 +29,7 @@ def _fetch_llm_config(context: dict, integration_id: str) -> dict:
         "X-Knit-Integration-Id": integration_id
     }
 
-    response = requests.get(
+    response = get_control_plane_session().get(
         f"{base_url}/llm.config",
         headers=headers
     )
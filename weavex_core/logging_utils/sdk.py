@@ -1,8 +1,9 @@
 import time
 from typing import Optional, Dict, Any
-import os, json
+import os
 
 from .transports import PubSubLogger, StdoutLogger
+from ..json_codec import dumps
 
 class WeavexServicesLogger:
     """
@@ -58,11 +59,11 @@ class WeavexServicesLogger:
             "status_code": int(status_code),
             "duration_ms": int(duration_ms),
             # Stringify JSON fields for BQ ingestion compatibility
-            "request_payload": json.dumps(req_payload or {}),
-            "response_payload": json.dumps(resp_payload or {}),
+            "request_payload": dumps(req_payload or {}),
+            "response_payload": dumps(resp_payload or {}),
             "vendor_name": vendor_name,
-            "api_data": json.dumps(metadata or {}),
-            "context": json.dumps(context or {})
+            "api_data": dumps(metadata or {}),
+            "context": dumps(context or {})
         }
         self.logger.log(payload, blocking=True)
 
@@ -99,8 +100,8 @@ class WeavexServicesLogger:
             "vendor_method": vendor_method,
             "vendor_request_id": vendor_req_id,
             # Stringify JSON fields
-            "sync_data": json.dumps(metadata or {}),
-            "context": json.dumps(context or {})
+            "sync_data": dumps(metadata or {}),
+            "context": dumps(context or {})
         }
         self.logger.log(payload, blocking=True)
 
@@ -123,8 +124,8 @@ class WeavexServicesLogger:
             "duration_ms": int(duration_ms),
             "status": status,
             # Stringify JSON fields
-            "metadata": json.dumps(metadata or {}),
-            "context": json.dumps(context or {})
+            "metadata": dumps(metadata or {}),
+            "context": dumps(context or {})
         }
         self.logger.log(payload, blocking=True)
 
@@ -1,5 +1,4 @@
 import sys
-import json
 import time
 import queue
 import threading
@@ -11,6 +10,7 @@ from google.api_core.exceptions import GoogleAPICallError
 from google.cloud import pubsub_v1
 
 from .base import BaseLogger
+from ..json_codec import dumps, dumps_bytes
 
 # -------------------------------------------------------------------------
 # STDOUT LOGGER (Local Dev)
@@ -19,7 +19,7 @@ class StdoutLogger(BaseLogger):
     def log(self, payload: dict, blocking: bool = False):
         data = self._enrich(payload)
         # We print JSON so it's parsable by tools like Datadog/CloudWatch if needed
-        print(json.dumps(data, default=str), flush=True)
+        print(dumps(data, default=str), flush=True)
 
     def flush(self):
         sys.stdout.flush()
@@ -44,7 +44,7 @@ class StdoutLogger(BaseLogger):
 
         # Write to stderr for errors so they flag immediately in consoles
         stream = sys.stderr if severity in ["ERROR", "CRITICAL"] else sys.stdout
-        print(json.dumps(payload, default=str), file=stream, flush=True)
+        print(dumps(payload, default=str), file=stream, flush=True)
 
     def info(self, message: str, **kwargs):
         """Log simple info messages."""
@@ -79,11 +79,11 @@ class PubSubLogger(BaseLogger):
         if log_table == "UNKNOWN":
             # Wrap the original payload in a single key
             # This matches a BigQuery schema with a single 'raw_payload' JSON/STRING column
-            payload = {"raw_payload": json.dumps(payload or {})}
+            payload = {"raw_payload": dumps(payload or {})}
 
         # 2. Standard enrichment
         data = self._enrich(payload)
-        message_bytes = json.dumps(data, default=str).encode("utf-8")
+        message_bytes = dumps_bytes(data, default=str)
         # print(message_bytes, flush=True)
 
         # 3. Publish with 'log_table' as a metadata attribute
@@ -120,8 +120,8 @@ class PubSubLogger(BaseLogger):
             "severity": severity,
             "message": message,
             "sync_id": sync_id,
-            "context": json.dumps(context),
-            "details": json.dumps(details),  # Remaining kwargs
+            "context": dumps(context),
+            "details": dumps(details),  # Remaining kwargs
         }
 
         # 3. Ingest via Pub/Sub
@@ -129,7 +129,7 @@ class PubSubLogger(BaseLogger):
 
         # 4. Local console print (enriched with event_id/timestamp from self.log)
         stream = sys.stderr if severity in ["ERROR", "CRITICAL"] else sys.stdout
-        print(json.dumps(payload, default=str), file=stream, flush=True)
+        print(dumps(payload, default=str), file=stream, flush=True)
 
     def info(self, message: str, **kwargs):
         """Log simple info messages."""
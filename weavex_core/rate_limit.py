@@ -0,0 +1,250 @@
+# weavex_core/rate_limit.py
+#
+# Client-side token-bucket rate limiter per integration, driven by the
+# rateLimitSpec bundled with vault credentials (credentials["__rateLimitSpec"]).
+# Callers reserve capacity before sending so vendor quota is not burnt on 429s.
+#
+# Buckets are shared by all threads of the process. Setting
+# WEAVEX_RATE_LIMIT_DIR to a node-local directory also shares them across
+# processes through a small file-locked state file per integration. Such a
+# bucket blocks on flock() — asyncio callers run it in a worker thread.
+#
+# Recognised rateLimitSpec keys:
+#   requestsPerSecond | requestsPerMinute | requestsPerHour   sustained rate
+#   burst                                                      bucket capacity — defaults to
+#                                                              WEAVEX_RATE_LIMIT_BURST_SECONDS (2)
+#                                                              of the rate, at most one window
+#   remainingHeader   (default X-RateLimit-Remaining / RateLimit-Remaining)
+#   resetHeader       (default X-RateLimit-Reset / RateLimit-Reset)
+#
+# Usage:
+#   limiter = get_rate_limiter(integration_id, credentials.get("__rateLimitSpec"))
+#   if limiter:
+#       time.sleep(limiter.reserve())        # or: await asyncio.sleep(limiter.reserve())
+#       ...send...
+#       limiter.observe(response.headers)
+
+import os
+import time
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:          # non-POSIX — cross-process sharing unavailable
+    fcntl = None
+
+
+DEFAULT_REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining")
+DEFAULT_RESET_HEADERS     = ("x-ratelimit-reset", "ratelimit-reset")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Without an explicit burst, a full bucket holds this many seconds of the rate,
+# so a requestsPerHour limit does not allow the whole hour in one go.
+BURST_SECONDS = _env_float("WEAVEX_RATE_LIMIT_BURST_SECONDS", 2.0)
+
+
+_WINDOWS = {
+    "requestsPerSecond": 1.0,
+    "requestsPerMinute": 60.0,
+    "requestsPerHour":   3600.0,
+}
+
+
+def _header(headers: dict, names) -> Optional[str]:
+    lowered = {k.lower(): v for k, v in (headers or {}).items()}
+    for name in names:
+        value = lowered.get(name.lower())
+        if value is not None:
+            return value
+    return None
+
+
+def _reset_seconds(value: str, now: float) -> Optional[float]:
+    """Reset headers come as delta-seconds, epoch seconds or epoch millis."""
+    try:
+        reset = float(value)
+    except (TypeError, ValueError):
+        return None
+    if reset > 1e12:
+        return max(0.0, reset / 1000.0 - now)
+    if reset > 1e9:
+        return max(0.0, reset - now)
+    return max(0.0, reset)
+
+
+# ── Bucket ────────────────────────────────────────────────────────────────────
+
+class TokenBucket:
+    """
+    Reservation-based token bucket. reserve() always succeeds and returns how
+    long the caller must wait, so it works for both threads and asyncio tasks.
+    """
+
+    blocking = False    # True when calls do file I/O and must stay off an event loop
+
+    def __init__(
+            self,
+            rate:              float,
+            capacity:          float,
+            remaining_headers: tuple = DEFAULT_REMAINING_HEADERS,
+            reset_headers:     tuple = DEFAULT_RESET_HEADERS
+    ):
+        self.rate              = rate
+        self.capacity          = capacity
+        self.remaining_headers = remaining_headers
+        self.reset_headers     = reset_headers
+        self._lock             = threading.Lock()
+        self._tokens           = capacity
+        self._updated          = time.time()
+        self._paused_until     = 0.0
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._guarded() as now:
+            self._refill(now)
+            self._tokens -= tokens
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Stops every caller until `seconds` from now (e.g. after a 429 Retry-After)."""
+        with self._guarded() as now:
+            self._paused_until = max(self._paused_until, now + seconds)
+
+    def observe(self, headers: dict) -> None:
+        """Tightens the local estimate from vendor quota headers."""
+        remaining = _header(headers, self.remaining_headers)
+        if remaining is None:
+            return
+        try:
+            remaining = float(remaining)
+        except ValueError:
+            return
+        reset_value = _header(headers, self.reset_headers)
+        with self._guarded() as now:
+            self._refill(now)
+            # Other clients share the vendor quota — trust the server when it is lower.
+            self._tokens = min(self._tokens, remaining)
+            reset = _reset_seconds(reset_value, now)
+            if remaining <= 0 and reset:
+                self._paused_until = max(self._paused_until, now + reset)
+
+    @contextmanager
+    def _guarded(self):
+        with self._lock:
+            yield time.time()
+
+    def _refill(self, now: float) -> None:
+        elapsed       = max(0.0, now - self._updated)
+        self._tokens  = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+
+class _FileTokenBucket(TokenBucket):
+    """TokenBucket whose state lives in a flock()-guarded file shared by every process on the node."""
+
+    blocking = True
+
+    def __init__(self, path: str, rate: float, capacity: float, **kwargs):
+        super().__init__(rate, capacity, **kwargs)
+        self._path = path
+
+    @contextmanager
+    def _guarded(self):
+        """Loads shared state under an exclusive flock, yields `now`, writes it back."""
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    self._tokens, self._updated, self._paused_until = (
+                        float(v) for v in os.read(fd, 128).decode().split()
+                    )
+                except ValueError:
+                    pass     # new or corrupt file — keep in-memory state
+                yield time.time()
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, f"{self._tokens} {self._updated} {self._paused_until}".encode())
+            finally:
+                os.close(fd)     # closing the descriptor releases the flock
+
+
+# ── Registry ──────────────────────────────────────────────────────────────────
+
+def _parse_spec(spec: dict) -> Optional[tuple]:
+    for key, window in _WINDOWS.items():
+        limit = spec.get(key)
+        if limit:
+            try:
+                limit = float(limit)
+            except (TypeError, ValueError):
+                continue
+            rate     = limit / window
+            capacity = float(spec.get("burst") or rate * min(window, BURST_SECONDS))
+            return rate, max(1.0, capacity)
+    return None
+
+
+class _RateLimiterRegistry:
+    def __init__(self):
+        self._buckets: dict[str, tuple[tuple, TokenBucket]] = {}
+        self._lock:    threading.Lock                      = threading.Lock()
+
+    def get(self, integration_id: str, spec: Optional[dict]) -> Optional[TokenBucket]:
+        if not spec:
+            return None
+        parsed = _parse_spec(spec)
+        if not parsed:
+            return None
+        signature = (
+            parsed,
+            spec.get("remainingHeader"),
+            spec.get("resetHeader")
+        )
+        with self._lock:
+            entry = self._buckets.get(integration_id)
+            if entry and entry[0] == signature:
+                return entry[1]
+            bucket = self._build(integration_id, parsed, spec)
+            self._buckets[integration_id] = (signature, bucket)
+            return bucket
+
+    def _build(self, integration_id: str, parsed: tuple, spec: dict) -> TokenBucket:
+        rate, capacity = parsed
+        kwargs = {}
+        if spec.get("remainingHeader"):
+            kwargs["remaining_headers"] = (spec["remainingHeader"],)
+        if spec.get("resetHeader"):
+            kwargs["reset_headers"] = (spec["resetHeader"],)
+
+        shared_dir = os.environ.get("WEAVEX_RATE_LIMIT_DIR")
+        if shared_dir and fcntl is not None:
+            os.makedirs(shared_dir, exist_ok=True)
+            name = hashlib.sha256(integration_id.encode()).hexdigest()[:32]
+            return _FileTokenBucket(os.path.join(shared_dir, f"{name}.bucket"), rate, capacity, **kwargs)
+        return TokenBucket(rate, capacity, **kwargs)
+
+    def _reset_after_fork(self) -> None:
+        self._lock    = threading.Lock()
+        self._buckets = {}
+
+
+_registry = _RateLimiterRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry._reset_after_fork)
+
+
+def get_rate_limiter(integration_id: str, spec: Optional[dict]) -> Optional[TokenBucket]:
+    """Returns the shared bucket for an integration, or None if the spec sets no rate."""
+    return _registry.get(integration_id, spec)
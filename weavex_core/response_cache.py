@@ -0,0 +1,330 @@
+# weavex_core/response_cache.py
+#
+# Conditional-request cache for idempotent vendor GET/HEAD calls.
+# Stores the raw response together with its validators (ETag / Last-Modified);
+# later calls send If-None-Match / If-Modified-Since and a 304 is answered
+# from the cache, so unchanged reference data costs a header round trip
+# instead of a full download.
+#
+# Entries are always revalidated — the cache never serves without asking the
+# vendor — so it is safe for any endpoint that emits validators.
+#
+# Tiers:
+#   memory  LRU bounded by total content bytes (WEAVEX_RESPONSE_CACHE_MAX_BYTES, default 64 MB)
+#   disk    optional, one file per entry under WEAVEX_RESPONSE_CACHE_DIR, bounded
+#           by WEAVEX_RESPONSE_CACHE_DISK_MAX_BYTES (default 512 MB)
+#
+# Entries are keyed per integration and each integration gets its own disk
+# directory, so tenants never share entries.
+#
+# Usage (opt-in per call):
+#   result = execute_api(context, integration_id, "GET", "/v1/meta/lists", cache=True)
+#
+#   configure_response_cache(max_bytes=256 * 1024 * 1024, disk_dir="/var/cache/weavex")
+#   get_response_cache_stats()
+
+import os
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from .json_codec import dumps_bytes, loads, canonical_dumps
+
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+# Describe the stored body, not the cached representation — dropped on store.
+_HOP_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "connection")
+
+
+@dataclass
+class _CachedResponse:
+    status_code:   int
+    headers:       dict[str, str]
+    content:       bytes
+    etag:          Optional[str]
+    last_modified: Optional[str]
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, not_modified: httpx.Response) -> httpx.Response:
+        """Rebuilds the full response, refreshed with headers from the 304 (RFC 9111 §4.3.4)."""
+        headers = dict(self.headers)
+        for name, value in not_modified.headers.items():
+            if name.lower() not in _HOP_HEADERS:
+                headers[name.lower()] = value
+        return httpx.Response(self.status_code, headers=headers, content=self.content)
+
+
+@dataclass
+class ResponseCacheStats:
+    hits:      int        # 304s answered from the cache
+    misses:    int        # cacheable calls with no stored entry
+    stores:    int
+    evictions: int
+    disk_hits: int        # entries promoted from the disk tier
+    entries:   int
+    bytes:     int
+
+
+class ResponseCache:
+    def __init__(
+            self,
+            max_bytes:      int           = 64 * 1024 * 1024,
+            disk_dir:       Optional[str] = None,
+            max_disk_bytes: int           = 512 * 1024 * 1024
+    ):
+        self._max_bytes      = max_bytes
+        self._disk_dir       = disk_dir
+        self._max_disk_bytes = max_disk_bytes
+        self._disk_written   = 0
+        self._lock           = threading.Lock()
+        self._entries:  OrderedDict[tuple, _CachedResponse] = OrderedDict()
+        self._bytes     = 0
+        self._hits      = 0
+        self._misses    = 0
+        self._stores    = 0
+        self._evictions = 0
+        self._disk_hits = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, mode=0o700, exist_ok=True)
+
+    @property
+    def on_disk(self) -> bool:
+        """True when lookups and stores may touch the disk tier."""
+        return bool(self._disk_dir)
+
+    @staticmethod
+    def key(integration_id: str, method: str, url: str, extra_headers: dict) -> tuple:
+        """Auth headers are left out on purpose — they rotate with every token refresh."""
+        varying = tuple(sorted((k.lower(), str(v)) for k, v in (extra_headers or {}).items()))
+        return integration_id, method.upper(), url, varying
+
+    def get(self, key: tuple) -> Optional[_CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._insert(key, entry)
+        return entry
+
+    def hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def store(self, key: tuple, response: httpx.Response) -> None:
+        """Keeps a 200 that carries a validator; a 200 without one drops the old entry."""
+        entry = self._cacheable(response)
+        if entry is None:
+            self.discard(key)
+            return
+        with self._lock:
+            self._stores += 1
+            self._insert(key, entry)
+        self._write_disk(key, entry)
+
+    def discard(self, key: tuple) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+        path = self._disk_path(key)
+        if path:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def evict(self, integration_id: str) -> None:
+        """Drops every entry of one integration, in memory and on disk."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == integration_id]:
+                self._bytes -= self._entries.pop(key).size
+        if self._disk_dir:
+            shutil.rmtree(os.path.join(self._disk_dir, _digest(integration_id)), ignore_errors=True)
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                hits      = self._hits,
+                misses    = self._misses,
+                stores    = self._stores,
+                evictions = self._evictions,
+                disk_hits = self._disk_hits,
+                entries   = len(self._entries),
+                bytes     = self._bytes
+            )
+
+    @staticmethod
+    def _cacheable(response: httpx.Response) -> Optional[_CachedResponse]:
+        if response.status_code != 200:
+            return None
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return None
+        etag          = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            return None
+        return _CachedResponse(
+            status_code   = response.status_code,
+            headers       = {k.lower(): v for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS},
+            content       = response.content,
+            etag          = etag,
+            last_modified = last_modified
+        )
+
+    def _insert(self, key: tuple, entry: _CachedResponse) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        if entry.size > self._max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes       += entry.size
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes     -= evicted.size
+            self._evictions += 1
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    # ── Disk tier ─────────────────────────────────────────────────────────────
+
+    def _disk_path(self, key: tuple) -> Optional[str]:
+        if not self._disk_dir:
+            return None
+        return os.path.join(self._disk_dir, _digest(key[0]), _digest(canonical_dumps(key[1:])))
+
+    def _read_disk(self, key: tuple) -> Optional[_CachedResponse]:
+        path = self._disk_path(key)
+        if not path:
+            return None
+        try:
+            with open(path, "rb") as f:
+                meta    = loads(f.readline())
+                content = f.read()
+            os.utime(path)          # mtime doubles as last-access time for eviction
+        except (OSError, ValueError):
+            return None
+        try:
+            return _CachedResponse(content=content, **meta)
+        except TypeError:
+            return None             # corrupt or foreign meta line — a miss
+
+    def _write_disk(self, key: tuple, entry: _CachedResponse) -> None:
+        path = self._disk_path(key)
+        if not path or entry.size > self._max_disk_bytes:
+            return
+        meta = {
+            "status_code":   entry.status_code,
+            "headers":       entry.headers,
+            "etag":          entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            fd  = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps_bytes(meta) + b"\n")
+                f.write(entry.content)
+            os.replace(tmp, path)
+        except OSError:
+            return
+        with self._lock:
+            self._disk_written += entry.size
+            over = self._disk_written > self._max_disk_bytes // 10
+            if over:
+                self._disk_written = 0
+        if over:
+            self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        """Deletes least recently used files until the tier is back under 90% of its budget."""
+        files = []
+        for root, _, names in os.walk(self._disk_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self._max_disk_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()[:32]
+
+
+# ── Process-wide cache ────────────────────────────────────────────────────────
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _from_env() -> ResponseCache:
+    return ResponseCache(
+        max_bytes      = _env_int("WEAVEX_RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+        disk_dir       = os.environ.get("WEAVEX_RESPONSE_CACHE_DIR") or None,
+        max_disk_bytes = _env_int("WEAVEX_RESPONSE_CACHE_DISK_MAX_BYTES", 512 * 1024 * 1024)
+    )
+
+
+_cache = _from_env()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: _cache._reset_after_fork())
+
+
+def get_response_cache() -> ResponseCache:
+    return _cache
+
+
+def configure_response_cache(
+        max_bytes:      int           = 64 * 1024 * 1024,
+        disk_dir:       Optional[str] = None,
+        max_disk_bytes: int           = 512 * 1024 * 1024
+) -> None:
+    """Replaces the process-wide cache. Existing in-memory entries are dropped."""
+    global _cache
+    _cache = ResponseCache(max_bytes=max_bytes, disk_dir=disk_dir, max_disk_bytes=max_disk_bytes)
+
+
+def get_response_cache_stats() -> ResponseCacheStats:
+    return _cache.stats()
@@ -0,0 +1,126 @@
+# weavex_core/retry_budget.py
+#
+# Process-wide retry budget. Every execute_api call deposits `ratio` of a
+# retry and every retry withdraws one, so retries can add at most ~ratio
+# extra load on top of first attempts (10% by default). A small per-second
+# allowance keeps retries possible when traffic is low.
+#
+# When a vendor struggles, this is what stops N workers × max_retries from
+# turning into a retry storm: once the budget is spent, failures are returned
+# to the caller instead of being retried.
+#
+# Tuning (env):
+#   WEAVEX_RETRY_BUDGET_RATIO           default 0.1   ("off" disables the budget)
+#   WEAVEX_RETRY_BUDGET_MIN_PER_SECOND  default 1.0
+#   WEAVEX_RETRY_BUDGET_MAX             default 20    (largest burst of retries)
+
+import os
+import time
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class RetryBudgetStats:
+    requests: int        # calls that deposited into the budget
+    retries:  int        # retries the budget allowed
+    rejected: int        # retries refused because the budget was spent
+    balance:  float
+
+
+class RetryBudget:
+    def __init__(
+            self,
+            ratio:          Optional[float] = 0.1,
+            min_per_second: float           = 1.0,
+            max_balance:    float           = 20.0
+    ):
+        self.ratio          = ratio
+        self.min_per_second = min_per_second
+        self.max_balance    = max_balance
+        self._lock          = threading.Lock()
+        self._balance       = max_balance
+        self._updated       = time.monotonic()
+        self._requests      = 0
+        self._retries       = 0
+        self._rejected      = 0
+
+    def deposit(self) -> None:
+        """Called once per logical call, before its first attempt."""
+        with self._lock:
+            self._requests += 1
+            if self.ratio is not None:
+                self._refill()
+                self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """True if one more retry may be sent."""
+        with self._lock:
+            if self.ratio is None:
+                self._retries += 1
+                return True
+            self._refill()
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                self._retries += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def stats(self) -> RetryBudgetStats:
+        with self._lock:
+            return RetryBudgetStats(
+                requests = self._requests,
+                retries  = self._retries,
+                rejected = self._rejected,
+                balance  = self._balance
+            )
+
+    def _refill(self) -> None:
+        now           = time.monotonic()
+        self._balance = min(self.max_balance, self._balance + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _from_env() -> RetryBudget:
+    ratio = os.environ.get("WEAVEX_RETRY_BUDGET_RATIO", "0.1").strip().lower()
+    return RetryBudget(
+        ratio          = None if ratio in ("off", "none", "") else _env_float("WEAVEX_RETRY_BUDGET_RATIO", 0.1),
+        min_per_second = _env_float("WEAVEX_RETRY_BUDGET_MIN_PER_SECOND", 1.0),
+        max_balance    = _env_float("WEAVEX_RETRY_BUDGET_MAX", 20.0)
+    )
+
+
+_budget = _from_env()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: _budget._reset_after_fork())
+
+
+def get_retry_budget() -> RetryBudget:
+    return _budget
+
+
+def configure_retry_budget(
+        ratio:          Optional[float] = 0.1,
+        min_per_second: float           = 1.0,
+        max_balance:    float           = 20.0
+) -> None:
+    """Replaces the process-wide budget. ratio=None removes the limit."""
+    global _budget
+    _budget = RetryBudget(ratio=ratio, min_per_second=min_per_second, max_balance=max_balance)
+
+
+def get_retry_budget_stats() -> RetryBudgetStats:
+    return _budget.stats()
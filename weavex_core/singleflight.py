@@ -0,0 +1,115 @@
+# weavex_core/singleflight.py
+#
+# Duplicate-call suppression: concurrent callers asking for the same key share
+# one execution of the underlying function and all receive its result (or its
+# exception). Once the call completes, the next caller starts a fresh one.
+#
+# Usage:
+#   _flight = SingleFlight()
+#
+#   value, shared = _flight.do(integration_id, _refresh, integration_id, credentials)
+#   # shared=True → this caller waited on another thread's call
+#
+#   # asyncio — coroutines on the same event loop share one task
+#   _async_flight = AsyncSingleFlight()
+#   value, shared = await _async_flight.do(key, fetch, path)
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done    = threading.Event()
+        self.result  = None
+        self.error   = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock:   threading.Lock        = threading.Lock()
+        self._calls:  dict[Hashable, _Call] = {}
+        self._shared: int                   = 0
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> tuple[Any, bool]:
+        """Runs fn once per key across concurrent callers. Returns (result, shared)."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    @property
+    def shared_count(self) -> int:
+        """Total callers that attached to another caller's execution."""
+        return self._shared
+
+    def reset(self) -> None:
+        """Forgets in-flight calls — only for use in a freshly forked child."""
+        self._lock  = threading.Lock()
+        self._calls = {}
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines. Calls are shared per event loop, never across loops."""
+
+    def __init__(self):
+        self._calls:  dict[tuple, asyncio.Task] = {}
+        self._shared: int                       = 0
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable], *args, **kwargs) -> tuple[Any, bool]:
+        loop      = asyncio.get_running_loop()
+        loop_key  = (id(loop), key)
+        in_flight = self._calls.get(loop_key)
+        if in_flight is not None:
+            self._shared += 1
+            return await asyncio.shield(in_flight), True
+
+        # The call runs in its own task and every caller, the leader included,
+        # awaits it through shield: a cancelled caller stops waiting, but the
+        # shared call carries on for the others.
+        task = self._calls[loop_key] = loop.create_task(fn(*args, **kwargs))
+        task.add_done_callback(lambda done: self._finish(loop_key, done))
+        return await asyncio.shield(task), False
+
+    def _finish(self, loop_key: tuple, task: asyncio.Task) -> None:
+        if self._calls.get(loop_key) is task:
+            del self._calls[loop_key]
+        if not task.cancelled():
+            task.exception()        # mark retrieved — every caller may have gone
+
+    @property
+    def shared_count(self) -> int:
+        return self._shared
+
+    def reset(self) -> None:
+        self._calls = {}
@@ -1,10 +1,11 @@
 import os
 import hashlib
-import json
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 from google.cloud import firestore
 
+from .json_codec import canonical_dumps
+
 class StateStore(ABC):
     """Abstract interface for Sync State Management."""
 
@@ -140,13 +141,7 @@ class FirestoreStateStore(StateStore):
         Returns:
             A hex-encoded SHA-256 digest string.
         """
-        serialized = json.dumps(
-            obj,
-            sort_keys=True,          # dict key order never affects the output
-            separators=(",", ":"),   # no incidental whitespace differences
-            default=str,             # gracefully stringify non-JSON-native types
-            ensure_ascii=True,
-        )
+        serialized = canonical_dumps(obj)    # stdlib, byte-identical across JSON backends
         return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
     def get_sync_hash(self, project_id: str, sync_id: str, record_id: str) -> Optional[str]:
@@ -188,13 +183,7 @@ class FirestoreStateStore(StateStore):
         Returns:
             A hex-encoded SHA-256 digest string.
         """
-        serialized = json.dumps(
-            obj,
-            sort_keys=True,          # dict key order never affects the output
-            separators=(",", ":"),   # no incidental whitespace differences
-            default=str,             # gracefully stringify non-JSON-native types
-            ensure_ascii=True,
-        )
+        serialized = canonical_dumps(obj)    # stdlib, byte-identical across JSON backends
         return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
     # Deprecated: use get_sync_hash() instead. Kept for backward compatibility.
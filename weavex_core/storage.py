@@ -1,10 +1,11 @@
 import os
-import json
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import Any
 from google.cloud import storage
 
+from .json_codec import dumps_bytes, loads
+
 
 class ObjectStore(ABC):
     """Abstract interface for Object Storage."""
@@ -81,7 +82,7 @@ class GCSObjectStore(ObjectStore):
         full_path = f"{project_id}/{sync_id}/{key}"
         blob = self.bucket.blob(full_path)
 
-        blob.upload_from_string(data=json.dumps(data), content_type="application/json")
+        blob.upload_from_string(data=dumps_bytes(data), content_type="application/json")
 
         return f"gs://{self.bucket_name}/{full_path}"
 
@@ -111,7 +112,7 @@ class GCSObjectStore(ObjectStore):
         )
         blob = target_bucket.blob(blob_path)
 
-        return json.loads(blob.download_as_text())
+        return loads(blob.download_as_bytes())
 
     def delete_json(self, project_id: str, sync_id: str, uri: str) -> bool:
         if not uri.startswith("gs://"):
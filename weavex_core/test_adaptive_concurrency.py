@@ -0,0 +1,64 @@
+from weavex_core.adaptive_concurrency import AdaptiveLimiter
+
+
+def _run(limiter: AdaptiveLimiter, calls: int, latency: float = 0.01, overloaded: bool = False) -> None:
+    """Completes `calls` calls while keeping every slot busy, so the limit is the bottleneck."""
+    in_flight = 0
+    for _ in range(calls):
+        while limiter.try_acquire():
+            in_flight += 1
+        limiter.release(latency, overloaded=overloaded)
+        in_flight -= 1
+    for _ in range(in_flight):
+        limiter.cancel()
+
+
+def test_additive_increase_while_the_limit_is_used():
+    limiter = AdaptiveLimiter("int_1", initial_limit=4, max_limit=8)
+    _run(limiter, 4)
+    assert limiter.limit == 5
+    _run(limiter, 200)
+    assert limiter.limit == 8
+
+
+def test_idle_limiter_does_not_grow():
+    limiter = AdaptiveLimiter("int_1", initial_limit=8)
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(0.01)
+    assert limiter.limit == 8
+
+
+def test_one_overload_burst_is_one_decrease():
+    limiter = AdaptiveLimiter("int_1", initial_limit=16)
+    for _ in range(16):
+        limiter.acquire()
+    for _ in range(16):
+        limiter.release(0.01, overloaded=True)
+    state = limiter.state()
+    assert state.limit == 8
+    assert state.decreases == 1
+
+
+def test_never_below_min_limit():
+    limiter = AdaptiveLimiter("int_1", initial_limit=2, min_limit=1)
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(0.01, overloaded=True)
+    assert limiter.limit == 1
+
+
+def test_latency_above_tolerance_cuts_the_limit():
+    limiter = AdaptiveLimiter("int_1", initial_limit=4, max_limit=4, window=10)
+    _run(limiter, 10, latency=0.010)
+    assert limiter.state().baseline_ms == 10
+    _run(limiter, 10, latency=0.050)
+    assert limiter.limit == 2
+
+
+def test_try_acquire_respects_the_limit_and_cancel_frees_a_slot():
+    limiter = AdaptiveLimiter("int_1", initial_limit=2)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+    limiter.cancel()
+    assert limiter.try_acquire()
@@ -0,0 +1,182 @@
+import dataclasses
+import threading
+import time
+from contextlib import ExitStack
+
+import pytest
+
+from weavex_core import api
+from weavex_core.api import VendorResponse, make_passthrough_call, make_passthrough_calls, make_passthrough_call_normalised
+from weavex_core.benchmarks.mock_proxy import MockProxy
+from weavex_core.benchmarks.mock_vendor import MockVendor, VendorProfile
+from weavex_core.execute_api import ApiResponse, RetryConfig
+
+
+CONTEXT    = {"knit_api_key": "test-key", "execution_id": "exec_1"}
+FAST_RETRY = RetryConfig(backoff_seconds=0.01, max_backoff_seconds=0.05, max_retries=2)
+
+
+class _FailingBatchProxy(MockProxy):
+    """Answers every batch envelope with a fixed status; single calls work."""
+
+    def __init__(self, upstream, batch_status: int):
+        super().__init__(upstream)
+        self.batch_status   = batch_status
+        self.batch_attempts = 0
+
+    def handle(self, method, path, headers, body):
+        if path.endswith(".batch"):
+            with self._lock:
+                self.batch_attempts += 1
+            return self.batch_status, {}, b'{"success": false, "error": {"msg": "proxy overloaded"}}'
+        return super().handle(method, path, headers, body)
+
+
+@pytest.fixture
+def passthrough(monkeypatch):
+    """start(proxy_factory) → (vendor, proxy) with make_passthrough_call pointed at the proxy."""
+    monkeypatch.setattr(api, "_batch_unsupported", {})
+    with ExitStack() as stack:
+        def start(proxy_factory=MockProxy, profile=None):
+            vendor = stack.enter_context(MockVendor(profile or VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, items=2)))
+            proxy  = stack.enter_context(proxy_factory(vendor))
+            monkeypatch.setenv("WEAVEX_PASSTHROUGH_URL", proxy.passthrough_url)
+            return vendor, proxy
+
+        yield start
+
+
+def _calls(count: int) -> list[dict]:
+    return [{"method": "GET", "path": f"/v1/employees?page={i}"} for i in range(count)]
+
+
+def test_single_call_unwraps_the_envelope(passthrough):
+    passthrough()
+    response = make_passthrough_call(CONTEXT, "int_1", "GET", "/v1/employees")
+    assert response.status_code == 200
+    assert [item["id"] for item in response.body["items"]] == [0, 1]
+    assert response.actual_resp is None
+
+
+def test_double_encoded_body_is_decoded(passthrough):
+    passthrough(lambda vendor: MockProxy(vendor, double_encode=True))
+    assert make_passthrough_call(CONTEXT, "int_1", "GET", "/v1/employees").body["items"][0]["id"] == 0
+
+
+def test_batch_splits_into_envelopes_and_keeps_input_order(passthrough, monkeypatch):
+    monkeypatch.setattr(api, "PASSTHROUGH_BATCH_SIZE", 4)
+    _, proxy = passthrough()
+    calls    = _calls(10) + [{"method": "GET", "path": "/missing"}]
+
+    responses = make_passthrough_calls(CONTEXT, "int_1", calls, retry=FAST_RETRY)
+
+    assert [r.status_code for r in responses] == [200] * 10 + [404]
+    assert proxy.stats() == {"envelopes": 3, "batch_envelopes": 3, "forwarded": 11}
+
+
+def test_batch_not_found_falls_back_to_single_calls_and_is_remembered(passthrough):
+    _, proxy = passthrough(lambda vendor: MockProxy(vendor, batch=False))
+    responses = make_passthrough_calls(CONTEXT, "int_1", _calls(3), retry=FAST_RETRY)
+    make_passthrough_calls(CONTEXT, "int_1", _calls(3), retry=FAST_RETRY)
+
+    assert [r.status_code for r in responses] == [200] * 3
+    assert proxy.stats()["forwarded"] == 6
+    assert list(api._batch_unsupported) == [proxy.passthrough_url + ".batch"]
+
+
+@pytest.mark.parametrize("batch_status", [404, 405, 501])
+def test_batch_unsupported_is_remembered_for_the_ttl(passthrough, monkeypatch, batch_status):
+    _, proxy = passthrough(lambda vendor: _FailingBatchProxy(vendor, batch_status=batch_status))
+    make_passthrough_calls(CONTEXT, "int_1", _calls(2), retry=FAST_RETRY)
+    make_passthrough_calls(CONTEXT, "int_1", _calls(2), retry=FAST_RETRY)
+    assert proxy.batch_attempts == 1
+
+    monkeypatch.setattr(api, "PASSTHROUGH_BATCH_UNSUPPORTED_TTL", 0)
+    api._batch_unsupported.clear()
+    make_passthrough_calls(CONTEXT, "int_1", _calls(2), retry=FAST_RETRY)
+    make_passthrough_calls(CONTEXT, "int_1", _calls(2), retry=FAST_RETRY)
+    assert proxy.batch_attempts == 3
+
+
+def test_failed_envelope_is_surfaced_not_fanned_out(passthrough):
+    _, proxy  = passthrough(lambda vendor: _FailingBatchProxy(vendor, batch_status=503))
+    responses = make_passthrough_calls(CONTEXT, "int_1", _calls(5), retry=FAST_RETRY)
+
+    assert [r.status_code for r in responses] == [503] * 5
+    assert responses[0].body == "proxy overloaded"
+    assert proxy.batch_attempts == FAST_RETRY.max_retries + 1
+    assert proxy.stats()["forwarded"] == 0
+
+
+def test_retryable_entry_in_a_good_envelope_is_resent_alone(passthrough):
+    vendor, proxy = passthrough(profile=VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, rate_429=0.5, retry_after_seconds=0.01))
+    responses     = make_passthrough_calls(CONTEXT, "int_1", _calls(8), retry=RetryConfig(backoff_seconds=0.01, max_retries=8))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert proxy.stats()["batch_envelopes"] == 1
+    assert vendor.stats()["statuses"][429] > 0
+
+
+def test_keep_raw_keeps_each_entry(passthrough):
+    passthrough()
+    responses = make_passthrough_calls(CONTEXT, "int_1", _calls(2), keep_raw=True)
+    assert all(b'"statusCode": 200' in r.actual_resp or b'"statusCode":200' in r.actual_resp for r in responses)
+
+
+def test_vendor_response_is_still_a_dataclass():
+    response = VendorResponse._lazy(None, 200, '{"id": 1}', {"X-Id": "1"})
+
+    assert [f.name for f in dataclasses.fields(response)] == ["actual_resp", "status_code", "body", "headers"]
+    assert dataclasses.asdict(response) == {"actual_resp": None, "status_code": 200, "body": {"id": 1}, "headers": {"X-Id": "1"}}
+    assert dataclasses.replace(response, status_code=201).body == {"id": 1}
+    assert response == VendorResponse(None, 200, {"id": 1}, {"X-Id": "1"})
+
+
+def test_vendor_response_body_is_decoded_once_on_first_read():
+    response = VendorResponse._lazy(None, 200, '"{\\"id\\": 1}"', {})
+    assert response._encoded is not None
+    assert response.body == {"id": 1}
+    assert response._encoded is None
+    assert response.body is response.body
+
+    response.body = "replaced"
+    assert response.body == "replaced"
+
+
+def test_normalised_call_returns_a_plain_api_response(passthrough):
+    passthrough()
+    response = make_passthrough_call_normalised(CONTEXT, "int_1", "GET", "/v1/employees")
+    assert type(response) is ApiResponse
+    assert response.body["items"][1]["id"] == 1
+
+
+def test_concurrent_first_reads_all_see_the_decoded_body(monkeypatch):
+    decode = api._decode_body
+
+    def slow_decode(raw_body):
+        time.sleep(0.05)
+        return decode(raw_body)
+
+    monkeypatch.setattr(api, "_decode_body", slow_decode)
+    response = VendorResponse._lazy(None, 200, '{"id": 1}', {})
+    barrier  = threading.Barrier(8)
+    bodies   = []
+
+    def read():
+        barrier.wait()
+        bodies.append(response.body)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert bodies == [{"id": 1}] * 8
+    assert response.body == {"id": 1}
+
+
+def test_malformed_batch_settings_fall_back_to_the_defaults(import_constant):
+    env = {"WEAVEX_PASSTHROUGH_BATCH_SIZE": "fifty", "WEAVEX_PASSTHROUGH_BATCH_UNSUPPORTED_TTL": "5m"}
+    assert import_constant("weavex_core.api", "PASSTHROUGH_BATCH_SIZE", **env) == 50
+    assert import_constant("weavex_core.api", "PASSTHROUGH_BATCH_UNSUPPORTED_TTL", **env) == 300
@@ -0,0 +1,113 @@
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from weavex_core import circuit_breaker
+from weavex_core.circuit_breaker import BreakerConfig, CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+def _breaker(**overrides) -> CircuitBreaker:
+    config = BreakerConfig(failure_threshold=3, failure_rate=0.5, window=20, min_calls=10, open_seconds=30)
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return CircuitBreaker("int_1", "api.vendor.test", config)
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.config.failure_threshold):
+        breaker.admit().record_failure()
+
+
+def test_trips_on_consecutive_failures_and_fails_fast(clock):
+    breaker = _breaker()
+    _trip(breaker)
+    assert breaker.snapshot().state == OPEN
+    assert breaker.admit() is None
+    assert breaker.snapshot().rejected == 1
+
+
+def test_4xx_counts_as_success(clock):
+    breaker = _breaker()
+    for status in (400, 404, 429, 400):
+        breaker.admit().record_status(status)
+    assert breaker.snapshot().consecutive_failures == 0
+
+
+def test_trips_on_failure_rate_over_window(clock):
+    breaker = _breaker(failure_threshold=100)
+    for i in range(10):
+        breaker.admit().record_status(503 if i % 2 else 200)
+    assert breaker.snapshot().state == OPEN
+
+
+def test_late_results_from_before_the_trip_do_not_close_it(clock):
+    breaker   = _breaker()
+    in_flight = [breaker.admit() for _ in range(5)]
+    _trip(breaker)
+
+    for ticket in in_flight:
+        ticket.record_status(404)
+    assert breaker.snapshot().state == OPEN
+
+    clock.value += 30
+    probe = breaker.admit()
+    assert breaker.snapshot().state == HALF_OPEN
+    in_flight[0].record_status(200)
+    assert breaker.snapshot().state == HALF_OPEN
+    probe.record_status(200)
+    assert breaker.snapshot().state == CLOSED
+
+
+def test_only_one_probe_in_half_open_and_its_failure_reopens(clock):
+    breaker = _breaker()
+    _trip(breaker)
+    clock.value += 30
+    probe = breaker.admit()
+    assert probe is not None
+    assert breaker.admit() is None
+    probe.record_failure()
+    state = breaker.snapshot()
+    assert state.state == OPEN
+    assert state.retry_in_seconds == 30
+
+
+def test_lost_probe_is_replaced_and_its_late_answer_ignored(clock):
+    breaker = _breaker()
+    _trip(breaker)
+    clock.value += 30
+    lost = breaker.admit()
+    clock.value += 30
+    probe = breaker.admit()
+    assert probe is not None
+
+    lost.record_status(200)
+    assert breaker.snapshot().state == HALF_OPEN
+    probe.record_status(500)
+    assert breaker.snapshot().state == OPEN
+
+
+def test_untagged_success_does_not_close_an_open_breaker(clock):
+    breaker = _breaker()
+    _trip(breaker)
+    breaker.record_success()
+    assert breaker.snapshot().state == OPEN
+
+
+def test_malformed_env_falls_back_to_defaults(monkeypatch):
+    monkeypatch.setenv("WEAVEX_BREAKER_FAILURE_THRESHOLD", "five")
+    monkeypatch.setenv("WEAVEX_BREAKER_OPEN_SECONDS", "30s")
+    try:
+        module = importlib.reload(circuit_breaker)
+        assert module.BreakerConfig().failure_threshold == 5
+        assert module.BreakerConfig().open_seconds == 30
+    finally:
+        monkeypatch.undo()
+        importlib.reload(circuit_breaker)
@@ -0,0 +1,116 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import httpx
+import pytest
+
+from weavex_core.compression import CompressionConfig, compress_body, available_encodings
+from weavex_core.execute_api import _prepare_request, execute_api, execute_api_async
+
+
+SPEC = {"requestEncoding": "gzip", "minBytes": 100}
+BODY = {"rows": [{"id": i, "name": "row"} for i in range(50)]}
+
+
+def _credentials(**extra) -> dict:
+    return {"authType": "bearer", "accessToken": "t", "baseUrl": "https://api.vendor.test", **extra}
+
+
+# ── compress_body ─────────────────────────────────────────────────────────────
+
+def test_spec_picks_the_first_installed_encoding():
+    assert CompressionConfig.from_spec({"requestEncoding": ["snappy", "GZIP"]}).encoding == "gzip"
+    assert CompressionConfig.from_spec({"requestEncoding": "deflate", "minBytes": 10}).min_bytes == 10
+    assert CompressionConfig.from_spec({"requestEncoding": ["snappy"]}).encoding is None
+    assert CompressionConfig.from_spec(None).encoding is None
+    assert {"gzip", "deflate"} <= set(available_encodings())
+
+
+def test_bodies_below_the_threshold_are_left_alone():
+    assert compress_body(b"x" * 99, SPEC) == (b"x" * 99, None)
+    content, encoding = compress_body(b"x" * 100, SPEC)
+    assert encoding == "gzip" and gzip.decompress(content) == b"x" * 100
+
+
+def test_gzip_and_deflate_round_trip_text():
+    text = "snow ☃ " * 200
+    content, _ = compress_body(text, SPEC)
+    assert gzip.decompress(content).decode() == text
+    content, _ = compress_body(text, {"requestEncoding": "deflate", "minBytes": 0})
+    assert zlib.decompress(content).decode() == text
+
+
+def test_streaming_bodies_and_disabled_specs_are_untouched():
+    rows = iter([b"a" * 4096])
+    assert compress_body(rows, SPEC) == (rows, None)
+    assert compress_body(b"x" * 4096, {}) == (b"x" * 4096, None)
+
+
+# ── _prepare_request ──────────────────────────────────────────────────────────
+
+def test_prepare_request_compresses_and_rewrites_headers():
+    request = _prepare_request(
+        _credentials(__compressionSpec=SPEC), "POST", "/v1/rows", {"Content-Length": "9999"}, BODY, "application/json"
+    )
+    assert request["headers"]["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in request["headers"]
+    assert json.loads(gzip.decompress(request["content"])) == BODY
+
+
+def test_an_already_encoded_body_is_sent_as_is():
+    encoded = gzip.compress(b"x" * 4096)
+    request = _prepare_request(
+        _credentials(__compressionSpec=SPEC), "POST", "/v1/rows", {"content-encoding": "gzip"}, encoded, "text/plain"
+    )
+    assert request["content"] is encoded
+    assert request["headers"]["content-encoding"] == "gzip"
+    assert "Content-Encoding" not in request["headers"]
+
+
+def test_requests_without_a_body_are_not_touched():
+    request = _prepare_request(_credentials(__compressionSpec=SPEC), "GET", "/v1/rows", {}, None, "application/json")
+    assert request["content"] is None
+    assert "Content-Encoding" not in request["headers"]
+
+
+# ── On the wire ───────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def wire(monkeypatch, execute_api_module):
+    """Points an integration at a MockTransport and returns the requests it received."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(execute_api_module, "get_vendor_client", lambda base_url: httpx.Client(transport=transport))
+    monkeypatch.setattr(execute_api_module, "get_async_vendor_client", lambda base_url: httpx.AsyncClient(transport=transport))
+    execute_api_module._cache.set("int_compression", _credentials(__compressionSpec=SPEC))
+    yield sent
+    execute_api_module._cache.evict("int_compression")
+
+
+def _assert_compressed(request: httpx.Request) -> None:
+    assert request.headers["content-encoding"] == "gzip"
+    assert int(request.headers["content-length"]) == len(request.content)
+    assert json.loads(gzip.decompress(request.content)) == BODY
+
+
+def test_sync_calls_send_the_compressed_length(wire):
+    execute_api({}, "int_compression", "POST", "/v1/rows", headers={"Content-Length": "9999"}, body=BODY)
+    _assert_compressed(wire[0])
+
+
+def test_async_calls_send_the_compressed_length(wire):
+    asyncio.run(execute_api_async({}, "int_compression", "POST", "/v1/rows", body=BODY))
+    _assert_compressed(wire[0])
+
+
+def test_small_bodies_go_out_uncompressed(wire):
+    execute_api({}, "int_compression", "POST", "/v1/rows", body={"id": 1})
+    assert "content-encoding" not in wire[0].headers
+    assert json.loads(wire[0].content) == {"id": 1}
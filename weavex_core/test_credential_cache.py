@@ -0,0 +1,207 @@
+import asyncio
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from weavex_core.credential_store import SqliteCredentialStore
+from weavex_core.execute_api import _CredentialCache
+
+
+@pytest.fixture
+def clock(monkeypatch, execute_api_module):
+    """A fake time.time() for the cache; advance with clock.now += seconds."""
+    fake = SimpleNamespace(now=1_700_000_000.0)
+    monkeypatch.setattr(execute_api_module, "time", SimpleNamespace(time=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def inline_background(monkeypatch, execute_api_module):
+    """Runs background revalidation inline so the test can observe it."""
+    monkeypatch.setattr(execute_api_module, "_background", SimpleNamespace(submit=lambda fn, *args: fn(*args)))
+
+
+class _Vault:
+    def __init__(self):
+        self.fetches = 0
+        self.fail    = False
+        self.gate    = None     # threading.Event to hold fetches open
+
+    def __call__(self, integration_id: str) -> dict:
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.fetches += 1
+        if self.fail:
+            raise RuntimeError("vault down")
+        return {"accessToken": f"token-{self.fetches}"}
+
+
+def test_fresh_entries_are_served_without_a_fetch(clock):
+    cache, vault = _CredentialCache(ttl_seconds=300, jitter=0), _Vault()
+    assert cache.get_or_load("int_1", vault)["accessToken"] == "token-1"
+    clock.now += 299
+    assert cache.get_or_load("int_1", vault)["accessToken"] == "token-1"
+    assert vault.fetches == 1
+    assert cache.stats().hits == 1
+
+
+def test_stale_entries_are_served_while_one_refresh_runs(clock, inline_background):
+    cache, vault = _CredentialCache(ttl_seconds=300, stale_seconds=120, jitter=0), _Vault()
+    cache.get_or_load("int_1", vault)
+
+    clock.now += 350
+    assert cache.get_or_load("int_1", vault)["accessToken"] == "token-1"    # stale, refreshed behind it
+    assert cache.get_or_load("int_1", vault)["accessToken"] == "token-2"
+    assert cache.stats().stale_hits == 1 and vault.fetches == 2
+
+
+def test_past_the_stale_window_the_caller_waits_for_a_fetch(clock):
+    cache, vault = _CredentialCache(ttl_seconds=300, stale_seconds=120, jitter=0), _Vault()
+    cache.get_or_load("int_1", vault)
+    clock.now += 421
+    assert cache.get("int_1") is None
+    assert cache.get_or_load("int_1", vault)["accessToken"] == "token-2"
+    assert cache.stats().misses == 2
+
+
+def test_a_failed_background_refresh_keeps_serving_the_stale_entry(clock, inline_background):
+    cache, vault = _CredentialCache(ttl_seconds=300, stale_seconds=120, jitter=0), _Vault()
+    cache.get_or_load("int_1", vault)
+    vault.fail = True
+    clock.now += 350
+    assert cache.get_or_load("int_1", vault)["accessToken"] == "token-1"
+    assert cache.get_or_load("int_1", vault)["accessToken"] == "token-1"
+
+
+def test_concurrent_misses_share_one_fetch():
+    cache, vault = _CredentialCache(), _Vault()
+    vault.gate   = threading.Event()
+    results      = []
+    threads      = [threading.Thread(target=lambda: results.append(cache.get_or_load("int_1", vault))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats().coalesced < 7 and time.monotonic() < deadline:    # every follower has joined
+        time.sleep(0.001)
+    vault.gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert vault.fetches == 1
+    assert all(r is results[0] for r in results)
+    assert cache.stats().coalesced == 7
+
+
+def test_jittered_ttl_stays_within_bounds(clock):
+    cache = _CredentialCache(ttl_seconds=100, stale_seconds=0, jitter=0.2)
+    for n in range(50):
+        cache.set(f"int_{n}", {})
+    fresh = [entry.fresh_until - clock.now for entry in cache._cache.values()]
+    assert all(80 <= ttl <= 100 for ttl in fresh)
+    assert len(set(fresh)) > 1
+
+
+def test_lru_eviction_and_explicit_evict(clock):
+    cache = _CredentialCache(max_size=2)
+    for name in ("a", "b", "c"):
+        cache.set(name, {"name": name})
+    assert cache.get("a") is None and cache.get("c") == {"name": "c"}
+    cache.evict("c")
+    assert cache.get("c") is None
+    assert cache.stats().evictions == 1
+
+
+def test_a_newer_entry_from_another_process_is_adopted(tmp_path, clock):
+    path   = str(tmp_path / "credentials.db")
+    first  = _CredentialCache(shared=SqliteCredentialStore(path))
+    second = _CredentialCache(shared=SqliteCredentialStore(path))
+
+    first.set("int_1", {"accessToken": "old"})
+    clock.now += 1
+    second.set("int_1", {"accessToken": "rotated"})
+
+    assert first.get("int_1") == {"accessToken": "rotated"}
+    assert first.stats().shared_hits == 1
+
+
+@pytest.fixture
+def shared_path(tmp_path):
+    return str(tmp_path / "credentials.db")
+
+
+def test_a_write_is_published_to_other_processes(shared_path, clock):
+    vault  = _Vault()
+    first  = _CredentialCache(shared=SqliteCredentialStore(shared_path))
+    second = _CredentialCache(shared=SqliteCredentialStore(shared_path))
+
+    first.get_or_load("int_1", vault)
+    assert second.get_or_load("int_1", vault) == {"accessToken": "token-1"}
+    assert vault.fetches == 1
+    assert second.stats().shared_hits == 1
+
+
+def test_a_fresh_entry_checks_the_shared_store_at_most_every_interval(shared_path, clock):
+    vault  = _Vault()
+    first  = _CredentialCache(shared=SqliteCredentialStore(shared_path), shared_check_seconds=5)
+    second = _CredentialCache(shared=SqliteCredentialStore(shared_path))
+    first.get_or_load("int_1", vault)
+
+    clock.now += 1
+    second.set("int_1", {"accessToken": "rotated"})
+    assert not first.shared_check_due("int_1")
+    assert first.lookup("int_1", vault) == {"accessToken": "token-1"}
+
+    clock.now += 5
+    assert first.shared_check_due("int_1")
+    assert first.lookup("int_1", vault) == {"accessToken": "rotated"}
+    assert not first.shared_check_due("int_1")
+
+
+def test_lookup_can_skip_the_shared_store(shared_path, clock):
+    first  = _CredentialCache(shared=SqliteCredentialStore(shared_path))
+    second = _CredentialCache(shared=SqliteCredentialStore(shared_path))
+    second.set("int_1", {"accessToken": "elsewhere"})
+
+    assert first.lookup("int_1", _Vault(), check_shared=False) is None
+    assert first.lookup("int_1", _Vault()) == {"accessToken": "elsewhere"}
+
+
+def test_a_refresh_in_a_forked_worker_reaches_the_parent(shared_path, clock):
+    parent = _CredentialCache(shared=SqliteCredentialStore(shared_path))
+    parent.set("int_1", {"accessToken": "old"})
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            parent._reset_after_fork()
+            clock.now += 1
+            parent.set("int_1", {"accessToken": "from-child"})
+            code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    assert parent.get("int_1") == {"accessToken": "from-child"}
+
+
+def test_async_callers_read_the_shared_store_off_the_event_loop(shared_path, monkeypatch, execute_api_module):
+    cache   = _CredentialCache(shared=SqliteCredentialStore(shared_path), shared_check_seconds=60)
+    threads = []
+    adopt   = cache._adopt_shared
+    monkeypatch.setattr(cache, "_adopt_shared", lambda *args, **kwargs: threads.append(threading.get_ident()) or adopt(*args, **kwargs))
+    monkeypatch.setattr(execute_api_module, "_cache", cache)
+    _CredentialCache(shared=SqliteCredentialStore(shared_path)).set("int_1", {"accessToken": "shared"})
+
+    async def run():
+        first  = await execute_api_module._get_credentials_async("int_1")
+        second = await execute_api_module._get_credentials_async("int_1")     # fresh, no check due
+        return first, second, threading.get_ident()
+
+    first, second, loop_thread = asyncio.run(run())
+    assert first == second == {"accessToken": "shared"}
+    assert len(threads) == 1 and threads[0] != loop_thread
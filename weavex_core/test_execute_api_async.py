@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import pytest
+
+from weavex_core import retry_budget
+from weavex_core.benchmarks.mock_vendor import VendorProfile
+from weavex_core.execute_api import execute_api_async, get_request_dedup_stats, RetryConfig
+from weavex_core.retry_budget import RetryBudget
+
+
+FAST_RETRY = RetryConfig(backoff_seconds=0.01, max_backoff_seconds=0.05, max_retries=10)
+
+
+@pytest.fixture(autouse=True)
+def unlimited_retries(monkeypatch):
+    """Retries in these tests must not depend on what earlier tests spent from the process budget."""
+    monkeypatch.setattr(retry_budget, "_budget", RetryBudget(ratio=None))
+
+
+def _quiet(**kwargs) -> VendorProfile:
+    return VendorProfile(**{"latency_ms": 0, "jitter_ms": 0, "tail_rate": 0, **kwargs})
+
+
+def test_429s_are_retried_after_retry_after(mock_vendor):
+    env = mock_vendor(_quiet(rate_429=0.5, retry_after_seconds=0.01))
+
+    async def run():
+        return await asyncio.gather(*(
+            execute_api_async({}, env.integration_id, "GET", f"/v1/employees?n={n}", retry=FAST_RETRY) for n in range(6)
+        ))
+
+    assert [r.status_code for r in asyncio.run(run())] == [200] * 6
+    assert env.vendor.stats()["statuses"][429] > 0
+
+
+def test_5xx_backoff_does_not_block_the_event_loop(mock_vendor):
+    env   = mock_vendor(_quiet(burst_every_seconds=60, burst_seconds=0.3))
+    retry = RetryConfig(backoff_seconds=0.1, max_backoff_seconds=0.1, jitter=False, max_retries=10)
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker   = asyncio.create_task(tick())
+        response = await execute_api_async({}, env.integration_id, "GET", "/v1/employees", retry=retry)
+        ticker.cancel()
+        return response, ticks
+
+    response, ticks = asyncio.run(run())
+    assert response.status_code == 200
+    assert env.vendor.stats()["statuses"][503] >= 2
+    assert ticks >= 10
+
+
+def test_a_401_refreshes_the_token_once_for_every_caller(mock_vendor):
+    env = mock_vendor(_quiet(token_ttl_seconds=0.2))
+
+    async def run():
+        first = await execute_api_async({}, env.integration_id, "GET", "/v1/employees")
+        await asyncio.sleep(0.25)
+        rest  = await asyncio.gather(*(
+            execute_api_async({}, env.integration_id, "GET", f"/v1/employees?n={n}", retry=FAST_RETRY) for n in range(6)
+        ))
+        return [first, *rest]
+
+    assert [r.status_code for r in asyncio.run(run())] == [200] * 7
+    assert env.vendor.stats()["refreshes"] == 1
+    assert env.vendor.stats()["statuses"][401] >= 1
+
+
+def test_the_deadline_bounds_every_attempt(mock_vendor):
+    env = mock_vendor(_quiet(latency_ms=500))
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="timed out|deadline exceeded"):
+        asyncio.run(execute_api_async(
+            {"deadline": time.time() + 0.2}, env.integration_id, "GET", "/v1/employees", retry=FAST_RETRY
+        ))
+    assert time.monotonic() - started < 0.45
+
+
+def test_identical_concurrent_gets_share_one_request(mock_vendor):
+    env    = mock_vendor(_quiet(latency_ms=50))
+    before = get_request_dedup_stats().coalesced_async
+
+    async def run():
+        return await asyncio.gather(*(execute_api_async({}, env.integration_id, "GET", "/v1/employees") for _ in range(5)))
+
+    responses = asyncio.run(run())
+    assert [r.status_code for r in responses] == [200] * 5
+    assert env.vendor.stats()["requests"] == 1
+    assert get_request_dedup_stats().coalesced_async - before == 4
+    assert len({id(r.body) for r in responses}) == 5     # followers get their own copy
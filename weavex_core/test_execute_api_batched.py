@@ -0,0 +1,146 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from weavex_core import execute_api_batched
+from weavex_core.execute_api import ApiResponse
+from weavex_core.execute_api_batched import BatchConfig, MicroBatcher, MISSING_RESULT_STATUS
+
+
+@pytest.fixture
+def bulk_endpoint(monkeypatch):
+    """Replaces execute_api with a fake bulk endpoint echoing each input as a result."""
+
+    class BulkEndpoint:
+        def __init__(self):
+            self.bodies = []
+            self.status = 200
+            self.error  = None
+            self._lock  = threading.Lock()
+
+        def __call__(self, context, integration_id, method, path, headers, body, timeout, retry):
+            with self._lock:
+                self.bodies.append(body)
+            if self.error is not None:
+                raise self.error
+            results = [{"id": item["id"], "ok": True} for item in body["inputs"] if not item.get("reject")]
+            return ApiResponse(self.status, {"results": results, "errors": ["rejected"]}, {})
+
+    fake = BulkEndpoint()
+    monkeypatch.setattr(execute_api_batched, "execute_api", fake)
+    return fake
+
+
+def _config(**kwargs) -> BatchConfig:
+    return BatchConfig(path="/v1/contacts/batch", match_field="id", **kwargs)
+
+
+# ── BatchConfig ───────────────────────────────────────────────────────────────
+
+def test_envelope_nests_items_and_keeps_body_extra_untouched():
+    config = BatchConfig(path="/b", items_field="data.records", body_extra={"data": {"mode": "upsert"}})
+    assert config.envelope([1, 2]) == {"data": {"mode": "upsert", "records": [1, 2]}}
+    assert config.body_extra == {"data": {"mode": "upsert"}}
+    assert BatchConfig(path="/b", items_field=None).envelope([1]) == [1]
+
+
+def test_split_matches_results_by_field_and_flags_missing_ones():
+    config    = _config()
+    response  = ApiResponse(207, {"results": [{"id": 2}, {"id": 1}], "errors": ["bad 3"]}, {})
+    responses = config.split(response, [{"id": 1}, {"id": 2}, {"id": 3}])
+
+    assert [r.status_code for r in responses] == [200, 200, MISSING_RESULT_STATUS]
+    assert responses[0].body == {"id": 1}
+    assert responses[2].body["errors"] == ["bad 3"]
+
+
+def test_split_by_position_and_failed_batches():
+    config = BatchConfig(path="/b", results_path=None)
+    assert [r.body for r in config.split(ApiResponse(200, ["a", "b"], {}), [1, 2])] == ["a", "b"]
+
+    failed = config.split(ApiResponse(500, {"error": "down"}, {}), [1, 2])
+    assert [r.status_code for r in failed] == [500, 500]
+    assert failed[0] is not failed[1]
+
+
+def test_from_spec_keeps_explicit_nulls():
+    config = BatchConfig.from_spec({"path": "/b", "maxItems": 10, "itemsField": None, "resultsPath": None})
+    assert (config.max_items, config.items_field, config.results_path, config.errors_path) == (10, None, None, "errors")
+
+
+# ── MicroBatcher ──────────────────────────────────────────────────────────────
+
+def test_full_buffers_go_out_as_one_batch_each(bulk_endpoint):
+    with MicroBatcher({}, "int_1", _config(max_items=5, max_wait_ms=10_000)) as batcher:
+        futures = [batcher.submit({"id": i}) for i in range(10)]
+        responses = [f.result(timeout=5) for f in futures]
+
+    assert [r.body["id"] for r in responses] == list(range(10))
+    assert [len(body["inputs"]) for body in bulk_endpoint.bodies] == [5, 5]
+    assert batcher.stats().flushed_full == 2
+
+
+def test_a_partial_buffer_goes_out_after_max_wait(bulk_endpoint):
+    with MicroBatcher({}, "int_1", _config(max_items=100, max_wait_ms=20)) as batcher:
+        started  = time.monotonic()
+        response = batcher.call({"id": 1})
+        waited   = time.monotonic() - started
+
+    assert response.status_code == 200
+    assert 0.015 <= waited < 2
+    assert batcher.stats().flushed_timer == 1
+
+
+def test_items_left_after_a_flush_keep_their_own_wait(bulk_endpoint, monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(execute_api_batched, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    with MicroBatcher({}, "int_1", _config(max_items=4, max_wait_ms=1000)) as batcher:
+        futures = [batcher.submit({"id": i}) for i in range(3)]
+        # Shrinking the batch leaves one item behind after a full flush.
+        with batcher._cond:
+            clock[0] = 0.9
+            batcher.config.max_items = 2
+            batcher._cond.notify_all()
+        assert [f.result(timeout=5).status_code for f in futures[:2]] == [200, 200]
+
+        # The leftover was queued at 0.0, so its max_wait runs out at 1.0 — not 1.9.
+        with batcher._cond:
+            clock[0] = 1.0
+            batcher._cond.notify_all()
+        assert futures[2].result(timeout=5).status_code == 200
+        assert batcher.stats().flushed_timer == 1
+
+
+def test_flush_and_close_send_what_is_buffered(bulk_endpoint):
+    batcher = MicroBatcher({}, "int_1", _config(max_items=100, max_wait_ms=60_000))
+    first   = batcher.submit({"id": 1})
+    batcher.flush()
+    assert first.result(timeout=5).status_code == 200
+
+    second = batcher.submit({"id": 2})
+    batcher.close()
+    assert second.result(timeout=0).status_code == 200
+    assert batcher.stats().flushed_manual == 2
+    with pytest.raises(RuntimeError):
+        batcher.submit({"id": 3})
+
+
+def test_each_item_gets_its_own_outcome(bulk_endpoint):
+    with MicroBatcher({}, "int_1", _config(max_items=2)) as batcher:
+        ok, rejected = batcher.submit({"id": 1}), batcher.submit({"id": 2, "reject": True})
+
+    assert ok.result().status_code == 200
+    assert rejected.result().status_code == MISSING_RESULT_STATUS
+
+
+def test_a_raising_batch_call_fails_every_item(bulk_endpoint):
+    bulk_endpoint.error = RuntimeError("circuit open")
+    with MicroBatcher({}, "int_1", _config(max_items=3)) as batcher:
+        futures = [batcher.submit({"id": i}) for i in range(3)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="circuit open"):
+            future.result()
+    assert batcher.stats().failed == 1
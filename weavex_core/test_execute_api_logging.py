@@ -0,0 +1,89 @@
+import logging
+import time
+
+import pytest
+
+from weavex_core.benchmarks.mock_vendor import VendorProfile
+from weavex_core.execute_api import execute_api, enable_debug_logging, RetryConfig
+
+
+SECRETS = ("bench-token-", "bench-refresh", "bench-secret", "Bearer ")
+
+
+class _CountingPath(str):
+    """A path that counts how often logging formats it."""
+    formatted = 0
+
+    def __str__(self) -> str:
+        type(self).formatted += 1
+        return str.__str__(self)
+
+
+@pytest.fixture
+def debug_logs(caplog):
+    caplog.set_level(logging.DEBUG, logger="weavex_core")
+    return caplog
+
+
+def _rendered(caplog) -> list[str]:
+    return [record.getMessage() for record in caplog.records]
+
+
+def test_no_credential_reaches_a_log_record(mock_vendor, debug_logs):
+    env = mock_vendor(VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, token_ttl_seconds=0.2))
+    execute_api({}, env.integration_id, "GET", "/v1/employees", headers={"Accept": "application/json"})
+    time.sleep(0.25)
+    execute_api({}, env.integration_id, "POST", "/v1/employees", body={"name": "x"}, retry=RetryConfig(max_retries=1))
+
+    messages = _rendered(debug_logs)
+    assert any("refreshing OAuth token" in m for m in messages)      # the 401 refresh path was logged
+    assert any(m.startswith("REQUEST ") for m in messages)
+    for message in messages:
+        assert not any(secret in message for secret in SECRETS), message
+
+
+def test_request_lines_carry_header_names_only(mock_vendor, debug_logs):
+    env = mock_vendor()
+    execute_api({}, env.integration_id, "GET", "/v1/employees", headers={"X-Tenant": "tenant-secret-value"})
+
+    request_line = next(m for m in _rendered(debug_logs) if m.startswith("REQUEST "))
+    assert "X-Tenant" in request_line and "Authorization" in request_line
+    assert "tenant-secret-value" not in request_line
+
+
+def test_debug_lines_are_gated_by_level(mock_vendor, caplog):
+    env = mock_vendor()
+    caplog.set_level(logging.INFO, logger="weavex_core")
+    execute_api({}, env.integration_id, "GET", "/v1/employees")
+    assert not [r for r in caplog.records if r.levelno < logging.INFO]
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="weavex_core")
+    execute_api({}, env.integration_id, "GET", "/v1/employees?page=2")
+    assert [r for r in caplog.records if r.levelno == logging.DEBUG]
+
+
+def test_disabled_levels_never_format_their_arguments(mock_vendor, caplog):
+    env = mock_vendor()
+    caplog.set_level(logging.INFO, logger="weavex_core")
+    _CountingPath.formatted = 0
+    execute_api({}, env.integration_id, "GET", _CountingPath("/v1/employees"))
+    assert _CountingPath.formatted == 0
+
+    caplog.set_level(logging.DEBUG, logger="weavex_core")
+    execute_api({}, env.integration_id, "GET", _CountingPath("/v1/employees?page=2"))
+    assert _CountingPath.formatted > 0
+
+
+def test_enable_debug_logging_toggles_the_logger():
+    logger   = logging.getLogger("weavex_core.execute_api")
+    level    = logger.level
+    handlers = list(logger.handlers)
+    try:
+        enable_debug_logging()
+        assert logger.isEnabledFor(logging.DEBUG)
+        enable_debug_logging(False)
+        assert logger.level == logging.NOTSET
+    finally:
+        logger.setLevel(level)
+        logger.handlers[:] = handlers
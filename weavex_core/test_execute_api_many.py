@@ -0,0 +1,69 @@
+import importlib
+
+from weavex_core.benchmarks.mock_vendor import VendorProfile
+from weavex_core.execute_api import RetryConfig
+from weavex_core.execute_api_many import execute_api_many, ApiRequest
+from weavex_core.adaptive_concurrency import get_adaptive_limiter
+
+
+many = importlib.import_module("weavex_core.execute_api_many")
+
+FAST_RETRY = RetryConfig(backoff_seconds=0.01, max_backoff_seconds=0.05, max_retries=5)
+
+
+def _specs(count: int) -> list[ApiRequest]:
+    return [ApiRequest("GET", f"/v1/employees?page={i}", key=i) for i in range(count)]
+
+
+def test_fan_out_returns_every_result(mock_vendor):
+    env     = mock_vendor()
+    results = list(execute_api_many({}, env.integration_id, _specs(20), concurrency=4, retry=FAST_RETRY))
+    assert sorted(r.request.key for r in results) == list(range(20))
+    assert all(r.ok for r in results)
+
+
+def test_ordered_yields_in_input_order(mock_vendor):
+    env     = mock_vendor()
+    results = list(execute_api_many({}, env.integration_id, _specs(12), concurrency=4, ordered=True, retry=FAST_RETRY))
+    assert [r.index for r in results] == list(range(12))
+
+
+def test_auto_limiter_sees_429s_absorbed_by_retries(mock_vendor):
+    env = mock_vendor(VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, rate_429=0.3, retry_after_seconds=0.01))
+    results = list(execute_api_many({}, env.integration_id, _specs(30), concurrency="auto", retry=FAST_RETRY))
+
+    # Every call ends in a 200 — the 429s only ever show up on retried attempts.
+    assert all(r.ok for r in results)
+    assert env.vendor.stats()["statuses"].get(429, 0) > 0
+    assert get_adaptive_limiter(env.integration_id).state().decreases >= 1
+
+
+def test_clean_run_does_not_cut_the_auto_limit(mock_vendor):
+    env = mock_vendor()
+    list(execute_api_many({}, env.integration_id, _specs(30), concurrency="auto", retry=FAST_RETRY))
+    assert get_adaptive_limiter(env.integration_id).state().decreases == 0
+
+
+def test_failed_call_is_reported_on_its_result(monkeypatch):
+    def flaky(context, integration_id, request, timeout, retry):
+        if request.key == 1:
+            raise RuntimeError("vendor down")
+        return "ok"
+
+    monkeypatch.setattr(many, "_call", flaky)
+    results = {r.request.key: r for r in execute_api_many({}, "int_1", _specs(3), concurrency=2)}
+    assert str(results[1].error) == "vendor down"
+    assert results[0].response == "ok" and results[2].response == "ok"
+
+
+def test_malformed_spec_fails_on_its_own_result_and_returns_its_slot(mock_vendor):
+    env   = mock_vendor()
+    specs = [ApiRequest("GET", "/v1/employees", key=0), {"method": "GET"}, 42, ApiRequest("GET", "/v1/employees", key=3)]
+
+    results = list(execute_api_many({}, env.integration_id, specs, concurrency="auto", ordered=True, retry=FAST_RETRY))
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert results[0].ok and results[3].ok
+    assert results[1].request is None and isinstance(results[1].error, TypeError)
+    assert results[2].request is None and isinstance(results[2].error, TypeError)
+    assert get_adaptive_limiter(env.integration_id).state().in_flight == 0
@@ -0,0 +1,156 @@
+import logging
+
+import pytest
+
+from weavex_core.api_execution_facade import ApiExecutionFacade
+from weavex_core.execute_api import ApiResponse
+from weavex_core.execute_api_paginated import (
+    execute_api_paginated, PaginationConfig, _with_params, _relative_to_base
+)
+
+
+@pytest.fixture
+def vendor_pages(monkeypatch):
+    """Replaces the facade with a fake vendor: pages[path] → ApiResponse. Records every path requested."""
+    requested = []
+
+    def install(pages: dict):
+        def execute(context, integration_id, method, path, **kwargs):
+            requested.append(path)
+            return pages[path]
+        monkeypatch.setattr(ApiExecutionFacade, "execute", staticmethod(execute))
+        return requested
+
+    return install
+
+
+def _page(items: list, **extra) -> ApiResponse:
+    return ApiResponse(200, {"data": items, **extra}, {})
+
+
+# ── _with_params ──────────────────────────────────────────────────────────────
+
+def test_with_params_keeps_repeated_keys_and_original_encoding():
+    path = "/v1/users?id=1&id=2&fields=a,b&q=hello%20world&offset=0"
+    assert _with_params(path, {"offset": 50}) == "/v1/users?id=1&id=2&fields=a,b&q=hello%20world&offset=50"
+
+
+def test_with_params_appends_missing_keys_and_drops_repeated_pagination_keys():
+    assert _with_params("/v1/users", {"limit": 10, "page": 2}) == "/v1/users?limit=10&page=2"
+    assert _with_params("/v1/users?page=1&x=1&page=9", {"page": 2}) == "/v1/users?page=2&x=1"
+
+
+def test_with_params_encodes_the_new_value():
+    assert _with_params("/v1/users?a=1", {"cursor": "ab/c=="}) == "/v1/users?a=1&cursor=ab%2Fc%3D%3D"
+
+
+# ── _relative_to_base ─────────────────────────────────────────────────────────
+
+def test_relative_to_base_strips_the_base():
+    assert _relative_to_base("https://api.vendor.test/v2/users?page=2", "https://api.vendor.test/v2") == "/users?page=2"
+    assert _relative_to_base("/v2/users?page=2", "https://api.vendor.test/v2") == "/v2/users?page=2"
+
+
+def test_relative_to_base_rejects_other_origins_and_paths(caplog):
+    with caplog.at_level(logging.WARNING):
+        assert _relative_to_base("https://evil.test/v2/users", "https://api.vendor.test/v2") is None
+        assert _relative_to_base("https://api.vendor.test/v3/users", "https://api.vendor.test/v2") is None
+        assert _relative_to_base("https://api.vendor.test/v2x/users", "https://api.vendor.test/v2") is None
+    assert "evil.test" in caplog.text
+
+
+def test_relative_to_base_without_a_base_follows_only_relative_links(caplog):
+    with caplog.at_level(logging.WARNING):
+        assert _relative_to_base("https://evil.test/v2/users?page=2", None) is None
+        assert _relative_to_base("//evil.test/v2/users?page=2", None) is None
+    assert _relative_to_base("/v2/users?page=2", None) == "/v2/users?page=2"
+    assert "no base URL" in caplog.text
+
+
+# ── execute_api_paginated ─────────────────────────────────────────────────────
+
+def test_cursor_pagination_yields_every_item(vendor_pages):
+    requested = vendor_pages({
+        "/v1/users?status=a,b&limit=2":          _page([1, 2], next="c1"),
+        "/v1/users?status=a,b&limit=2&cursor=c1": _page([3, 4], next="c2"),
+        "/v1/users?status=a,b&limit=2&cursor=c2": _page([5]),
+    })
+    config = PaginationConfig(style="cursor", items_path="data", cursor_path="next", page_size=2)
+    items  = list(execute_api_paginated({}, "int_1", "/v1/users?status=a,b", pagination=config, items=True))
+    assert items == [1, 2, 3, 4, 5]
+    assert len(requested) == 3
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_offset_pagination_stops_on_a_short_page(vendor_pages, prefetch):
+    vendor_pages({
+        "/v1/users?limit=2&offset=0": _page([1, 2]),
+        "/v1/users?limit=2&offset=2": _page([3]),
+    })
+    config = PaginationConfig(style="offset", items_path="data", page_size=2, prefetch=prefetch)
+    assert list(execute_api_paginated({}, "int_1", "/v1/users", pagination=config, items=True)) == [1, 2, 3]
+
+
+def test_page_mode_yields_a_failed_page_and_stops(vendor_pages):
+    vendor_pages({
+        "/v1/users?page=1": _page([1]),
+        "/v1/users?page=2": ApiResponse(500, {"error": "boom"}, {}),
+    })
+    config = PaginationConfig(style="page", items_path="data")
+    pages  = list(execute_api_paginated({}, "int_1", "/v1/users", pagination=config))
+    assert [p.status_code for p in pages] == [200, 500]
+
+    with pytest.raises(RuntimeError):
+        list(execute_api_paginated({}, "int_1", "/v1/users", pagination=config, items=True))
+
+
+def test_max_pages_caps_the_iteration(vendor_pages):
+    requested = vendor_pages({f"/v1/users?page={n}": _page([n]) for n in range(1, 5)})
+    config    = PaginationConfig(style="page", items_path="data", max_pages=2)
+    assert list(execute_api_paginated({}, "int_1", "/v1/users", pagination=config, items=True)) == [1, 2]
+    assert requested == ["/v1/users?page=1", "/v1/users?page=2"]
+
+
+def test_link_pagination_does_not_follow_a_foreign_origin(vendor_pages):
+    base = "https://api.vendor.test/v2"
+    requested = vendor_pages({
+        "/users": ApiResponse(200, {"data": [1]}, {"Link": f'<{base}/users?page=2>; rel="next"'}),
+        "/users?page=2": ApiResponse(200, {"data": [2]}, {"Link": '<https://other.test/users?page=3>; rel="next"'}),
+    })
+    config = PaginationConfig(style="link", items_path="data")
+    items  = list(execute_api_paginated({}, "int_1", "/users", pagination=config, items=True, app_base_url=base))
+    assert items == [1, 2]
+    assert requested == ["/users", "/users?page=2"]
+
+
+def test_a_repeated_cursor_ends_the_iteration(vendor_pages, caplog):
+    requested = vendor_pages({
+        "/v1/users":           _page([1], next="c1"),
+        "/v1/users?cursor=c1": _page([2], next="c2"),
+        "/v1/users?cursor=c2": _page([3], next="c1"),
+    })
+    config = PaginationConfig(style="cursor", items_path="data", cursor_path="next")
+    with caplog.at_level(logging.WARNING):
+        items = list(execute_api_paginated({}, "int_1", "/v1/users", pagination=config, items=True))
+    assert items == [1, 2, 3]
+    assert requested == ["/v1/users", "/v1/users?cursor=c1", "/v1/users?cursor=c2"]
+    assert "already requested" in caplog.text
+
+
+def test_a_link_back_to_the_current_page_ends_the_iteration(vendor_pages):
+    requested = vendor_pages({
+        "/users":        ApiResponse(200, {"data": [1]}, {"Link": '</users?page=2>; rel="next"'}),
+        "/users?page=2": ApiResponse(200, {"data": [2]}, {"Link": '</users?page=2>; rel="next"'}),
+    })
+    config = PaginationConfig(style="link", items_path="data")
+    assert list(execute_api_paginated({}, "int_1", "/users", pagination=config, items=True)) == [1, 2]
+    assert requested == ["/users", "/users?page=2"]
+
+
+def test_link_pagination_without_a_base_url_does_not_follow_absolute_links(vendor_pages):
+    requested = vendor_pages({
+        "/users": ApiResponse(200, {"data": [1]}, {"Link": '<https://other.test/users?page=2>; rel="next"'}),
+    })
+    config = PaginationConfig(style="link", items_path="data")
+    assert list(execute_api_paginated({}, "int_1", "/users", pagination=config, items=True)) == [1]
+    assert requested == ["/users"]
@@ -0,0 +1,126 @@
+import json
+import threading
+import time
+
+import pytest
+
+from weavex_core import execute_dw
+from weavex_core.execute_dw import execute_dw_write, DWWriteResult
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    """Replaces the bridge with a fake /write: records each chunk, tracks concurrency per table."""
+
+    class FakeBridge:
+        def __init__(self):
+            self.chunks        = []      # (write_mode, [row ids]) in arrival order
+            self.in_flight     = {}
+            self.max_in_flight = {}
+            self.fail_on       = None    # row id whose chunk fails for good
+            self.delay         = 0.0
+            self._lock         = threading.Lock()
+
+        def __call__(self, endpoint, payload, http_timeout=30):
+            request = json.loads(payload)
+            table   = request["table"]
+            ids     = [row["id"] for row in request["rows"]]
+            with self._lock:
+                self.in_flight[table]     = self.in_flight.get(table, 0) + 1
+                self.max_in_flight[table] = max(self.max_in_flight.get(table, 0), self.in_flight[table])
+            try:
+                time.sleep(self.delay)
+                if self.fail_on in ids:
+                    raise ValueError("DW operation failed: bad row")
+                with self._lock:
+                    self.chunks.append((request["write_mode"], ids))
+                return {"rows_written": len(ids), "rows_failed": 0, "job_id": f"job_{ids[0]}", "provider": "bigquery"}
+            finally:
+                with self._lock:
+                    self.in_flight[table] -= 1
+
+    fake = FakeBridge()
+    monkeypatch.setattr(execute_dw, "_call_bridge", fake)
+    return fake
+
+
+def _rows(count: int):
+    return ({"id": i, "name": f"row {i}"} for i in range(count))
+
+
+def test_append_sends_chunks_in_parallel(bridge):
+    bridge.delay = 0.02
+    result = execute_dw_write({}, "int_1", "ds.t", _rows(40), chunk_rows=5, concurrency=4)
+
+    assert result.rows_written == 40
+    assert len(bridge.chunks) == 8
+    assert bridge.max_in_flight["ds.t"] > 1
+
+
+def test_chunks_respect_the_byte_limit(bridge):
+    execute_dw_write({}, "int_1", "ds.t", _rows(10), chunk_bytes=60, concurrency=1)
+    assert all(len(ids) <= 2 for _, ids in bridge.chunks)
+    assert sorted(i for _, ids in bridge.chunks for i in ids) == list(range(10))
+
+
+def test_job_id_is_the_first_chunk_and_job_ids_lists_every_chunk(bridge):
+    bridge.delay = 0.01
+    result = execute_dw_write({}, "int_1", "ds.t", _rows(12), chunk_rows=4, concurrency=3)
+
+    assert isinstance(result, DWWriteResult)
+    assert result.job_id == "job_0"
+    assert result.job_ids == ["job_0", "job_4", "job_8"]
+    assert result.provider == "bigquery"
+
+
+def test_upsert_sends_one_chunk_at_a_time_in_order(bridge):
+    bridge.delay = 0.01
+    result = execute_dw_write(
+        {}, "int_1", "ds.t", _rows(30), write_mode="upsert", upsert_keys=["id"], chunk_rows=5, concurrency=4
+    )
+
+    assert result.rows_written == 30
+    assert bridge.max_in_flight["ds.t"] == 1
+    assert [ids[0] for _, ids in bridge.chunks] == [0, 5, 10, 15, 20, 25]
+
+
+def test_concurrent_upserts_to_one_table_do_not_overlap(bridge):
+    bridge.delay = 0.01
+
+    def upsert(table):
+        execute_dw_write({}, "int_1", table, _rows(20), write_mode="upsert", upsert_keys=["id"], chunk_rows=5)
+
+    threads = [threading.Thread(target=upsert, args=(table,)) for table in ("ds.t", "ds.t", "ds.other")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert bridge.max_in_flight["ds.t"] == 1
+    assert len(bridge.chunks) == 12
+
+
+def test_replace_sends_the_first_chunk_alone_then_appends(bridge):
+    execute_dw_write({}, "int_1", "ds.t", _rows(10), write_mode="replace", chunk_rows=4)
+    modes = [mode for mode, _ in bridge.chunks]
+    assert modes[0] == "replace"
+    assert modes[1:] == ["append", "append"]
+
+
+def test_a_failed_chunk_stops_the_write_and_reports_what_was_written(bridge):
+    bridge.fail_on = 6
+    with pytest.raises(ValueError, match="stopped after"):
+        execute_dw_write({}, "int_1", "ds.t", _rows(20), write_mode="upsert", upsert_keys=["id"], chunk_rows=3)
+    assert all(6 not in ids for _, ids in bridge.chunks)
+
+
+def test_empty_input_writes_nothing(bridge):
+    assert execute_dw_write({}, "int_1", "ds.t", []) == DWWriteResult(rows_written=0, rows_failed=0)
+    assert bridge.chunks == []
+
+
+def test_malformed_write_settings_fall_back_to_the_defaults(import_constant):
+    env = {"WEAVEX_DW_WRITE_CHUNK_ROWS": "10k", "WEAVEX_DW_WRITE_CONCURRENCY": "", "WEAVEX_DW_WRITE_CHUNK_RETRIES": "3"}
+    assert import_constant("weavex_core.execute_dw", "DW_WRITE_CHUNK_ROWS", **env) == 10_000
+    assert import_constant("weavex_core.execute_dw", "DW_WRITE_CONCURRENCY", **env) == 4
+    assert import_constant("weavex_core.execute_dw", "DW_WRITE_CHUNK_RETRIES", **env) == 3
@@ -0,0 +1,99 @@
+import threading
+from types import SimpleNamespace
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from weavex_core import http_pool
+
+
+class _DropSecondRequestHandler(BaseHTTPRequestHandler):
+    """Answers the first request on a connection, then reads the next one and hangs up without a reply."""
+
+    protocol_version = "HTTP/1.1"
+    drop_first       = False
+
+    def do_POST(self):
+        self.server.requests += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._served = getattr(self, "_served", 0) + 1
+        if self.drop_first or self._served > 1:
+            self.close_connection = True
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    do_PUT = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(request):
+    handler = type("Handler", (_DropSecondRequestHandler,), {"drop_first": getattr(request, "param", False)})
+    srv     = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    srv.daemon_threads = True
+    srv.requests       = 0
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def control_plane():
+    plane = http_pool._ControlPlane()
+    yield plane
+    plane.close()
+
+
+def _url(srv) -> str:
+    return f"http://127.0.0.1:{srv.server_port}/checkpoint.set"
+
+
+def test_put_on_connection_dropped_while_pooled_is_replayed(server, control_plane):
+    session = control_plane.session()
+    assert session.put(_url(server), json={"n": 1}).status_code == 200
+    # The pooled connection is now one the server will drop.
+    assert session.put(_url(server), json={"n": 2}).status_code == 200
+    assert server.requests == 3
+
+
+def test_post_the_server_read_before_dropping_is_not_replayed(server, control_plane):
+    session = control_plane.session()
+    assert session.post(_url(server), json={"n": 1}).status_code == 200
+    # The server reads the second POST and hangs up; it may have acted on it.
+    with pytest.raises(requests.ConnectionError):
+        session.post(_url(server), json={"n": 2})
+    assert server.requests == 2
+
+
+@pytest.mark.parametrize("server", [True], indirect=True)
+def test_post_on_fresh_connection_is_not_replayed(server, control_plane):
+    with pytest.raises(requests.ConnectionError):
+        control_plane.session().post(_url(server), json={})
+    assert server.requests == 1
+
+
+def test_idle_connection_is_reopened_after_idle_timeout(server, control_plane, monkeypatch):
+    monkeypatch.setenv("WEAVEX_CONTROL_PLANE_IDLE_TIMEOUT", "5")
+    clock = [1000.0]
+    monkeypatch.setattr(http_pool, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    session = control_plane.session()
+    assert session.post(_url(server), json={}).status_code == 200
+    clock[0] += 6
+    # Past the idle timeout the pooled connection is closed before use, so the
+    # server never gets a second request on the old connection.
+    assert session.post(_url(server), json={}).status_code == 200
+    assert server.requests == 2
+
+
+def test_malformed_idle_timeout_env_falls_back_to_default(monkeypatch, control_plane):
+    monkeypatch.setenv("WEAVEX_CONTROL_PLANE_IDLE_TIMEOUT", "soon")
+    control_plane.session()
+    assert control_plane._adapter._idle_timeout == 30.0
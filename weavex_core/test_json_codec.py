@@ -0,0 +1,125 @@
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from weavex_core import json_codec
+
+
+BACKENDS = ["json"] + [name for name in ("orjson", "msgspec") if getattr(json_codec, name) is not None]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(json_codec, "BACKEND", request.param)
+    return request.param
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+class Kind(str, enum.Enum):
+    USER = "user"
+
+
+class Tag(str):
+    pass
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+def _stdlib(obj, default=None) -> str:
+    return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+
+
+PLAIN = {
+    "name":   "Zoë — 東京",
+    "ints":   [0, -1, 2 ** 63 - 1, 2 ** 80],
+    "floats": [0.1, 1e16, -2.5e-8],
+    "nested": {"a": [True, False, None, {"b": ()}]},
+    1:        "int key",
+    2.5:      "float key",
+    None:     "none key",
+    "level":  Level.HIGH,
+    "kind":   Kind.USER,
+    "tag":    Tag("t"),
+}
+
+NON_NATIVE = {
+    "when":    datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+    "naive":   datetime.datetime(2024, 5, 1, 12, 30),
+    "day":     datetime.date(2024, 5, 1),
+    "time":    datetime.time(8, 15),
+    "point":   Point(1, 2),
+    "amount":  Decimal("10.50"),
+    "set":     {1},
+    "raw":     b"bytes",
+    "wrapped": [Point(3, 4)],
+}
+
+
+def test_native_payload_matches_json_dumps(backend):
+    assert json.loads(json_codec.dumps(PLAIN)) == json.loads(_stdlib(PLAIN))
+    assert json_codec.dumps_bytes(PLAIN).decode() == json_codec.dumps(PLAIN)
+
+
+@pytest.mark.parametrize("key", list(NON_NATIVE))
+def test_non_native_types_go_through_default_like_json_dumps(backend, key):
+    payload = {key: NON_NATIVE[key]}
+    assert json_codec.dumps(payload, default=str) == _stdlib(payload, default=str)
+    assert json_codec.dumps(payload, default=repr) == _stdlib(payload, default=repr)
+    with pytest.raises(TypeError):
+        json_codec.dumps(payload)
+
+
+def test_default_result_is_encoded_recursively(backend):
+    payload = {"point": Point(1, 2)}
+    assert json_codec.dumps(payload, default=dataclasses.asdict) == _stdlib(payload, default=dataclasses.asdict)
+
+
+def test_uuid_and_enum_are_pinned_on_every_backend(backend):
+    ident = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    assert json_codec.dumps([ident, Color.RED]) == '["12345678-1234-5678-1234-567812345678","red"]'
+    assert json_codec.dumps([ident, Color.RED], default=repr) == json_codec.dumps([ident, Color.RED])
+
+
+def test_non_finite_floats_are_null_on_every_backend(backend):
+    payload = {"nan": math.nan, "inf": [math.inf, -math.inf], "ok": 1.5, 1: (math.nan,)}
+    assert json.loads(json_codec.dumps(payload)) == {"nan": None, "inf": [None, None], "ok": 1.5, "1": [None]}
+    assert json_codec.dumps(Decimal("NaN"), default=float) == "null"
+
+
+def test_encode_errors_are_type_and_value_errors(backend):
+    with pytest.raises(TypeError):
+        json_codec.dumps_bytes({"obj": object()})
+    circular = []
+    circular.append(circular)
+    with pytest.raises((ValueError, TypeError)):
+        json_codec.dumps(circular)
+
+
+def test_loads_matches_json_loads(backend):
+    text = '{"a": [1, 2.5, "Zoë", null, true], "big": 123456789012345678901234567890, "nan": NaN}'
+    assert repr(json_codec.loads(text)) == repr(json.loads(text))
+    assert json_codec.loads(memoryview(text.encode())) == json_codec.loads(text)
+    with pytest.raises(ValueError):
+        json_codec.loads("{not json")
+
+
+def test_canonical_dumps_is_the_stdlib():
+    obj = {"b": 1, "a": [datetime.date(2024, 5, 1), "é"]}
+    assert json_codec.canonical_dumps(obj) == json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str, ensure_ascii=True)
@@ -0,0 +1,121 @@
+import json
+
+import httpx
+import pytest
+
+from weavex_core import json_stream
+from weavex_core.execute_api import execute_api_stream, observe_attempts, RetryConfig
+from weavex_core.json_stream import iter_json_items
+
+
+DOC = (
+    '{"meta": {"note": "a } and a ] inside", "ids": [1, [2, {"employees": 0}]]},'
+    ' "employees": [{"id": 1, "name": "O\\"Brien \\u00e9\\n"}, [1, [2, [3]]], 1.5e3, -0.25, true, null, "\\u2603", {}],'
+    ' "tail": 12}'
+).encode()
+ITEMS = json.loads(DOC)["employees"]
+
+
+@pytest.fixture(params=["fallback", "ijson"])
+def backend(request, monkeypatch):
+    """Runs a test against the stdlib fallback and, when installed, ijson."""
+    if request.param == "fallback":
+        monkeypatch.setattr(json_stream, "ijson", None)
+    elif json_stream.ijson is None:
+        pytest.skip("ijson is not installed")
+    return request.param
+
+
+def _split(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_items_under_a_prefix(backend):
+    assert list(iter_json_items([DOC], "employees.item")) == ITEMS
+    assert list(iter_json_items([b'[1, {"a": [2]}, "x"]'], "item")) == [1, {"a": [2]}, "x"]
+    assert list(iter_json_items([b'{"a": {"b": [[1], [2, 3]]}}'], "a.b.item.item")) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_chunk_boundaries_do_not_matter(backend, size):
+    assert list(iter_json_items(_split(DOC, size), "employees.item")) == ITEMS
+
+
+def test_every_two_way_split(backend):
+    for cut in range(1, len(DOC)):
+        assert list(iter_json_items([DOC[:cut], DOC[cut:]], "employees.item")) == ITEMS, cut
+
+
+def test_multibyte_characters_split_across_chunks(backend):
+    data = '{"items": ["snow ☃", "é"]}'.encode()
+    assert list(iter_json_items(_split(data, 1), "items.item")) == ["snow ☃", "é"]
+
+
+def test_missing_or_mistyped_prefix_yields_nothing(backend):
+    assert list(iter_json_items([b'{"other": [1, 2]}'], "employees.item")) == []
+    assert list(iter_json_items([b'{"employees": {"id": 1}}'], "employees.item")) == []
+    assert list(iter_json_items([b'{"employees": []}'], "employees.item")) == []
+
+
+@pytest.mark.parametrize("data", [
+    b'{"employees": [1, 2',
+    b'{"employees": [1 2]}',
+    b'{"employees": [{"id": }]}',
+    b'{"employees": ["unterminated]}',
+])
+def test_malformed_input_raises(backend, data):
+    with pytest.raises(Exception):
+        list(iter_json_items(_split(data, 3), "employees.item"))
+
+
+def test_fallback_keeps_only_a_bounded_buffer(monkeypatch):
+    monkeypatch.setattr(json_stream, "ijson", None)
+    item   = b'{"payload": "' + b"x" * 1000 + b'"}'
+    chunks = [b'{"items": ['] + [item + b","] * 500 + [item + b"]}"]
+    reader = json_stream._Reader(iter(chunks))
+    count  = 0
+    for _ in json_stream._walk(reader, ["items", "item"]):
+        count += 1
+        assert len(reader.buf) < 200_000
+    assert count == 501
+
+
+# ── execute_api_stream ────────────────────────────────────────────────────────
+
+def test_stream_yields_items_from_the_vendor(mock_vendor):
+    env   = mock_vendor()
+    items = list(execute_api_stream({}, env.integration_id, "GET", "/v1/employees", items_path="items.item"))
+    assert [item["id"] for item in items] == list(range(20))
+
+
+def test_a_body_that_breaks_off_before_the_first_item_is_retried_and_recorded_once(mock_vendor, monkeypatch, execute_api_module):
+    env       = mock_vendor()
+    outcomes  = []
+    real_iter = execute_api_module.iter_json_items
+    failures  = [httpx.ReadError("connection reset")]
+
+    def flaky_iter(chunks, prefix):
+        if failures:
+            raise failures.pop()
+        return real_iter(chunks, prefix)
+
+    monkeypatch.setattr(execute_api_module, "iter_json_items", flaky_iter)
+    with observe_attempts(outcomes.append):
+        items = list(execute_api_stream(
+            {}, env.integration_id, "GET", "/v1/employees", items_path="items.item",
+            retry=RetryConfig(backoff_seconds=0.01, max_retries=2)
+        ))
+
+    assert len(items) == 20
+    assert outcomes == [200, 200]
+
+
+def test_stream_sends_an_upload_body(mock_vendor, tmp_path):
+    env  = mock_vendor()
+    path = tmp_path / "export.csv"
+    path.write_bytes(b"id,name\n" * 1000)
+
+    received = list(execute_api_stream(
+        {}, env.integration_id, "POST", "/v1/files", items_path="received", body=path, content_type="text/csv"
+    ))
+    assert received == [8000]
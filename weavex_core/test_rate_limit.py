@@ -0,0 +1,123 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from weavex_core import rate_limit
+from weavex_core.execute_api import _rate_limit_async, _reserve_capacity
+from weavex_core.rate_limit import TokenBucket, _FileTokenBucket, _parse_spec, get_rate_limiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake time.time() for rate_limit; advance with clock.now += seconds."""
+    fake = SimpleNamespace(now=1_700_000_000.0)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def shared_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("WEAVEX_RATE_LIMIT_DIR", str(tmp_path))
+    monkeypatch.setattr(rate_limit, "_registry", rate_limit._RateLimiterRegistry())
+    return tmp_path
+
+
+# ── TokenBucket ───────────────────────────────────────────────────────────────
+
+def test_full_bucket_then_waits_at_the_rate(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3.0)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+
+
+def test_pause_holds_every_caller(clock):
+    bucket = TokenBucket(rate=100.0, capacity=100.0)
+    bucket.pause(5)
+    assert bucket.reserve() == pytest.approx(5)
+    clock.now += 5
+    assert bucket.reserve() == 0.0
+
+
+def test_observe_trusts_a_lower_remaining_and_pauses_until_reset(clock):
+    bucket = TokenBucket(rate=1.0, capacity=10.0)
+    bucket.observe({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+    assert bucket.reserve() == pytest.approx(30)
+
+
+def test_observe_reads_epoch_reset_headers(clock):
+    bucket = TokenBucket(rate=1.0, capacity=10.0)
+    bucket.observe({"RateLimit-Remaining": "0", "RateLimit-Reset": str(int((clock.now + 12) * 1000))})
+    assert bucket.reserve() == pytest.approx(12)
+
+
+# ── Spec ──────────────────────────────────────────────────────────────────────
+
+def test_default_burst_is_a_few_seconds_of_the_rate_not_the_whole_window():
+    assert _parse_spec({"requestsPerHour": 3600}) == (1.0, 2.0)
+    assert _parse_spec({"requestsPerMinute": 600}) == (10.0, 20.0)
+    assert _parse_spec({"requestsPerHour": 100})[1] == 1.0
+
+
+def test_per_second_limits_keep_one_second_of_burst():
+    assert _parse_spec({"requestsPerSecond": 10}) == (10.0, 10.0)
+
+
+def test_explicit_burst_wins():
+    assert _parse_spec({"requestsPerHour": 3600, "burst": 50}) == (1.0, 50.0)
+
+
+def test_no_usable_rate_means_no_limiter():
+    assert _parse_spec({"requestsPerMinute": "lots"}) is None
+    assert get_rate_limiter("int_none", {}) is None
+
+
+# ── Shared buckets ────────────────────────────────────────────────────────────
+
+def test_file_bucket_is_shared_between_instances(shared_dir, clock):
+    path  = str(shared_dir / "int.bucket")
+    one   = _FileTokenBucket(path, rate=1.0, capacity=2.0)
+    other = _FileTokenBucket(path, rate=1.0, capacity=2.0)
+    assert one.reserve() == 0.0
+    assert other.reserve() == 0.0
+    assert one.reserve() == pytest.approx(1.0)
+
+
+def test_registry_builds_a_blocking_file_bucket_when_a_dir_is_set(shared_dir):
+    limiter = get_rate_limiter("int_shared", {"requestsPerSecond": 5})
+    assert isinstance(limiter, _FileTokenBucket) and limiter.blocking
+    limiter.reserve()
+    assert len(list(shared_dir.iterdir())) == 1
+
+
+def test_async_callers_take_the_file_lock_off_the_event_loop(shared_dir):
+    spec    = {"requestsPerSecond": 5}
+    threads = []
+
+    def reserve(integration_id, rate_limit_spec):
+        threads.append(threading.get_ident())
+        return _reserve_capacity(integration_id, rate_limit_spec)
+
+    async def run():
+        await _rate_limit_async(reserve, "int_async", spec)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert threads and threads[0] != loop_thread
+
+
+def test_in_memory_buckets_stay_on_the_event_loop(monkeypatch):
+    monkeypatch.delenv("WEAVEX_RATE_LIMIT_DIR", raising=False)
+    threads = []
+
+    async def run():
+        await _rate_limit_async(lambda *args: threads.append(threading.get_ident()), "int_local", {"requestsPerSecond": 5})
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert threads == [loop_thread]
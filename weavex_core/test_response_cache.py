@@ -0,0 +1,155 @@
+import asyncio
+import gzip
+import threading
+
+import httpx
+
+from weavex_core.execute_api import _add_validators, _through_cache, _response_cache_async
+from weavex_core import response_cache
+from weavex_core.response_cache import ResponseCache
+
+
+URL = "https://api.vendor.test/v1/lists"
+
+
+def _key(integration_id: str = "int_1", url: str = URL, headers: dict = None) -> tuple:
+    return ResponseCache.key(integration_id, "get", url, headers or {})
+
+
+def _ok(content: bytes = b'{"items": [1, 2]}', **headers) -> httpx.Response:
+    return httpx.Response(200, headers={"content-type": "application/json", **headers}, content=content)
+
+
+def test_key_ignores_header_case_and_order_but_not_values():
+    assert _key(headers={"Accept": "a", "X-Tenant": "1"}) == _key(headers={"x-tenant": "1", "accept": "a"})
+    assert _key(headers={"X-Tenant": "1"}) != _key(headers={"X-Tenant": "2"})
+    assert _key("int_1") != _key("int_2")
+
+
+def test_a_200_with_validators_is_stored_and_revalidated():
+    cache = ResponseCache()
+    cache.store(_key(), _ok(etag='"v1"', **{"last-modified": "Wed, 01 May 2024 00:00:00 GMT"}))
+
+    entry = cache.get(_key())
+    assert entry.validators() == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 May 2024 00:00:00 GMT"}
+
+
+def test_responses_that_must_not_be_cached_are_dropped():
+    cache = ResponseCache()
+    cache.store(_key(), _ok(etag='"v1"'))
+    cache.store(_key(), _ok())                                  # no validator: the old entry goes too
+    assert cache.get(_key()) is None
+
+    cache.store(_key(), _ok(etag='"v2"', **{"cache-control": "private, no-store"}))
+    assert cache.get(_key()) is None
+    assert cache.stats().stores == 1
+
+
+def test_304_rebuilds_the_stored_response_with_fresh_headers():
+    cache = ResponseCache()
+    cache.store(_key(), _ok(gzip.compress(b'{"items": [1, 2]}'), etag='"v1"', **{"x-request-id": "a", "content-encoding": "gzip"}))
+
+    rebuilt = cache.get(_key()).to_response(httpx.Response(304, headers={"x-request-id": "b", "content-length": "0"}))
+    assert rebuilt.status_code == 200
+    assert rebuilt.json() == {"items": [1, 2]}
+    assert rebuilt.headers["x-request-id"] == "b"
+    assert "content-encoding" not in rebuilt.headers
+
+
+def test_memory_tier_evicts_least_recently_used_by_bytes():
+    cache = ResponseCache(max_bytes=100)
+    for name in ("a", "b", "c"):
+        cache.store(_key(url=f"{URL}/{name}"), _ok(b"x" * 40, etag=f'"{name}"'))
+
+    stats = cache.stats()
+    assert stats.entries == 2 and stats.bytes == 80 and stats.evictions == 1
+    assert cache.get(_key(url=f"{URL}/a")) is None
+
+    cache.store(_key(url=f"{URL}/big"), _ok(b"x" * 200, etag='"big"'))
+    assert cache.get(_key(url=f"{URL}/big")) is None
+
+
+def test_disk_tier_survives_a_new_process_cache(tmp_path):
+    ResponseCache(disk_dir=str(tmp_path)).store(_key(), _ok(etag='"v1"'))
+
+    fresh = ResponseCache(disk_dir=str(tmp_path))
+    entry = fresh.get(_key())
+    assert entry.etag == '"v1"' and entry.content == b'{"items": [1, 2]}'
+    assert fresh.stats().disk_hits == 1
+
+
+def test_a_corrupt_disk_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(disk_dir=str(tmp_path))
+    cache.store(_key(), _ok(etag='"v1"'))
+    with open(cache._disk_path(_key()), "wb") as f:
+        f.write(b'{"status_code": 200, "unexpected": 1}\n{"items": []}')
+
+    fresh = ResponseCache(disk_dir=str(tmp_path))
+    assert fresh.get(_key()) is None
+    assert fresh.stats().misses == 1
+
+
+def test_evict_drops_one_integration_everywhere(tmp_path):
+    cache = ResponseCache(disk_dir=str(tmp_path))
+    cache.store(_key("int_1"), _ok(etag='"a"'))
+    cache.store(_key("int_2"), _ok(etag='"b"'))
+
+    cache.evict("int_1")
+    assert cache.get(_key("int_1")) is None
+    assert ResponseCache(disk_dir=str(tmp_path)).get(_key("int_1")) is None
+    assert cache.get(_key("int_2")) is not None
+
+
+def test_execute_api_helpers_send_validators_and_answer_304_from_the_cache():
+    cache = ResponseCache()
+    key   = _key()
+    cache.store(key, _ok(etag='"v1"'))
+
+    request = {"headers": {"Accept": "application/json"}}
+    cached  = _add_validators(cache, key, request)
+    assert request["headers"]["If-None-Match"] == '"v1"'
+
+    response = _through_cache(cache, key, cached, httpx.Response(304))
+    assert response.status_code == 200 and response.json() == {"items": [1, 2]}
+    assert cache.stats().hits == 1
+
+
+def test_caller_validators_win():
+    cache = ResponseCache()
+    cache.store(_key(), _ok(etag='"v1"'))
+    request = {"headers": {"if-none-match": '"mine"'}}
+    _add_validators(cache, _key(), request)
+    assert request["headers"] == {"if-none-match": '"mine"'}
+
+
+def test_async_callers_touch_the_disk_tier_off_the_event_loop(tmp_path):
+    cache   = ResponseCache(disk_dir=str(tmp_path))
+    threads = []
+    read    = cache._read_disk
+    cache._read_disk = lambda key: threads.append(threading.get_ident()) or read(key)
+
+    async def run():
+        await _response_cache_async(_add_validators, cache, _key(), {"headers": {}})
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert threads and threads[0] != loop_thread
+
+
+def test_a_memory_only_cache_stays_on_the_event_loop():
+    cache   = ResponseCache()
+    threads = []
+
+    async def run():
+        await _response_cache_async(lambda *args: threads.append(threading.get_ident()), cache, _key())
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert threads == [loop_thread]
+
+
+def test_malformed_env_sizes_fall_back_to_the_defaults(monkeypatch):
+    monkeypatch.setenv("WEAVEX_RESPONSE_CACHE_MAX_BYTES", "64MB")
+    monkeypatch.setenv("WEAVEX_RESPONSE_CACHE_DISK_MAX_BYTES", "1024")
+    cache = response_cache._from_env()
+    assert (cache._max_bytes, cache._max_disk_bytes) == (64 * 1024 * 1024, 1024)
@@ -0,0 +1,134 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from weavex_core import retry_budget
+from weavex_core.benchmarks.mock_vendor import VendorProfile
+from weavex_core.execute_api import ApiResponse, RetryConfig, _RetryPlan, execute_api
+from weavex_core.retry_budget import RetryBudget, configure_retry_budget, get_retry_budget_stats
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake time.monotonic() for retry_budget; advance with clock.now += seconds."""
+    fake = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(retry_budget, "time", SimpleNamespace(monotonic=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    """Installs a fresh process budget: budget(ratio=..., ...) → RetryBudget."""
+    def install(**kwargs):
+        configure_retry_budget(**kwargs)
+        return retry_budget.get_retry_budget()
+
+    monkeypatch.setattr(retry_budget, "_budget", retry_budget._budget)
+    return install
+
+
+def test_starts_full_and_refuses_once_spent(clock):
+    budget = RetryBudget(ratio=0.1, min_per_second=0, max_balance=3)
+    assert [budget.withdraw() for _ in range(4)] == [True, True, True, False]
+    assert budget.stats().rejected == 1
+
+
+def test_each_call_deposits_ratio_of_a_retry(clock):
+    budget = RetryBudget(ratio=0.25, min_per_second=0, max_balance=3)
+    for _ in range(3):
+        budget.withdraw()
+    for _ in range(4):
+        budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    assert budget.stats().requests == 4
+
+
+def test_min_per_second_refills_over_time(clock):
+    budget = RetryBudget(ratio=0.1, min_per_second=2, max_balance=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+    clock.now += 0.5
+    assert budget.withdraw()
+    clock.now += 60
+    assert budget.withdraw() and budget.withdraw() and not budget.withdraw()
+
+
+def test_ratio_none_never_refuses(clock):
+    budget = RetryBudget(ratio=None, max_balance=0)
+    assert all(budget.withdraw() for _ in range(100))
+    assert budget.stats().retries == 100
+
+
+def test_malformed_env_settings_fall_back_to_the_defaults(monkeypatch):
+    monkeypatch.setenv("WEAVEX_RETRY_BUDGET_RATIO", "ten percent")
+    monkeypatch.setenv("WEAVEX_RETRY_BUDGET_MIN_PER_SECOND", "")
+    monkeypatch.setenv("WEAVEX_RETRY_BUDGET_MAX", "20.5")
+    budget = retry_budget._from_env()
+    assert (budget.ratio, budget.min_per_second, budget.max_balance) == (0.1, 1.0, 20.5)
+
+    monkeypatch.setenv("WEAVEX_RETRY_BUDGET_RATIO", "Off")
+    assert retry_budget._from_env().ratio is None
+
+
+def test_retry_plan_stops_when_the_budget_is_spent(budget):
+    budget(ratio=0.1, min_per_second=0, max_balance=1)
+    plan = _RetryPlan({}, RetryConfig(backoff_seconds=0.01, max_retries=5))
+    busy = ApiResponse(503, {}, {})
+    assert plan.wait_for(busy, 0) is not None
+    assert plan.wait_for(busy, 1) is None
+
+
+def test_retry_plan_respects_the_context_deadline(budget):
+    budget(ratio=None)
+    plan = _RetryPlan({"deadline": time.time() + 0.05}, RetryConfig(backoff_seconds=1.0, max_retries=5))
+    assert plan.attempt_timeout(30) <= 0.05
+    assert plan.backoff(1) is None
+
+
+def test_retry_plan_never_retries_a_body_that_cannot_be_replayed(budget):
+    budget(ratio=None)
+    plan = _RetryPlan({}, RetryConfig(backoff_seconds=0.01, max_retries=5), replayable=False)
+    assert plan.backoff(1) is None
+    assert plan.wait_for(ApiResponse(503, {}, {}), 0) is None
+
+
+def test_exhausted_budget_returns_the_failure_instead_of_retrying(mock_vendor, budget):
+    budget(ratio=0.1, min_per_second=0, max_balance=2)
+    env = mock_vendor(VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, burst_every_seconds=60, burst_seconds=60))
+    fast = RetryConfig(backoff_seconds=0.01, max_backoff_seconds=0.01, max_retries=5)
+
+    statuses = [execute_api({}, env.integration_id, "GET", f"/v1/employees?n={n}", retry=fast).status_code for n in range(3)]
+
+    assert statuses == [503, 503, 503]
+    stats = get_retry_budget_stats()
+    assert stats.retries == 2
+    assert stats.rejected == 3
+    assert env.vendor.stats()["requests"] == 5
+
+
+def test_a_rate_limit_wait_past_the_deadline_fails_fast(mock_vendor, budget, execute_api_module):
+    budget(ratio=None)
+    env         = mock_vendor()
+    credentials = execute_api_module._get_credentials(env.integration_id)
+    execute_api_module._cache.set(env.integration_id, {**credentials, "__rateLimitSpec": {"requestsPerSecond": 1, "burst": 1}})
+    assert execute_api({}, env.integration_id, "GET", "/v1/employees").status_code == 200
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="deadline exceeded"):
+        execute_api({"deadline": time.time() + 0.3}, env.integration_id, "GET", "/v1/employees?n=2")
+    assert time.monotonic() - started < 0.2
+    assert env.vendor.stats()["requests"] == 1
+
+
+def test_the_attempt_timeout_counts_the_rate_limit_wait(mock_vendor, budget, execute_api_module, monkeypatch):
+    budget(ratio=None)
+    env      = mock_vendor()
+    timeouts = []
+    execute_once = execute_api_module._execute_once
+    monkeypatch.setattr(execute_api_module, "_reserve_capacity", lambda *args: 0.2)
+    monkeypatch.setattr(execute_api_module, "_execute_once", lambda **kw: timeouts.append(kw["timeout"]) or execute_once(**kw))
+
+    execute_api({"deadline": time.time() + 1.0}, env.integration_id, "GET", "/v1/employees")
+    assert timeouts and timeouts[0] <= 0.8 + 0.05
@@ -0,0 +1,144 @@
+import time
+import asyncio
+import threading
+
+import pytest
+
+from weavex_core.singleflight import SingleFlight, AsyncSingleFlight
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_execution():
+    flight  = SingleFlight()
+    release = threading.Event()
+    calls   = []
+
+    def fetch(value):
+        calls.append(value)
+        release.wait(5)
+        return value * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("k", fetch, 21))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    _wait_until(lambda: flight.shared_count == 4)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [21]
+    assert sorted(results, key=lambda r: r[1]) == [(42, False)] + [(42, True)] * 4
+    assert not flight.in_flight("k")
+
+
+def test_exception_reaches_every_caller_and_next_call_starts_fresh():
+    flight  = SingleFlight()
+    release = threading.Event()
+    errors  = []
+
+    def fail():
+        release.wait(5)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("k", fail)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    _wait_until(lambda: flight.shared_count == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 3
+    assert flight.do("k", lambda: "ok") == ("ok", False)
+
+
+def test_async_callers_share_one_execution():
+    async def main():
+        flight = AsyncSingleFlight()
+        calls  = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "body"
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(4)))
+        return calls, results
+
+    calls, results = asyncio.run(main())
+    assert calls == 1
+    assert results == [("body", False)] + [("body", True)] * 3
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    async def main():
+        flight  = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "body"
+
+        leader   = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == ("body", True)
+
+
+def test_cancelled_follower_does_not_cancel_the_shared_call():
+    async def main():
+        flight  = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "body"
+
+        leader   = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower.cancel()
+        release.set()
+        return await leader
+
+    assert asyncio.run(main()) == ("body", False)
+
+
+def test_async_exception_is_shared_and_entry_cleared():
+    async def main():
+        flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight._calls == {}
+
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from weavex_core.benchmarks.mock_vendor import VendorProfile
+from weavex_core.execute_api import execute_api, RetryConfig
+
+
+FAST_RETRY = RetryConfig(backoff_seconds=0.01, max_backoff_seconds=0.05, max_retries=2)
+
+
+def _expiring_in(seconds: float) -> dict:
+    return {"authType": "oauth2", "expiresAt": int((time.time() + seconds) * 1000)}
+
+
+def test_token_expiring_honours_the_margin(monkeypatch, execute_api_module):
+    monkeypatch.setattr(execute_api_module, "TOKEN_REFRESH_MARGIN_SECONDS", 60)
+    assert execute_api_module._token_expiring(_expiring_in(30))
+    assert not execute_api_module._token_expiring(_expiring_in(600))
+    assert not execute_api_module._token_expiring({"authType": "oauth2"})
+    assert not execute_api_module._token_expiring({**_expiring_in(0), "authType": "apikey"})
+    assert not execute_api_module._token_expiring({**_expiring_in(0), "expiresAt": "soon"})
+
+
+def test_concurrent_401s_share_one_refresh(mock_vendor):
+    env = mock_vendor(VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, token_ttl_seconds=0.2))
+    assert execute_api({}, env.integration_id, "GET", "/v1/employees").status_code == 200
+    time.sleep(0.25)
+
+    barrier  = threading.Barrier(8)
+    statuses = []
+
+    def call():
+        barrier.wait()
+        statuses.append(execute_api({}, env.integration_id, "GET", "/v1/employees", retry=FAST_RETRY).status_code)
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [200] * 8
+    assert env.vendor.stats()["refreshes"] == 1
+
+
+def test_a_late_caller_reuses_the_token_another_refresh_installed(mock_vendor, execute_api_module):
+    env   = mock_vendor()
+    stale = execute_api_module._get_credentials(env.integration_id)
+
+    first  = execute_api_module._refresh_token_once(env.integration_id, stale)
+    second = execute_api_module._refresh_token_once(env.integration_id, stale)
+
+    assert first["accessToken"] == second["accessToken"] != stale["accessToken"]
+    assert env.vendor.stats()["refreshes"] == 1
+
+
+def test_a_token_near_expiry_is_refreshed_before_the_call(mock_vendor, execute_api_module):
+    env         = mock_vendor()
+    credentials = {**execute_api_module._get_credentials(env.integration_id), **_expiring_in(5)}
+    execute_api_module._cache.set(env.integration_id, credentials)
+
+    assert execute_api({}, env.integration_id, "GET", "/v1/employees").status_code == 200
+    assert env.vendor.stats()["refreshes"] == 1
+    assert env.vendor.stats()["statuses"].get(401) is None
+
+
+def test_a_failed_proactive_refresh_falls_back_to_the_current_token(mock_vendor, execute_api_module):
+    env         = mock_vendor()
+    credentials = {**execute_api_module._get_credentials(env.integration_id), **_expiring_in(5), "tokenUrl": None}
+    execute_api_module._cache.set(env.integration_id, credentials)
+
+    assert execute_api_module._ensure_fresh_token(env.integration_id, credentials) is credentials
+    with pytest.raises(RuntimeError, match="Cannot refresh"):
+        execute_api_module._refresh_token_once(env.integration_id, credentials)
+
+
+
+def test_a_malformed_margin_falls_back_to_the_default(import_constant):
+    assert import_constant("weavex_core.execute_api", "TOKEN_REFRESH_MARGIN_SECONDS", WEAVEX_TOKEN_REFRESH_MARGIN_SECONDS="1m") == 60
+    assert import_constant("weavex_core.execute_api", "TOKEN_REFRESH_MARGIN_SECONDS", WEAVEX_TOKEN_REFRESH_MARGIN_SECONDS="90") == 90
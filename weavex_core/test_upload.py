@@ -0,0 +1,89 @@
+import asyncio
+import io
+import threading
+
+import pytest
+
+from weavex_core.benchmarks.mock_vendor import VendorProfile
+from weavex_core.execute_api import execute_api, execute_api_async, RetryConfig
+from weavex_core.upload import Upload
+
+
+FAST_RETRY = RetryConfig(backoff_seconds=0.01, max_backoff_seconds=0.05, max_retries=2)
+
+
+class _ThreadRecordingFile(io.BytesIO):
+    """A seekable file part that records which threads read it."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.readers = set()
+
+    def read(self, size=-1):
+        self.readers.add(threading.get_ident())
+        return super().read(size)
+
+
+def _rows():
+    yield b"id,name\n"
+    yield b"1,Ada\n"
+
+
+def test_401_with_a_streamed_body_raises_like_any_final_401(mock_vendor):
+    env = mock_vendor(VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, token_ttl_seconds=0))
+
+    with pytest.raises(RuntimeError, match="Authentication failed"):
+        execute_api({}, env.integration_id, "POST", "/v1/import", body=_rows(), retry=FAST_RETRY)
+
+    assert env.vendor.stats()["requests"] == 1
+    assert env.vendor.stats()["refreshes"] == 0
+
+
+def test_401_with_a_replayable_body_still_refreshes(mock_vendor):
+    env = mock_vendor(VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, token_ttl_seconds=0))
+
+    with pytest.raises(RuntimeError, match="Authentication failed"):
+        execute_api({}, env.integration_id, "POST", "/v1/import", body=lambda: _rows(), retry=FAST_RETRY)
+
+    assert env.vendor.stats()["requests"] == 2
+    assert env.vendor.stats()["refreshes"] == 1
+
+
+def test_async_401_with_a_streamed_body_raises(mock_vendor):
+    env = mock_vendor(VendorProfile(latency_ms=0, jitter_ms=0, tail_rate=0, token_ttl_seconds=0))
+
+    with pytest.raises(RuntimeError, match="Authentication failed"):
+        asyncio.run(execute_api_async({}, env.integration_id, "POST", "/v1/import", body=_rows(), retry=FAST_RETRY))
+
+
+def test_async_multipart_reads_file_parts_off_the_event_loop(mock_vendor):
+    env  = mock_vendor()
+    part = _ThreadRecordingFile(b"x" * 200_000)
+
+    async def upload():
+        response = await execute_api_async(
+            {}, env.integration_id, "POST", "/v1/documents",
+            body={"title": "contract"}, files={"file": ("contract.pdf", part, "application/pdf")},
+        )
+        return response, threading.get_ident()
+
+    response, loop_thread = asyncio.run(upload())
+
+    assert response.status_code == 201
+    assert response.body["received"] > 200_000
+    assert part.readers and loop_thread not in part.readers
+
+
+def test_encoded_form_matches_the_httpx_encoding():
+    with Upload({"title": "t"}, {"file": ("a.txt", io.BytesIO(b"hello"), "text/plain")}, asynchronous=True) as upload:
+        content, headers = upload.encoded_form()
+
+        async def collect():
+            return b"".join([chunk async for chunk in content])
+
+        body = asyncio.run(collect())
+
+    assert headers["content-type"].startswith("multipart/form-data; boundary=")
+    assert int(headers["content-length"]) == len(body)
+    assert b'name="title"\r\n\r\nt\r\n' in body
+    assert b"hello" in body
@@ -0,0 +1,185 @@
+# weavex_core/upload.py
+#
+# Streaming request bodies for execute_api / execute_api_async.
+# Anything that is not already in memory is sent in 64 KB chunks instead of
+# being read into RAM first:
+#
+#   body = open("export.csv", "rb")          file object — Content-Length from the file size
+#   body = Path("/tmp/export.csv")           opened per attempt, closed afterwards
+#   body = generate_csv_rows()               sync iterator of bytes — chunked transfer encoding
+#   body = aiter_rows()                      async iterator of bytes (execute_api_async only)
+#   body = lambda: generate_csv_rows()       factory, called again for every attempt
+#
+#   files = {"file": ("contract.pdf", open("contract.pdf", "rb"), "application/pdf")}
+#                                            multipart/form-data; body (a dict) becomes the
+#                                            form fields, file parts stream from disk
+#                                            (in a worker thread on execute_api_async)
+#
+# Retries need the body again. Paths and factories are re-opened, seekable files
+# are rewound to where they started; a plain iterator or a pipe can only be sent
+# once, so a call with one is not retried — the first response or error is final.
+#
+# Usage (internal):
+#   if is_upload(body, files):
+#       with Upload(body, files) as upload:
+#           ...
+#           content, length = upload.content()      # once per attempt
+
+import os
+import asyncio
+from collections.abc import AsyncIterable, Iterator
+from typing import Any, Optional
+
+import httpx
+
+
+CHUNK_SIZE = 65536
+
+_FORM_HEADERS = ("content-type", "content-length")
+
+
+def is_upload(body: Any, files: Any) -> bool:
+    """True for bodies execute_api must stream rather than serialise."""
+    return bool(files) or _is_stream(body)
+
+
+def _is_stream(body: Any) -> bool:
+    return (
+        hasattr(body, "read")
+        or isinstance(body, (os.PathLike, Iterator, AsyncIterable))
+        or callable(body)
+    )
+
+
+class Upload:
+    def __init__(self, body: Any, files: Any = None, asynchronous: bool = False):
+        self.body         = body
+        self.files        = files
+        self.asynchronous = asynchronous
+        self._attempts    = 0
+        self._opened      = []      # handles opened for the current attempt
+        self._starts      = {}      # id(file object) → offset to rewind to
+        sources           = [body] + [_part_source(part) for _, part in _file_items(files)]
+        self.replayable   = all(self._remember(source) for source in sources)
+
+    def __enter__(self) -> "Upload":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for handle in self._opened:
+            handle.close()
+        self._opened = []
+
+    # ── Per attempt ───────────────────────────────────────────────────────────
+
+    def content(self) -> tuple[Any, Optional[int]]:
+        """The body for the next attempt and its length, when known."""
+        self._next_attempt()
+        content = self._open(self.body)
+        # httpx would take the whole file size, even for a file positioned mid-way
+        length  = _remaining_length(content) if hasattr(content, "read") else None
+        if self.asynchronous:
+            return _to_async(content), length
+        if isinstance(content, AsyncIterable) and not isinstance(content, Iterator):
+            raise TypeError("async iterator bodies need execute_api_async")
+        return content, length
+
+    def form(self) -> tuple[Optional[dict], list]:
+        """(data, files) for a multipart attempt."""
+        self._next_attempt()
+        parts = []
+        for name, part in _file_items(self.files):
+            if isinstance(part, tuple):
+                part = (part[0], self._open(part[1])) + part[2:]
+            elif isinstance(part, os.PathLike):
+                part = (os.path.basename(part), self._open(part))
+            else:
+                part = self._open(part)
+            parts.append((name, part))
+        return self.body, parts
+
+    def encoded_form(self) -> tuple[Any, dict]:
+        """
+        Multipart body for execute_api_async as (content, headers). httpx reads
+        file parts synchronously even on AsyncClient, so the encoded stream is
+        pulled chunk by chunk in a worker thread instead.
+        """
+        data, files = self.form()
+        encoded     = httpx.Request("POST", "http://multipart.invalid", data=data, files=files)
+        headers     = {k: v for k, v in encoded.headers.items() if k.lower() in _FORM_HEADERS}
+        return _to_async(iter(encoded.stream)), headers
+
+    def _next_attempt(self) -> None:
+        self.close()
+        self._attempts += 1
+        if self._attempts > 1 and not self.replayable:
+            raise RuntimeError("streaming request body was already sent and cannot be replayed")
+
+    def _open(self, source: Any) -> Any:
+        if isinstance(source, os.PathLike):
+            handle = open(source, "rb")
+            self._opened.append(handle)
+            return handle
+        if callable(source) and not hasattr(source, "read"):
+            content = source()
+            if hasattr(content, "close"):
+                self._opened.append(content)
+            return content
+        if id(source) in self._starts:
+            source.seek(self._starts[id(source)])
+        return source
+
+    def _remember(self, source: Any) -> bool:
+        """Records where a file starts; False if the source cannot be read twice."""
+        if source is None or isinstance(source, (bytes, bytearray, str, dict, os.PathLike)):
+            return True
+        if hasattr(source, "read"):
+            try:
+                if source.seekable():
+                    self._starts[id(source)] = source.tell()
+                    return True
+            except (AttributeError, OSError):
+                pass
+            return False
+        if callable(source):
+            return True
+        return not isinstance(source, (Iterator, AsyncIterable))
+
+
+def _file_items(files: Any) -> list:
+    if not files:
+        return []
+    return list(files.items()) if isinstance(files, dict) else list(files)
+
+
+def _part_source(part: Any) -> Any:
+    return part[1] if isinstance(part, tuple) else part
+
+
+def _remaining_length(handle: Any) -> Optional[int]:
+    try:
+        return os.fstat(handle.fileno()).st_size - handle.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+async def _to_async(content: Any):
+    """Adapts a sync source for httpx.AsyncClient; blocking reads run in a worker thread."""
+    if isinstance(content, (bytes, bytearray)):
+        yield bytes(content)
+    elif isinstance(content, str):
+        yield content.encode("utf-8")
+    elif hasattr(content, "read"):
+        while chunk := await asyncio.to_thread(content.read, CHUNK_SIZE):
+            yield chunk
+    elif isinstance(content, AsyncIterable):
+        async for chunk in content:
+            yield chunk
+    else:
+        iterator = iter(content)
+        sentinel = object()
+        while (chunk := await asyncio.to_thread(next, iterator, sentinel)) is not sentinel:
+            yield chunk
@@ -3,6 +3,8 @@ import logging
 import requests
 from typing import Optional
 
+from .http_pool import get_control_plane_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,7 +37,8 @@ class WeavexAPIService:
         this isn't application-level blocking — it's most consistent with
         transient network flakiness between Cloud Run services (e.g. a dropped
         packet or brief routing hiccup at the GFE layer). A retry with a fresh
-        connection has reliably resolved it in practice.
+        connection has reliably resolved it in practice. The shared control-plane
+        pool discards a connection that timed out, so the retry never reuses it.
 
         Using a shorter read timeout (20s) with more attempts (3) instead of a
         single long timeout (60s) with fewer attempts caps the worst case at
@@ -49,7 +52,7 @@ class WeavexAPIService:
             t0 = time.time()
             print(f"[{self._execution_id}] SENDING POST {url} at {t0} | attempt={attempt}/{max_attempts}", flush=True)
             try:
-                resp = requests.post(url, headers=self._headers, json=payload, timeout=(5, 20))
+                resp = get_control_plane_session().post(url, headers=self._headers, json=payload, timeout=(5, 20))
                 t1 = time.time()
                 print(
                     f"[{self._execution_id}] RECEIVED response from {url} | status={resp.status_code} "
@@ -74,6 +77,8 @@ class WeavexAPIService:
             except requests.exceptions.RequestException as e:
                 # Non-timeout errors (connection reset, DNS failure, etc.) are not retried
                 # here — they usually indicate a real problem rather than transient flakiness.
+                # A pooled connection the server closed while idle never gets this far:
+                # the control-plane adapter replays that once on a fresh connection.
                 t1 = time.time()
                 print(
                     f"[{self._execution_id}] ERROR calling {url} | elapsed={int((t1 - t0) * 1000)}ms | error={e}",